@@ -0,0 +1,96 @@
+"""Benchmark: size, write and read speed of the binary record format,
+compared with the text formats.
+
+Every format writes the same operations (with two custom props) through a
+file sink, and is read back into `OperationRecord`s: binary files with
+`BinaryOperationReader`, CSV files with the `csv` module. The binary
+format also stores the start time (ns), process and thread of every
+operation, which the default CSV columns do not.
+
+Run from the repository root:
+    python -m benchmarks.bench_binary
+"""
+import csv
+import os
+import tempfile
+import time
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter, VerboseOperationFormatter
+from oplog.id_generators import CounterIdGenerator
+from oplog.readers import BinaryOperationReader, OperationRecord
+from oplog.sinks import BinaryFileOperationSink, CsvFileOperationSink, FileOperationSink
+
+NUMBER = 100_000
+
+
+def write_ops(sink) -> float:
+    Operation.config(sinks=[sink], id_generator=CounterIdGenerator())
+    start = time.perf_counter()
+    for i in range(NUMBER):
+        with Operation(name=f"bench_op_{i % 10}") as op:
+            op.add("user", f"user_{i % 100}")
+            op.add("items", i % 7)
+    sink.close()
+    elapsed = time.perf_counter() - start
+    Operation.factory_reset()
+    return NUMBER / elapsed
+
+
+def read_rate(read) -> float:
+    start = time.perf_counter()
+    count = sum(1 for _ in read())
+    return count / (time.perf_counter() - start)
+
+
+def read_csv(filename: str):
+    with open(filename, newline="") as f:
+        rows = csv.reader(f)
+        # the columns are found by the header, the default ones change over versions
+        header = next(rows)
+        (duration_ms, name, id_, correlation_id, parent_id, depth, result, exception_type,
+         user, items) = [header.index(column) for column in (
+            "duration_ms", "name", "id", "correlation_id", "parent_id", "depth", "result",
+            "exception_type", "custom_props.user", "custom_props.items")]
+        for row in rows:
+            yield OperationRecord(
+                name=row[name],
+                duration_ns=int(row[duration_ms]) * 1_000_000,
+                id=row[id_],
+                correlation_id=row[correlation_id],
+                parent_id=row[parent_id] or None,
+                depth=int(row[depth]),
+                result=row[result],
+                exception_type=row[exception_type] or None,
+                custom_props={"user": row[user], "items": int(row[items])},
+            )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        binary_file = os.path.join(tmp_dir, "ops.opb")
+        csv_file = os.path.join(tmp_dir, "ops.csv")
+        verbose_file = os.path.join(tmp_dir, "ops.log")
+        formatter = CsvOperationFormatter(custom_props=("user", "items"))
+
+        rows = [
+            ("binary", binary_file,
+             write_ops(BinaryFileOperationSink(binary_file)),
+             read_rate(lambda: BinaryOperationReader(binary_file))),
+            ("csv", csv_file,
+             write_ops(CsvFileOperationSink(csv_file, formatter=formatter)),
+             read_rate(lambda: read_csv(csv_file))),
+            ("verbose", verbose_file,
+             write_ops(FileOperationSink(VerboseOperationFormatter(), verbose_file)),
+             None),
+        ]
+
+        print(f"{'format':<10} {'bytes/op':>9} {'write ops/s':>12} {'read ops/s':>12}")
+        for name, filename, write, read in rows:
+            size = os.path.getsize(filename) / NUMBER
+            read_str = f"{read:>12,.0f}" if read is not None else f"{'-':>12}"
+            print(f"{name:<10} {size:>9.1f} {write:>12,.0f} {read_str}")
+
+
+if __name__ == "__main__":
+    main()
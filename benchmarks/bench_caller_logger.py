@@ -0,0 +1,48 @@
+"""Micro-benchmark: resolving the caller logger of an operation.
+
+Compares the previous `inspect.stack()` based resolution with the
+cached caller-frame resolution used by `Operation._get_caller_logger`.
+
+Run from the repository root:
+    python -m benchmarks.bench_caller_logger
+"""
+import inspect
+import logging
+import timeit
+
+from oplog import Operation
+
+NUMBER = 20_000
+
+
+def legacy_get_caller_logger() -> logging.Logger:
+    logger = None
+    stack = inspect.stack()
+    if len(stack) >= 3:
+        caller_frame = stack[2]
+        caller_module = inspect.getmodule(caller_frame[0])
+        if caller_module is not None:
+            logger = logging.getLogger(caller_module.__name__)
+    if logger is None:
+        logger = logging.getLogger()
+    return logger
+
+
+def legacy_init():
+    return legacy_get_caller_logger()
+
+
+def cached_init():
+    return Operation._get_caller_logger()
+
+
+def main() -> None:
+    legacy = timeit.timeit(legacy_init, number=NUMBER)
+    cached = timeit.timeit(cached_init, number=NUMBER)
+    print(f"{'inspect.stack()':<24} {legacy / NUMBER * 1e6:8.2f} us/op")
+    print(f"{'cached caller frame':<24} {cached / NUMBER * 1e6:8.2f} us/op")
+    print(f"{'speedup':<24} {legacy / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
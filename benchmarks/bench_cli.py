@@ -0,0 +1,75 @@
+"""Benchmark: `oplog stats` throughput per file format, and with many jobs.
+
+The same operations are written as CSV, JSON lines and binary files, and
+summarized (approximate percentiles) with one process, and with a process
+per CPU.
+
+Run from the repository root:
+    python -m benchmarks.bench_cli
+"""
+import os
+import tempfile
+import time
+
+from oplog import binary
+from oplog.binary import BinaryOperationEncoder
+from oplog.cli import RecordFilter, stats
+from oplog.readers import OperationRecord, to_csv, to_json_lines
+
+NUMBER = 200_000
+START_NS = 1_693_736_701_000_000_000
+
+
+def records():
+    for i in range(NUMBER):
+        yield OperationRecord(
+            name=f"bench_op_{i % 10}",
+            start_time_ns=START_NS + i * 1_000_000,
+            duration_ns=(i % 1000) * 10_000,
+            result="Failure" if i % 50 == 0 else "Success",
+            id=str(i),
+            correlation_id=str(i // 10),
+            custom_props={"user": f"user_{i % 100}"},
+        )
+
+
+def write_binary(filename: str) -> None:
+    # records have the operation attributes the encoder reads
+    encoder = BinaryOperationEncoder()
+    out = bytearray(binary.MAGIC)
+    for record in records():
+        encoder.encode(out, record, {})
+    with open(filename, "wb") as f:
+        f.write(out)
+
+
+def main() -> None:
+    jobs = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = {
+            "csv": os.path.join(tmp_dir, "ops.csv"),
+            "jsonl": os.path.join(tmp_dir, "ops.jsonl"),
+            "binary": os.path.join(tmp_dir, "ops.opb"),
+        }
+        with open(files["csv"], "w", encoding="utf-8", newline="") as f:
+            to_csv(records(), f)
+        with open(files["jsonl"], "w", encoding="utf-8") as f:
+            to_json_lines(records(), f)
+        write_binary(files["binary"])
+
+        print(f"{NUMBER:,} operations, {jobs} CPUs")
+        print(f"{'format':<8} {'MB':>7} {'1 job ops/s':>13} {f'{jobs} jobs ops/s':>15}")
+        for format, filename in files.items():
+            rates = []
+            for job_count in (1, jobs):
+                start = time.perf_counter()
+                summaries = stats([filename], RecordFilter(), jobs=job_count, min_chunk_size=1 << 20)
+                elapsed = time.perf_counter() - start
+                assert sum(summary.stats.count for summary in summaries.values()) == NUMBER
+                rates.append(NUMBER / elapsed)
+            size_mb = os.path.getsize(filename) / (1 << 20)
+            print(f"{format:<8} {size_mb:>7.1f} {rates[0]:>13,.0f} {rates[1]:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
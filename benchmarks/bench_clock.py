@@ -0,0 +1,48 @@
+"""Micro-benchmark: per-operation clock and timestamp formatting cost.
+
+Compares the previous timing (`datetime.utcnow()` + `strftime` on enter
+and exit, plus the performance counter) with the anchored `oplog.clock`
+(performance counter only, wall-clock derived from an anchor, formatting
+cached per second).
+
+Run from the repository root:
+    python -m benchmarks.bench_clock
+"""
+import datetime
+import time
+import timeit
+
+from oplog.clock import TIME_FORMAT, clock
+
+NUMBER = 100_000
+
+
+def legacy_timing() -> None:
+    start_time_utc = datetime.datetime.utcnow()
+    start_time_utc.strftime(TIME_FORMAT)
+    perf_start = time.perf_counter_ns()
+    end_time_utc = datetime.datetime.utcnow()
+    end_time_utc.strftime(TIME_FORMAT)
+    time.perf_counter_ns() - perf_start
+
+
+def anchored_timing() -> None:
+    perf_start = time.perf_counter_ns()
+    offset_ns = clock.wall_offset_ns(perf_start)
+    perf_end = time.perf_counter_ns()
+    perf_end - perf_start
+    # formatted only when a formatter reads them
+    clock.format(perf_start + offset_ns)
+    clock.format(perf_end + offset_ns)
+
+
+def main() -> None:
+    legacy = timeit.timeit(legacy_timing, number=NUMBER)
+    anchored = timeit.timeit(anchored_timing, number=NUMBER)
+    print(f"{'utcnow + strftime':<20} {legacy / NUMBER * 1e9:8.0f} ns/op")
+    print(f"{'anchored clock':<20} {anchored / NUMBER * 1e9:8.0f} ns/op")
+    print(f"{'speedup':<20} {legacy / anchored:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
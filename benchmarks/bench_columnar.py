@@ -0,0 +1,64 @@
+"""Benchmark: writing and ingesting operation logs, CSV vs. columnar.
+
+Writes the same operations through a CSV `FileOperationSink` and a
+`ColumnarOperationSink` (with counter ids, so id generation does not
+dominate the write cost), then compares the file sizes and the time it
+takes to load the durations back (parsing every CSV row vs. loading a
+single column).
+
+Run from the repository root:
+    python -m benchmarks.bench_columnar
+"""
+import csv
+import os
+import tempfile
+import time
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter
+from oplog.id_generators import CounterIdGenerator
+from oplog.readers import ColumnarOperationReader
+from oplog.sinks import ColumnarOperationSink, FileOperationSink
+
+NUMBER = 100_000
+
+
+def write_ops(sink) -> float:
+    Operation.config(sinks=[sink], id_generator=CounterIdGenerator())
+    start = time.perf_counter()
+    for i in range(NUMBER):
+        with Operation(name=f"bench_op_{i % 10}"):
+            pass
+    sink.close()
+    elapsed = time.perf_counter() - start
+    Operation.factory_reset()
+    return NUMBER / elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_filename = os.path.join(tmp_dir, "oplogs.csv")
+        columnar_filename = os.path.join(tmp_dir, "oplogs.opc")
+
+        csv_rate = write_ops(FileOperationSink(CsvOperationFormatter(), csv_filename))
+        columnar_rate = write_ops(ColumnarOperationSink(columnar_filename))
+
+        start = time.perf_counter()
+        with open(csv_filename, newline="") as f:
+            csv_durations = [int(row[1]) for row in csv.reader(f)]
+        csv_read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columnar_durations = ColumnarOperationReader(columnar_filename).read_column("duration_ns")
+        columnar_read = time.perf_counter() - start
+        assert len(csv_durations) == len(columnar_durations) == NUMBER
+
+        print(f"{'':<10} {'write ops/s':>12} {'file bytes':>12} {'read durations (ms)':>20}")
+        print(f"{'csv':<10} {csv_rate:>12,.0f} {os.path.getsize(csv_filename):>12,} "
+              f"{csv_read * 1000:>20.1f}")
+        print(f"{'columnar':<10} {columnar_rate:>12,.0f} {os.path.getsize(columnar_filename):>12,} "
+              f"{columnar_read * 1000:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: CSV rows per second.
+
+Compares the previous `CsvOperationFormatter.format_op` (f-strings, no
+escaping) with the current formatter (precompiled schema, RFC 4180
+escaping), row by row and in batches (`format_ops`). Both write the same
+six columns (`LEGACY_DEFAULT_COLUMNS`).
+
+Run from the repository root:
+    python -m benchmarks.bench_csv
+"""
+import time
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter
+from oplog.formatters.csv_operation_formatter import LEGACY_DEFAULT_COLUMNS
+from oplog.sinks import BaseOperationSink
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+def legacy_format_op(op: Operation) -> str:
+    csv_row = [
+        f'"{op.start_time_utc_str}"',
+        f'"{str(op.duration_ms)}"',
+        f'"{op.name}"',
+        f'"{op.correlation_id}"',
+        f'"{op.result}"',
+        f'"{str(op.exception_type)}"',
+    ]
+    return ','.join(csv_row)
+
+
+def rate(func) -> float:
+    # the fastest of a few rounds, the least noisy estimate on a busy machine
+    elapsed = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return NUMBER / min(elapsed)
+
+
+def main() -> None:
+    Operation.config(sinks=[NullSink()])
+    ops = []
+    for i in range(NUMBER):
+        with Operation(name=f"bench_op_{i % 10}") as op:
+            pass
+        # ids are generated once, outside of the measurement
+        op.id
+        op.correlation_id
+        ops.append(op)
+    Operation.factory_reset()
+
+    formatter = CsvOperationFormatter(columns=LEGACY_DEFAULT_COLUMNS)
+    legacy = rate(lambda: [legacy_format_op(op) for op in ops])
+    current = rate(lambda: [formatter.format_op(op) for op in ops])
+    batched = rate(lambda: formatter.format_ops(ops))
+    print(f"{'legacy format_op':<20} {legacy:>12,.0f} rows/s")
+    print(f"{'format_op':<20} {current:>12,.0f} rows/s")
+    print(f"{'format_ops (batch)':<20} {batched:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark: cost per submitted task of the context-propagating executors.
+
+Each task opens a single operation. Tasks are submitted and their results
+awaited in one batch, to a plain executor and to its context-propagating
+counterpart. For process pools, the context-propagating executor also
+ships the operations back to this process.
+
+Run from the repository root:
+    python -m benchmarks.bench_executors
+"""
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from oplog import Operation
+from oplog.executors import (
+    OperationProcessPoolExecutor,
+    OperationThreadPoolExecutor,
+    submit_with_context,
+)
+from oplog.sinks import BaseOperationSink
+
+THREAD_TASKS = 20_000
+PROCESS_TASKS = 5_000
+WORKERS = 4
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+def task(i: int) -> int:
+    with Operation(name="bench_task_op"):
+        return i
+
+
+def per_task_us(executor: Executor, number: int, submit=None) -> float:
+    submit = submit or executor.submit
+    with executor:
+        # warm up the workers
+        for future in [submit(task, i) for i in range(WORKERS * 10)]:
+            future.result()
+        with Operation(name="bench_parent_op"):
+            start = time.perf_counter()
+            for future in [submit(task, i) for i in range(number)]:
+                future.result()
+            elapsed = time.perf_counter() - start
+    return elapsed / number * 1e6
+
+
+def main() -> None:
+    Operation.config(sinks=[NullSink()])
+    thread_pool = ThreadPoolExecutor(WORKERS)
+    rows = [
+        ("ThreadPoolExecutor", per_task_us(ThreadPoolExecutor(WORKERS), THREAD_TASKS)),
+        ("OperationThreadPoolExecutor",
+         per_task_us(OperationThreadPoolExecutor(WORKERS), THREAD_TASKS)),
+        ("submit_with_context (threads)",
+         per_task_us(thread_pool, THREAD_TASKS,
+                     lambda fn, *args: submit_with_context(thread_pool, fn, *args))),
+        ("ProcessPoolExecutor", per_task_us(ProcessPoolExecutor(WORKERS), PROCESS_TASKS)),
+        ("OperationProcessPoolExecutor",
+         per_task_us(OperationProcessPoolExecutor(WORKERS), PROCESS_TASKS)),
+    ]
+    Operation.factory_reset()
+
+    for name, us in rows:
+        print(f"{name:<32} {us:>8.1f} us/task")
+
+
+if __name__ == "__main__":
+    main()
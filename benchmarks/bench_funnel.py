@@ -0,0 +1,78 @@
+"""Benchmark: cost of an operation on the worker, with a file sink and with
+an `OperationFunnel`.
+
+With a file sink, every worker formats and writes its operations itself.
+With a funnel, workers only encode operations into their shared memory
+ring, and the collector process formats and writes them.
+
+Run from the repository root:
+    python -m benchmarks.bench_funnel
+"""
+import functools
+import multiprocessing
+import os
+import tempfile
+import time
+
+from oplog import Operation, OperationFunnel, OverflowPolicy
+from oplog.formatters import CsvOperationFormatter
+from oplog.sinks import FileOperationSink, SharedMemoryOperationSink
+
+NUMBER = 20_000
+WORKERS = 4
+
+
+def run_ops() -> float:
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        with Operation(name="bench_op"):
+            pass
+    return (time.perf_counter() - start) / NUMBER * 1e6
+
+
+def file_worker(filename: str, results) -> None:
+    sink = FileOperationSink(CsvOperationFormatter(), filename)
+    Operation.config(sinks=[sink])
+    results.put(run_ops())
+    sink.close()
+
+
+def funnel_worker(address, authkey: bytes, results) -> None:
+    sink = SharedMemoryOperationSink.connect(
+        address, authkey, capacity=16 << 20, overflow_policy=OverflowPolicy.BLOCK
+    )
+    Operation.config(sinks=[sink])
+    results.put(run_ops())
+    sink.close()
+
+
+def run_workers(target, args) -> float:
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=target, args=(*args, results))
+                 for _ in range(WORKERS)]
+    for process in processes:
+        process.start()
+    per_op_us = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return sum(per_op_us) / len(per_op_us)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filename = os.path.join(tmp_dir, "ops.csv")
+        file_us = run_workers(file_worker, (filename,))
+
+        funnel = OperationFunnel(functools.partial(
+            FileOperationSink, CsvOperationFormatter(), os.path.join(tmp_dir, "funnel.csv")
+        ))
+        with funnel:
+            funnel_us = run_workers(funnel_worker, (funnel.address, funnel.authkey))
+
+    print(f"{WORKERS} workers, {NUMBER:,} operations each, time on the worker:")
+    print(f"{'file sink':<16} {file_us:>8.1f} us/op")
+    print(f"{'funnel':<16} {funnel_us:>8.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: formatting operations that carry global props.
+
+Global props are an immutable, versioned snapshot, so formatters render
+them once per version. The cached rendering is compared with rendering a
+plain dict of the same props (as the formatters do for records read back
+from files) on every operation.
+
+Run from the repository root:
+    python -m benchmarks.bench_global_props
+"""
+import time
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter, VerboseOperationFormatter
+from oplog.readers import OperationRecord
+from oplog.sinks import BaseOperationSink
+
+NUMBER = 100_000
+GLOBAL_PROPS = {
+    "service": "checkout",
+    "region": "eu-west-1",
+    "build_version": "20230120_001",
+    "host": "web-042",
+}
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+def rate(func) -> float:
+    start = time.perf_counter()
+    func()
+    return NUMBER / (time.perf_counter() - start)
+
+
+def main() -> None:
+    Operation.config(sinks=[NullSink()])
+    for key, value in GLOBAL_PROPS.items():
+        Operation.add_global(key, value)
+    ops = []
+    for i in range(NUMBER):
+        with Operation(name=f"bench_op_{i % 10}") as op:
+            pass
+        # ids are generated once, outside of the measurement
+        op.correlation_id
+        ops.append(op)
+    # the same operations, as records with their global props as a plain dict
+    plain_ops = [
+        OperationRecord(**{field: getattr(op, field) for field in OperationRecord._fields
+                           if field != "global_props"}, global_props=dict(GLOBAL_PROPS))
+        for op in ops
+    ]
+    Operation.factory_reset()
+
+    verbose = VerboseOperationFormatter()
+    csv = CsvOperationFormatter(global_props=tuple(GLOBAL_PROPS))
+    for label, formatter in (("verbose", verbose), ("csv", csv)):
+        uncached = rate(lambda: [formatter.format_op(op) for op in plain_ops])
+        cached = rate(lambda: [formatter.format_op(op) for op in ops])
+        print(f"{label + ' (per operation)':<24} {uncached:>12,.0f} ops/s")
+        print(f"{label + ' (per version)':<24} {cached:>12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
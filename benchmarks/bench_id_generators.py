@@ -0,0 +1,31 @@
+"""Micro-benchmark: id generation strategies (see `oplog.id_generators`).
+
+Run from the repository root:
+    python -m benchmarks.bench_id_generators
+"""
+import timeit
+
+from oplog.id_generators import (
+    BufferedRandomIdGenerator,
+    CounterIdGenerator,
+    TimeOrderedIdGenerator,
+    Uuid4IdGenerator,
+)
+
+NUMBER = 200_000
+
+
+def main() -> None:
+    generators = (
+        Uuid4IdGenerator(),
+        BufferedRandomIdGenerator(),
+        TimeOrderedIdGenerator(),
+        CounterIdGenerator(),
+    )
+    for generator in generators:
+        seconds = timeit.timeit(generator.generate, number=NUMBER)
+        print(f"{generator.__class__.__name__:<28} {seconds / NUMBER * 1e9:8.0f} ns/id")
+
+
+if __name__ == "__main__":
+    main()
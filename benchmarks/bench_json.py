@@ -0,0 +1,92 @@
+"""Benchmark: JSON lines per second.
+
+Compares building a dict per operation and encoding it with `json.dumps`
+(the naive formatter) with `JsonOperationFormatter`, which encodes only
+the values of an operation, into precompiled keys and cached fragments
+(process and thread ids, global props). The formatter is measured with
+and without `orjson` (when installed), which encodes the props.
+
+A pool of distinct operations is formatted over and over, up to
+`--number` lines, so memory use does not grow with the number.
+
+Run from the repository root:
+    python -m benchmarks.bench_json
+    python -m benchmarks.bench_json --number 100000
+"""
+import argparse
+import json
+import time
+
+from oplog import Operation
+from oplog.formatters import JsonOperationFormatter, json_operation_formatter
+from oplog.sinks import BaseOperationSink
+
+NUMBER = 1_000_000
+POOL_SIZE = 10_000
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+def naive_format_op(op: Operation) -> str:
+    return json.dumps({
+        "start_time_utc": op.start_time_utc_str,
+        "start_time_ns": op.start_time_ns,
+        "duration_ns": op.duration_ns,
+        "name": op.name,
+        "result": op.result,
+        "id": op.id,
+        "correlation_id": op.correlation_id,
+        "parent_id": op.parent_id,
+        "depth": op.depth,
+        "exception_type": op.exception_type,
+        "exception_msg": op.exception_msg,
+        "traceback_fingerprint": op.traceback_fingerprint,
+        "process_id": op.process_id,
+        "thread_id": op.thread_id,
+        "custom_props": op.custom_props,
+        "global_props": dict(op.global_props),
+    }, default=str)
+
+
+def rate(format_op, ops, number: int) -> float:
+    rounds, remainder = divmod(number, len(ops))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for op in ops:
+            format_op(op)
+    for op in ops[:remainder]:
+        format_op(op)
+    return number / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=NUMBER, help="lines formatted per case")
+    args = parser.parse_args()
+
+    Operation.config(sinks=[NullSink()])
+    Operation.add_global("service", "checkout")
+    Operation.add_global("build_version", "20230120_001")
+    ops = []
+    for i in range(POOL_SIZE):
+        with Operation(name=f"bench_op_{i % 10}") as op:
+            op.add("user", f"user_{i % 100}")
+            op.add("items", i % 7)
+        # ids are generated once, outside of the measurement
+        op.correlation_id
+        ops.append(op)
+
+    cases = [("json.dumps (naive)", naive_format_op)]
+    if json_operation_formatter.orjson is not None:
+        cases.append(("formatter (orjson)", JsonOperationFormatter(use_orjson=True).format_op))
+    cases.append(("formatter (json)", JsonOperationFormatter(use_orjson=False).format_op))
+    for label, format_op in cases:
+        print(f"{label:<20} {rate(format_op, ops, args.number):>12,.0f} lines/s")
+    Operation.factory_reset()
+
+
+if __name__ == "__main__":
+    main()
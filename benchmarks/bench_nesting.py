@@ -0,0 +1,51 @@
+"""Micro-benchmark: entering and exiting operations at a given nesting depth.
+
+Compares the previous copy-on-push list stack with the parent-linked
+`active_operation` context variable, for nesting depths of 1, 10 and 100.
+
+Run from the repository root:
+    python -m benchmarks.bench_nesting
+"""
+import timeit
+from contextvars import ContextVar
+from typing import List
+
+from oplog.operation import active_operation
+
+NUMBER = 100_000
+DEPTHS = (1, 10, 100)
+
+legacy_stack: ContextVar[List[object]] = ContextVar("legacy_stack", default=[])
+
+
+def legacy_push_pop(op: object) -> None:
+    legacy_stack.set(legacy_stack.get([]) + [op])
+    current_stack = legacy_stack.get([])
+    current_stack.pop()
+    legacy_stack.set(current_stack)
+
+
+def linked_push_pop(op: object) -> None:
+    token = active_operation.set(op)  # type: ignore[arg-type]
+    active_operation.reset(token)
+
+
+def main() -> None:
+    op = object()
+    print(f"{'depth':>6} {'list copy (ns)':>16} {'linked (ns)':>12}")
+    for depth in DEPTHS:
+        legacy_tokens = [legacy_stack.set(legacy_stack.get([]) + [op]) for _ in range(depth - 1)]
+        linked_tokens = [active_operation.set(op) for _ in range(depth - 1)]  # type: ignore[arg-type]
+
+        legacy = timeit.timeit(lambda: legacy_push_pop(op), number=NUMBER)
+        linked = timeit.timeit(lambda: linked_push_pop(op), number=NUMBER)
+        print(f"{depth:>6} {legacy / NUMBER * 1e9:>16.0f} {linked / NUMBER * 1e9:>12.0f}")
+
+        for token in reversed(linked_tokens):
+            active_operation.reset(token)
+        for legacy_token in reversed(legacy_tokens):
+            legacy_stack.reset(legacy_token)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Micro-benchmark: call overhead of `@Operated`.
+
+Compares a plain function, the previous wrapper (op name resolved on
+every call) and the current wrapper (op name resolved at decoration time).
+Operation logs are not consumed (the logger is above INFO), so the numbers
+reflect the wrapper and operation bookkeeping rather than log I/O.
+
+Run from the repository root:
+    python -m benchmarks.bench_operated
+"""
+import logging
+import timeit
+from functools import update_wrapper
+
+from oplog import Operated, Operation
+
+NUMBER = 200_000
+
+
+def legacy_operated(name=None, suppress=False):
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            if name is not None:
+                op_name = name
+            else:
+                function_name = func.__name__
+                try:
+                    qualifier_name = func.__qualname__.split(".")[0]
+                except AttributeError:
+                    qualifier_name = func.__module__
+                op_name = f"{qualifier_name}.{function_name}"
+
+            with Operation(name=op_name, suppress=suppress):
+                result = func(*args, **kwargs)
+
+            return result
+
+        update_wrapper(wrapper, func)
+        return wrapper
+    return decorator
+
+
+def plain(a, b):
+    return a + b
+
+
+legacy = legacy_operated()(plain)
+current = Operated()(plain)
+
+
+def main() -> None:
+    logging.getLogger().setLevel(logging.WARNING)
+    baseline = timeit.timeit(lambda: plain(1, 2), number=NUMBER)
+    for title, func in (("plain function", plain),
+                        ("legacy wrapper", legacy),
+                        ("current wrapper", current)):
+        seconds = timeit.timeit(lambda: func(1, 2), number=NUMBER)
+        overhead = (seconds - baseline) / NUMBER * 1e9
+        print(f"{title:<18} {seconds / NUMBER * 1e9:8.0f} ns/call "
+              f"(+{overhead:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark: retained memory per finished operation.
+
+Measures (with tracemalloc) the memory retained by finished operations,
+for the slotted `Operation`, and for a replica of the previous
+dict-based layout (eager datetimes, strings and uuid strings).
+
+Run from the repository root:
+    python -m benchmarks.bench_operation_memory
+"""
+import datetime
+import gc
+import logging
+import tracemalloc
+import uuid
+from typing import Callable, List
+
+from oplog import Operation
+from oplog.sinks import BaseOperationSink
+
+NUMBER = 10_000
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+class LegacyLayoutOperation:
+    """The per-instance state of the previous (dict-based) `Operation`."""
+
+    def __init__(self, name: str) -> None:
+        self.parent_op = None
+        self.child_ops: List[object] = []
+        self.name = name
+        self.suppress = False
+        self._on_start = False
+        self.custom_props: dict = {}
+        self.start_time_utc = datetime.datetime.utcnow()
+        self.start_time_utc_str = self.start_time_utc.strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.end_time_utc = datetime.datetime.utcnow()
+        self.end_time_utc_str = self.end_time_utc.strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.duration_ms = 0
+        self.duration_ns = 12345
+        self.id = str(uuid.uuid4())
+        self.step = None
+        self.is_successful = True
+        self.result = "Success"
+        self.exception_type = None
+        self.exception_msg = None
+        self._logger = logging.getLogger()
+        self.logger_name = "root"
+        self.log_level = "INFO"
+        self.process_name = "MainProcess"
+        self.process_id = 1
+        self.thread_name = "MainThread"
+        self.thread_id = 1
+        self.correlation_id = str(uuid.uuid4())
+        self._perf_start = 1
+        self.traceback = ""
+
+
+def create_op() -> object:
+    with Operation(name="bench_op") as op:
+        pass
+    # ids are generated on read, as a formatter would
+    op.id, op.correlation_id
+    return op
+
+
+def measure(factory: Callable[[], object]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    ops = [factory() for _ in range(NUMBER)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ops
+    return (after - before) / NUMBER
+
+
+def main() -> None:
+    Operation.config(sinks=[NullSink()])
+    legacy = measure(lambda: LegacyLayoutOperation("bench_op"))
+    current = measure(create_op)
+    Operation.factory_reset()
+    print(f"{'legacy layout':<16} {legacy:8.0f} bytes/op")
+    print(f"{'slotted layout':<16} {current:8.0f} bytes/op")
+    print(f"{'saving':<16} {legacy - current:8.0f} bytes/op")
+
+
+if __name__ == "__main__":
+    main()
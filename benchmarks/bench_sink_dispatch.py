@@ -0,0 +1,52 @@
+"""Benchmark: operations per second through the logging path and the sink path.
+
+The logging path logs operations through a logger into an
+`OperationHandler` (wrapping a `StreamHandler`). The sink path dispatches
+operations straight to a `StreamOperationSink` registered with
+`Operation.config(sinks=...)`. Both write the same CSV lines to /dev/null.
+
+Run from the repository root:
+    python -m benchmarks.bench_sink_dispatch
+"""
+import logging
+import os
+import time
+
+from oplog import Operation, OperationHandler
+from oplog.formatters import CsvOperationFormatter
+from oplog.sinks import StreamOperationSink
+
+NUMBER = 50_000
+
+
+def run_ops() -> float:
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        with Operation(name="bench_op"):
+            pass
+    return NUMBER / (time.perf_counter() - start)
+
+
+def main() -> None:
+    with open(os.devnull, "w") as devnull:
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        op_handler = OperationHandler(
+            handler=logging.StreamHandler(devnull),
+            formatter=CsvOperationFormatter(),
+        )
+        root_logger.addHandler(op_handler)
+        logging_rate = run_ops()
+        root_logger.removeHandler(op_handler)
+
+        Operation.config(sinks=[StreamOperationSink(CsvOperationFormatter(), devnull)])
+        sink_rate = run_ops()
+        Operation.factory_reset()
+
+    print(f"{'logging path':<14} {logging_rate:>10,.0f} ops/s")
+    print(f"{'sink path':<14} {sink_rate:>10,.0f} ops/s")
+    print(f"{'speedup':<14} {sink_rate / logging_rate:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: SQLite operation store, batched vs per-operation inserts,
+and index lookups vs a full scan.
+
+`SqliteOperationSink` buffers operations and inserts them with one
+`executemany` transaction per flush interval. It is compared with
+inserting (and committing) every operation on its own.
+
+Run from the repository root:
+    python -m benchmarks.bench_sqlite
+"""
+import os
+import tempfile
+import time
+
+from oplog import Operation, sqlite_schema
+from oplog.readers import SqliteOperationReader
+from oplog.sinks import BaseOperationSink, SqliteOperationSink
+
+NUMBER = 50_000
+QUERIES = 200
+
+
+class PerOperationSqliteSink(BaseOperationSink):
+    """An insert (and a transaction) per operation."""
+
+    def __init__(self, filename: str) -> None:
+        self._connection = sqlite_schema.create(filename)
+
+    def emit(self, op) -> None:
+        with self._connection:
+            self._connection.execute(sqlite_schema.INSERT, (
+                op.name, op.start_time_ns, op.duration_ns, op.result, op.id, op.correlation_id,
+                op.parent_id, op.depth, op.exception_type, op.exception_msg, op.traceback_fingerprint,
+                op.process_id, op.thread_id, None, None,
+            ))
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def write_ops(sink: BaseOperationSink, number: int) -> float:
+    """Operations per second, until all of them are stored."""
+    Operation.config(sinks=[sink])
+    start = time.perf_counter()
+    for i in range(number):
+        with Operation(name=f"bench_op_{i % 10}") as op:
+            op.add("user", f"user_{i % 100}")
+    sink.close()
+    elapsed = time.perf_counter() - start
+    Operation.factory_reset()
+    return number / elapsed
+
+
+def query_time_us(query, number: int = QUERIES) -> float:
+    start = time.perf_counter()
+    for i in range(number):
+        query(i)
+    return (time.perf_counter() - start) / number * 1_000_000
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        batched_file = os.path.join(tmp_dir, "batched.db")
+        per_op_file = os.path.join(tmp_dir, "per_op.db")
+
+        batched = write_ops(SqliteOperationSink(batched_file), NUMBER)
+        # much slower, a smaller number of operations
+        per_op = write_ops(PerOperationSqliteSink(per_op_file), NUMBER // 10)
+        print(f"{'insert':<16} {'ops/s':>10}")
+        print(f"{'batched':<16} {batched:>10,.0f}")
+        print(f"{'per operation':<16} {per_op:>10,.0f}")
+
+        with SqliteOperationReader(batched_file) as reader:
+            correlation_ids = [record.correlation_id for _, record in zip(range(QUERIES), reader)]
+            indexed = query_time_us(lambda i: reader.slowest(f"bench_op_{i % 10}", 10))
+            correlated = query_time_us(lambda i: reader.by_correlation_id(correlation_ids[i]))
+            # the same lookup, without the index
+            scanned = query_time_us(lambda i: reader._connection.execute(
+                f"{sqlite_schema.SELECT} NOT INDEXED WHERE correlation_id = ?", (correlation_ids[i],)
+            ).fetchall(), number=20)
+        print()
+        print(f"{'query':<24} {'us/query':>10}")
+        print(f"{'slowest 10 of a name':<24} {indexed:>10,.0f}")
+        print(f"{'by correlation id':<24} {correlated:>10,.0f}")
+        print(f"{'full scan':<24} {scanned:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark: trace tree rebuilding and analysis throughput.
+
+Records of many interleaved requests (a root with a few children and
+grandchildren each) are fed to a `TraceTreeBuilder`, and the trees are
+aggregated per root name (self time, critical path, fan-out).
+
+Run from the repository root:
+    python -m benchmarks.bench_traces
+"""
+import time
+
+from oplog.readers import OperationRecord
+from oplog.traces import TraceTreeBuilder, aggregate
+
+REQUESTS = 20_000
+# requests in flight at once, their records interleave
+CONCURRENCY = 50
+
+
+def request_records(request: int):
+    correlation_id = f"request_{request}"
+    start = request * 1_000
+
+    def record(name, offset, duration, parent=None):
+        return OperationRecord(
+            name=name, start_time_ns=start + offset, duration_ns=duration,
+            id=f"{correlation_id}.{name}", correlation_id=correlation_id,
+            parent_id=f"{correlation_id}.{parent}" if parent else None,
+        )
+
+    return [
+        record("db", 10, 100, "handler"),
+        record("cache", 20, 30, "render"),
+        record("render", 110, 200, "handler"),
+        record("handler", 5, 400, "request"),
+        record("audit", 0, 500, "request"),
+        record("request", 0, 600),
+    ]
+
+
+def records():
+    # batches of concurrent requests, their records round-robin
+    for batch_start in range(0, REQUESTS, CONCURRENCY):
+        batch = [request_records(request) for request in range(batch_start, batch_start + CONCURRENCY)]
+        for index in range(len(batch[0])):
+            for request in batch:
+                yield request[index]
+
+
+def main() -> None:
+    all_records = list(records())
+    builder = TraceTreeBuilder()
+    start = time.perf_counter()
+    stats = aggregate(builder.build(all_records))
+    elapsed = time.perf_counter() - start
+
+    request_stats = stats["request"]
+    print(f"{len(all_records):,} records, {request_stats.tree_count:,} trees")
+    print(f"records/s: {len(all_records) / elapsed:,.0f}")
+    print(f"critical path: {request_stats.critical_path_shares(top=3)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""Benchmark suite: per-operation overhead across the main code paths.
+
+Every case measures the cost of a single operation (or a single formatted
+op), in nanoseconds. A case is run `--repeat` times and its fastest round
+is reported, which is the least noisy estimate on a busy machine.
+
+Results are written as JSON. When a baseline is given, each case is
+compared against it and the suite exits with a non-zero status if any
+case is slower than the baseline by more than `--threshold` (a ratio,
+0.25 means 25% slower).
+
+Run from the repository root:
+    python -m benchmarks.suite                                    # run and print
+    python -m benchmarks.suite --output bench_results.json        # save results
+    python -m benchmarks.suite --compare benchmarks/baseline.json # check for regressions
+    python -m benchmarks.suite --output benchmarks/baseline.json  # refresh the baseline
+    python -m benchmarks.suite --filter formatter                 # run matching cases only
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Type
+
+from oplog import Operated, Operation, OperationHandler, QueuedOperationHandler
+from oplog.formatters import (
+    BaseOperationFormatter,
+    CsvOperationFormatter,
+    JsonOperationFormatter,
+    VerboseOperationFormatter,
+)
+from oplog.sinks import BaseOperationSink, CsvFileOperationSink, FileOperationSink
+
+NUMBER = 20_000
+REPEAT = 5
+THRESHOLD = 0.25
+THREADS = 4
+
+# a case is set up by a context manager, that yields a function running
+# `number` operations
+Runner = Callable[[int], None]
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], "contextlib.AbstractContextManager[Runner]"]
+    # fraction of `--number` run by slow cases
+    scale: float = 1.0
+
+
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
+class TracebackSink(BaseOperationSink):
+    """Reads the traceback of failed operations, as formatters do. Tracebacks
+    are formatted lazily, on the first read."""
+
+    def emit(self, op: Operation) -> None:
+        op.traceback
+
+
+CASES: List[Case] = []
+
+
+def case(name: str, scale: float = 1.0):
+    def register(setup):
+        CASES.append(Case(name, contextlib.contextmanager(setup), scale))
+        return setup
+    return register
+
+
+@contextlib.contextmanager
+def configured(**config) -> Iterator[None]:
+    Operation.config(**config)
+    try:
+        yield
+    finally:
+        Operation.factory_reset()
+
+
+@contextlib.contextmanager
+def root_handler(handler: logging.Handler) -> Iterator[None]:
+    root_logger = logging.getLogger()
+    previous_level = root_logger.level
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(handler)
+    try:
+        yield
+    finally:
+        root_logger.removeHandler(handler)
+        root_logger.setLevel(previous_level)
+        handler.close()
+
+
+@contextlib.contextmanager
+def temp_filename() -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield os.path.join(tmp_dir, "bench.log")
+
+
+def run_bare(number: int) -> None:
+    for _ in range(number):
+        with Operation(name="bench_op"):
+            pass
+
+
+# --- operation ---------------------------------------------------------------
+
+@case("operation.disabled")
+def _operation_disabled() -> Iterator[Runner]:
+    # no sinks, and INFO is not enabled for the (root) logger
+    yield run_bare
+
+
+@case("operation.null_sink")
+def _operation_null_sink() -> Iterator[Runner]:
+    with configured(sinks=[NullSink()]):
+        yield run_bare
+
+
+@case("operation.add_heavy")
+def _operation_add_heavy() -> Iterator[Runner]:
+    props = {f"prop_{i}": i for i in range(10)}
+    multi_props = {f"multi_prop_{i}": i for i in range(10)}
+
+    def run(number: int) -> None:
+        for _ in range(number):
+            with Operation(name="bench_op") as op:
+                for key, value in props.items():
+                    op.add(key, value)
+                op.add_multi(multi_props)
+
+    with configured(sinks=[NullSink()]):
+        yield run
+
+
+@case("operation.failure_traceback", scale=0.1)
+def _operation_failure_traceback() -> Iterator[Runner]:
+    def fail(depth: int) -> None:
+        if depth == 0:
+            raise ValueError("bench failure")
+        fail(depth - 1)
+
+    def run(number: int) -> None:
+        for _ in range(number):
+            with Operation(name="bench_op", suppress=True):
+                fail(5)
+
+    with configured(sinks=[TracebackSink()]):
+        yield run
+
+
+def nested(depth: int) -> Callable[[], Iterator[Runner]]:
+    def setup() -> Iterator[Runner]:
+        # the operations measured are the innermost ones, opened while
+        # `depth - 1` ancestors are active
+        with configured(sinks=[NullSink()]), contextlib.ExitStack() as stack:
+            for level in range(depth - 1):
+                stack.enter_context(Operation(name=f"bench_parent_{level}"))
+            yield run_bare
+    return setup
+
+
+for _depth in (1, 10, 100):
+    case(f"operation.nested_depth_{_depth}")(nested(_depth))
+
+
+# --- operated ----------------------------------------------------------------
+
+@case("operated.sync")
+def _operated_sync() -> Iterator[Runner]:
+    @Operated()
+    def func() -> None:
+        pass
+
+    def run(number: int) -> None:
+        for _ in range(number):
+            func()
+
+    with configured(sinks=[NullSink()]):
+        yield run
+
+
+@case("operated.async")
+def _operated_async() -> Iterator[Runner]:
+    @Operated()
+    async def func() -> None:
+        pass
+
+    async def run_async(number: int) -> None:
+        for _ in range(number):
+            await func()
+
+    loop = asyncio.new_event_loop()
+
+    def run(number: int) -> None:
+        loop.run_until_complete(run_async(number))
+
+    try:
+        with configured(sinks=[NullSink()]):
+            yield run
+    finally:
+        loop.close()
+
+
+# --- formatters --------------------------------------------------------------
+
+def formatter_case(
+    formatter_class: Type[BaseOperationFormatter],
+) -> Callable[[], Iterator[Runner]]:
+    def setup() -> Iterator[Runner]:
+        formatter = formatter_class()
+        with configured(sinks=[NullSink()]):
+            with Operation(name="bench_op") as op:
+                op.add("prop", 1)
+            # ids are generated once, outside of the measurement
+            op.correlation_id
+
+        def run(number: int) -> None:
+            format_op = formatter.format_op
+            for _ in range(number):
+                format_op(op)
+
+        yield run
+    return setup
+
+
+case("formatter.verbose")(formatter_case(VerboseOperationFormatter))
+case("formatter.csv")(formatter_case(CsvOperationFormatter))
+case("formatter.json")(formatter_case(JsonOperationFormatter))
+
+
+# --- handlers and sinks ------------------------------------------------------
+
+@case("handler.null")
+def _handler_null() -> Iterator[Runner]:
+    handler = OperationHandler(logging.NullHandler(), CsvOperationFormatter())
+    with root_handler(handler):
+        yield run_bare
+
+
+@case("handler.file")
+def _handler_file() -> Iterator[Runner]:
+    with temp_filename() as filename:
+        handler = OperationHandler(logging.FileHandler(filename), CsvOperationFormatter())
+        with root_handler(handler):
+            yield run_bare
+
+
+@case("handler.queued_file")
+def _handler_queued_file() -> Iterator[Runner]:
+    with temp_filename() as filename:
+        handler = QueuedOperationHandler(logging.FileHandler(filename), CsvOperationFormatter())
+
+        def run(number: int) -> None:
+            run_bare(number)
+            # the cost of writing the queued records is part of the case
+            handler.flush()
+
+        with root_handler(handler):
+            yield run
+
+
+@case("sink.file")
+def _sink_file() -> Iterator[Runner]:
+    with temp_filename() as filename:
+        sink = FileOperationSink(CsvOperationFormatter(), filename)
+        try:
+            with configured(sinks=[sink]):
+                yield run_bare
+        finally:
+            sink.close()
+
+
+@case("sink.csv_file")
+def _sink_csv_file() -> Iterator[Runner]:
+    # the same rows as `sink.file`, written in batches
+    with temp_filename() as filename:
+        sink = CsvFileOperationSink(filename)
+        try:
+            with configured(sinks=[sink]):
+                yield run_bare
+        finally:
+            sink.close()
+
+
+# --- contention --------------------------------------------------------------
+
+@case("contention.threads_null_handler")
+def _contention_threads() -> Iterator[Runner]:
+    handler = OperationHandler(logging.NullHandler(), CsvOperationFormatter())
+
+    def run(number: int) -> None:
+        threads = [
+            threading.Thread(target=run_bare, args=(number // THREADS,))
+            for _ in range(THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    with root_handler(handler):
+        yield run
+
+
+# --- runner ------------------------------------------------------------------
+
+def measure(bench_case: Case, number: int, repeat: int) -> float:
+    """Returns the fastest round of `bench_case`, in nanoseconds per operation."""
+    number = max(1, int(number * bench_case.scale))
+    with bench_case.setup() as run:
+        # warm up caches (caller loggers, formatting caches, etc.)
+        run(min(number, 1_000))
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            run(number)
+            best = min(best, (time.perf_counter_ns() - start) / number)
+    return best
+
+
+def run_suite(cases: List[Case], number: int, repeat: int) -> Dict:
+    results = {}
+    for bench_case in cases:
+        ns_per_op = measure(bench_case, number, repeat)
+        results[bench_case.name] = {"ns_per_op": round(ns_per_op, 1)}
+        print(f"{bench_case.name:<36} {ns_per_op:>12,.0f} ns/op")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "number": number,
+            "repeat": repeat,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Returns the names of the cases that regressed by more than `threshold`."""
+    regressions = []
+    print()
+    print(f"{'case':<36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results["results"].items():
+        baseline_result = baseline["results"].get(name)
+        if baseline_result is None:
+            print(f"{name:<36} {'-':>12} {result['ns_per_op']:>12,.0f} {'new':>8}")
+            continue
+        change = result["ns_per_op"] / baseline_result["ns_per_op"] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<36} {baseline_result['ns_per_op']:>12,.0f} "
+            f"{result['ns_per_op']:>12,.0f} {change:>+8.1%}"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=NUMBER,
+                        help="operations per round")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="rounds per case, the fastest is reported")
+    parser.add_argument("--filter", default="",
+                        help="run only the cases whose name contains this")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="maximal allowed slowdown ratio per case")
+    args = parser.parse_args(argv)
+
+    cases = [bench_case for bench_case in CASES if args.filter in bench_case.name]
+    results = run_suite(cases, args.number, args.repeat)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
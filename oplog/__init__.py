@@ -1,4 +1,9 @@
 from .operation import Operation  # noqa: F401
+from .child_retention import ChildRetention  # noqa: F401
 from .operated import Operated  # noqa: F401
 from .operation_log_filter import OperationLogFilter  # noqa: F401
 from .operation_handler import OperationHandler  # noqa: F401
+from .overflow_policy import OverflowPolicy  # noqa: F401
+from .queued_operation_handler import QueuedOperationHandler  # noqa: F401
+from .operation_funnel import OperationFunnel  # noqa: F401
+from .sampler import Sampler  # noqa: F401
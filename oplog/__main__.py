@@ -0,0 +1,5 @@
+import sys
+
+from oplog.cli import main
+
+sys.exit(main())
@@ -0,0 +1,304 @@
+"""The oplog binary record format.
+
+A file is a magic header, followed by segments:
+
+    MAGIC
+    segment 0: SYNC, global props, records...
+    segment 1: SYNC, global props, records...
+
+Every segment starts with a 16 bytes sync marker, so a reader can start at
+any offset by scanning for the next one (e.g., to split a file into chunks).
+Strings that repeat (operation names, prop keys, exception types) are
+interned per segment: the first occurrence is written as a STRING record,
+that assigns it the next index of the segment's string table, and records
+refer to it by index. Segments are self-contained, the string table is
+reset at every segment.
+
+Records (after the sync marker) are a type byte, followed by a varint
+length and the record body:
+
+    STRING: utf-8 bytes.
+    OPERATION:
+        name (string ref), start_time_ns (int64),
+        duration_ns (varint, +1, 0 is a null), result (byte),
+        id (str), correlation_id (str), parent_id (optional str),
+        exception_type (optional string ref), exception_msg (optional str),
+        custom props (varint count, then string ref keys and typed values),
+        process_id (optional varint), thread_id (optional varint),
+        traceback_fingerprint (optional str), depth (optional varint).
+        Fields may be appended to the body in later versions, readers
+        ignore trailing bytes they do not know.
+
+Encodings:
+    varint: unsigned LEB128.
+    int64: little endian.
+    str: varint length, followed by utf-8 bytes.
+    optional str: varint length + 1 (0 is a null), followed by utf-8 bytes.
+    string ref: varint index into the segment's string table.
+    optional string ref: varint index + 1 (0 is a null).
+    typed value: a tag byte, followed by the value (zigzag varint for ints,
+        float64 for floats, str for strings and for the repr of other types).
+"""
+import struct
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from oplog.global_props import GlobalPropsCache
+
+MAGIC = b"OPLBIN1\n"
+# the record type of the sync marker is part of it
+SYNC = b"\x00\xa7OPLSYNC\x1f\x8b\x5c\xe3\x02\xd9\x61"
+
+RECORD_SYNC = 0x00
+RECORD_STRING = 0x01
+RECORD_OPERATION = 0x02
+
+RESULT_CODES = {None: 0, "Success": 1, "Failure": 2}
+RESULTS = {code: result for result, code in RESULT_CODES.items()}
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+# any other type, stored as its repr (decoded as a str)
+TAG_REPR = 6
+
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+_SMALL_VARINTS = [bytes([value]) for value in range(0x80)]
+
+
+def varint(value: int) -> bytes:
+    """The varint encoding of `value`, single bytes are not allocated."""
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+    out = bytearray()
+    write_varint(out, value)
+    return bytes(out)
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Returns the value and the offset after it."""
+    byte = data[offset]
+    if byte < 0x80:
+        return byte, offset + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        offset += 1
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset + 1
+        shift += 7
+
+
+def write_str(out: bytearray, value: str) -> None:
+    encoded = value.encode("utf-8")
+    write_varint(out, len(encoded))
+    out += encoded
+
+
+def read_str(data: bytes, offset: int) -> Tuple[str, int]:
+    length, offset = read_varint(data, offset)
+    end = offset + length
+    return data[offset:end].decode("utf-8"), end
+
+
+def write_optional_str(out: bytearray, value: Optional[str]) -> None:
+    if value is None:
+        out.append(0)
+        return
+    encoded = value.encode("utf-8")
+    write_varint(out, len(encoded) + 1)
+    out += encoded
+
+
+def read_optional_str(data: bytes, offset: int) -> Tuple[Optional[str], int]:
+    length, offset = read_varint(data, offset)
+    if length == 0:
+        return None, offset
+    end = offset + length - 1
+    return data[offset:end].decode("utf-8"), end
+
+
+def write_value(out: bytearray, value: Any) -> None:
+    # bool is checked before int, as it is a subclass of it
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True:
+        out.append(TAG_TRUE)
+    elif value is False:
+        out.append(TAG_FALSE)
+    elif isinstance(value, int):
+        out.append(TAG_INT)
+        # zigzag, so small negative numbers are small varints
+        write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+    elif isinstance(value, float):
+        out.append(TAG_FLOAT)
+        out += _FLOAT64.pack(value)
+    elif isinstance(value, str):
+        out.append(TAG_STR)
+        write_str(out, value)
+    else:
+        out.append(TAG_REPR)
+        write_str(out, repr(value))
+
+
+def read_value(data: bytes, offset: int) -> Tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+    if tag == TAG_STR or tag == TAG_REPR:
+        return read_str(data, offset)
+    if tag == TAG_INT:
+        zigzag, offset = read_varint(data, offset)
+        return (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1), offset
+    if tag == TAG_FLOAT:
+        return _FLOAT64.unpack_from(data, offset)[0], offset + _FLOAT64.size
+    if tag == TAG_NONE:
+        return None, offset
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    raise ValueError(f"unknown value tag {tag}")
+
+
+def write_int64(out: bytearray, value: int) -> None:
+    out += _INT64.pack(value)
+
+
+def read_int64(data: bytes, offset: int) -> Tuple[int, int]:
+    return _INT64.unpack_from(data, offset)[0], offset + _INT64.size
+
+
+def write_props(out: bytearray, props: Mapping[str, Any]) -> None:
+    """Props with inline (not interned) keys, used for global props."""
+    write_varint(out, len(props))
+    for key, value in props.items():
+        write_str(out, key)
+        write_value(out, value)
+
+
+def read_props(data: bytes, offset: int) -> Tuple[Dict[str, Any], int]:
+    count, offset = read_varint(data, offset)
+    props = {}
+    for _ in range(count):
+        key, offset = read_str(data, offset)
+        props[key], offset = read_value(data, offset)
+    return props, offset
+
+
+class BinaryOperationEncoder:
+    def __init__(self, segment_size: int = 65536) -> None:
+        """Encodes operations into the binary record format (see module doc).
+        The encoder keeps the string table of the current segment, so it
+        must be used for a single output, in order.
+
+        :param segment_size: Optional. The number of operations per segment.
+        Smaller segments keep string tables small, and allow finer
+        splitting of the file.
+        """
+        if segment_size < 1:
+            raise ValueError(f"segment_size must be positive, but got {segment_size}")
+        self.segment_size = segment_size
+        self._strings: Dict[str, int] = {}
+        self._segment_ops = segment_size
+        # the encoded global props of the segment
+        self._props_bodies = GlobalPropsCache(self._props_body)
+        self._segment_props_body: Optional[bytes] = None
+        self._process_threads: Dict[Tuple[Optional[int], Optional[int]], bytes] = {}
+
+    def start_segment(self, out: bytearray, global_props: Mapping[str, Any]) -> None:
+        self._strings.clear()
+        self._segment_ops = 0
+        self._segment_props_body = body = self._props_bodies.get(global_props)
+        out += SYNC
+        write_varint(out, len(body))
+        out += body
+
+    @staticmethod
+    def _props_body(global_props: Mapping[str, Any]) -> bytes:
+        body = bytearray()
+        write_props(body, global_props)
+        return bytes(body)
+
+    def _props_changed(self, global_props: Mapping[str, Any]) -> bool:
+        # the same snapshot has the same (cached) body, other props are
+        # compared by their encoding
+        body = self._props_bodies.get(global_props)
+        return body is not self._segment_props_body and body != self._segment_props_body
+
+    def _ref(self, out: bytearray, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            index = self._strings[value] = len(self._strings)
+            out.append(RECORD_STRING)
+            write_str(out, value)
+        return index
+
+    def encode(self, out: bytearray, op: Any, global_props: Mapping[str, Any]) -> None:
+        """Appends the records of `op` to `out`. A new segment is started
+        when the current one is full, or when global props changed."""
+        if (self._segment_ops >= self.segment_size
+                or self._props_changed(global_props)):
+            self.start_segment(out, global_props)
+        self._segment_ops += 1
+
+        # interned strings are defined before the operation record
+        name_ref = self._ref(out, op.name)
+        exception_type = op.exception_type
+        exception_type_ref = (
+            self._ref(out, exception_type) + 1 if exception_type is not None else 0
+        )
+        custom_props = op.custom_props
+        key_refs = [self._ref(out, key) for key in custom_props]
+
+        op_id = op.id.encode("utf-8")
+        correlation_id = op.correlation_id.encode("utf-8")
+        duration_ns = op.duration_ns
+        body = bytearray(varint(name_ref))
+        body += _INT64.pack(op.start_time_ns)
+        body += varint(duration_ns + 1 if duration_ns is not None else 0)
+        body.append(RESULT_CODES[op.result])
+        body += varint(len(op_id))
+        body += op_id
+        body += varint(len(correlation_id))
+        body += correlation_id
+        write_optional_str(body, op.parent_id)
+        body += varint(exception_type_ref)
+        write_optional_str(body, op.exception_msg)
+        body += varint(len(key_refs))
+        for key_ref, value in zip(key_refs, custom_props.values()):
+            body += varint(key_ref)
+            write_value(body, value)
+        # the same few processes and threads emit all operations
+        process_thread = (op.process_id, op.thread_id)
+        encoded_process_thread = self._process_threads.get(process_thread)
+        if encoded_process_thread is None:
+            process_id, thread_id = process_thread
+            encoded_process_thread = (
+                varint(process_id + 1 if process_id is not None else 0)
+                + varint(thread_id + 1 if thread_id is not None else 0)
+            )
+            if len(self._process_threads) >= 1024:
+                self._process_threads.clear()
+            self._process_threads[process_thread] = encoded_process_thread
+        body += encoded_process_thread
+        write_optional_str(body, op.traceback_fingerprint)
+        depth = op.depth
+        body += varint(depth + 1 if depth is not None else 0)
+
+        out.append(RECORD_OPERATION)
+        out += varint(len(body))
+        out += body
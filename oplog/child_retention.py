@@ -0,0 +1,14 @@
+from enum import Enum, auto
+
+
+class ChildRetention(Enum):
+    # every child is kept in `child_ops` until the parent is collected
+    ALL = auto()
+    # children are kept while they are referenced elsewhere
+    WEAKREF = auto()
+    # only the last `max_child_ops` children are kept
+    RING = auto()
+    # no children are kept, only `child_count` and `failed_child_count`
+    SUMMARY = auto()
+    # children are not tracked at all
+    NONE = auto()
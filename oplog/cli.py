@@ -0,0 +1,394 @@
+"""The `oplog` command line: queries over operation log files.
+
+    oplog stats oplogs.csv --name "FluentCalculator.*" --since 1h
+    oplog filter oplogs.opb --result Failure --output-format csv
+    oplog trees oplogs.opb --name "checkout.*"
+
+Files (CSV, JSON lines or binary, see `oplog.readers`) are streamed, in
+constant memory. `stats` can read chunks of the files on many processes
+(`--jobs`).
+"""
+import argparse
+import datetime
+import fnmatch
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from oplog.latency_histogram import percentile_rank
+from oplog.operation_stats import OperationStats
+from oplog.readers import FORMATS, OperationRecord, open_reader, split, to_csv, to_json_lines
+from oplog.readers.log_files import MIN_CHUNK_SIZE
+from oplog.traces import TraceTreeBuilder, TraceTreeStats, aggregate
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+_DURATION_UNITS_S = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_RELATIVE_TIME = re.compile(r"^(\d+(?:\.\d+)?)([smhd])$")
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def parse_time(value: str, now_ns: Optional[int] = None) -> int:
+    """Wall-clock ns of a time argument: an ISO 8601 time (UTC, unless it has
+    an offset, or a `Z` suffix), or a duration before now, such as `90s`,
+    `15m`, `1h` or `2d`."""
+    match = _RELATIVE_TIME.match(value)
+    if match:
+        now_ns = now_ns if now_ns is not None else time.time_ns()
+        amount, unit = match.groups()
+        return now_ns - int(float(amount) * _DURATION_UNITS_S[unit] * 1_000_000_000)
+    if value[-1:] in ("Z", "z"):
+        # `fromisoformat` accepts `Z` as of Python 3.11 only
+        value = value[:-1] + "+00:00"
+    try:
+        moment = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid time `{value}`, expected an ISO 8601 time or a duration (e.g., 1h)"
+        ) from None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // datetime.timedelta(microseconds=1) * 1000
+
+
+def parse_percentiles(value: str) -> Tuple[float, ...]:
+    try:
+        percentiles = tuple(float(percentile) for percentile in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid percentiles `{value}`") from None
+    if not all(0 <= percentile <= 100 for percentile in percentiles):
+        raise argparse.ArgumentTypeError(f"percentiles must be between 0 and 100, but got `{value}`")
+    return percentiles
+
+
+class RecordFilter:
+    def __init__(self,
+                 names: Sequence[str] = (),
+                 result: Optional[str] = None,
+                 correlation_id: Optional[str] = None,
+                 since_ns: Optional[int] = None,
+                 until_ns: Optional[int] = None) -> None:
+        """Matches records by all the given criteria.
+
+        :param names: Optional. Name patterns (`fnmatch` style, e.g., `Calculator.*`),
+        a record matches if it matches any of them.
+        :param result: Optional. The result of the operation (e.g., `Failure`).
+        :param correlation_id: Optional. The correlation id of the operation.
+        :param since_ns: Optional. Operations that started at or after it (wall-clock ns).
+        :param until_ns: Optional. Operations that started before it (wall-clock ns).
+        """
+        self.names = tuple(names)
+        self.result = result
+        self.correlation_id = correlation_id
+        self.since_ns = since_ns
+        self.until_ns = until_ns
+        self._name_pattern = (
+            re.compile("|".join(fnmatch.translate(name) for name in self.names))
+            if self.names else None
+        )
+        # a log has few distinct names, each is matched once
+        self._name_matches: Dict[str, bool] = {}
+
+    def _matches_name(self, name: str) -> bool:
+        matches = self._name_matches.get(name)
+        if matches is None:
+            matches = self._name_matches[name] = self._name_pattern.match(name) is not None  # type: ignore[union-attr]
+        return matches
+
+    def __call__(self, record: OperationRecord) -> bool:
+        if self._name_pattern is not None and not self._matches_name(record.name):
+            return False
+        if self.result is not None and record.result != self.result:
+            return False
+        if self.correlation_id is not None and record.correlation_id != self.correlation_id:
+            return False
+        if self.since_ns is not None or self.until_ns is not None:
+            start_time_ns = record.start_time_ns
+            if start_time_ns is None:
+                return False
+            if self.since_ns is not None and start_time_ns < self.since_ns:
+                return False
+            if self.until_ns is not None and start_time_ns >= self.until_ns:
+                return False
+        return True
+
+    def __getstate__(self):
+        # the compiled pattern is rebuilt, the matches cache is not shipped
+        return self.names, self.result, self.correlation_id, self.since_ns, self.until_ns
+
+    def __setstate__(self, state) -> None:
+        self.__init__(*state)  # type: ignore[misc]
+
+
+class NameSummary:
+    """Rollup of the (finished) operations of a name, with exact durations
+    when requested (which takes memory per operation)."""
+
+    __slots__ = ("stats", "durations")
+
+    def __init__(self, name: str, exact: bool = False) -> None:
+        self.stats = OperationStats(name=name, result=None)
+        self.durations: Optional[List[int]] = [] if exact else None
+
+    def record(self, record: OperationRecord) -> None:
+        self.stats.record(record.duration_ns, record.is_successful)  # type: ignore[arg-type]
+        if self.durations is not None:
+            self.durations.append(record.duration_ns)  # type: ignore[arg-type]
+
+    def merge(self, other: "NameSummary") -> None:
+        self.stats.merge(other.stats)
+        if self.durations is not None and other.durations is not None:
+            self.durations.extend(other.durations)
+
+    @property
+    def error_rate(self) -> float:
+        return self.stats.error_count / self.stats.count if self.stats.count else 0.0
+
+    def percentiles(self, percentiles: Sequence[float]) -> List[Optional[int]]:
+        """Percentiles of the durations (ns), exact if durations are kept,
+        approximate otherwise (see `oplog.latency_histogram.LatencyHistogram`)."""
+        if self.durations is None:
+            return [self.stats.histogram.percentile(percentile) for percentile in percentiles]
+        durations = sorted(self.durations)
+        if not durations:
+            return [None for _ in percentiles]
+        # nearest rank, as the histogram
+        return [durations[percentile_rank(percentile, len(durations)) - 1]
+                for percentile in percentiles]
+
+
+def summarize(records: Iterable[OperationRecord],
+              record_filter: RecordFilter,
+              exact: bool = False) -> Dict[str, NameSummary]:
+    """Rolls up matching, finished records per operation name."""
+    summaries: Dict[str, NameSummary] = {}
+    for record in records:
+        if record.duration_ns is None or not record_filter(record):
+            continue
+        summary = summaries.get(record.name)
+        if summary is None:
+            summary = summaries[record.name] = NameSummary(record.name, exact)
+        summary.record(record)
+    return summaries
+
+
+def _summarize_chunk(task: Tuple[str, Optional[str], int, Optional[int], RecordFilter, bool]
+                     ) -> Dict[str, NameSummary]:
+    filename, format, start, end, record_filter, exact = task
+    # the ranges of `split` are aligned to records
+    return summarize(open_reader(filename, format, start, end, aligned=True), record_filter, exact)
+
+
+def _jobs(jobs: int) -> int:
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def stats(filenames: Sequence[str],
+          record_filter: RecordFilter,
+          format: Optional[str] = None,
+          exact: bool = False,
+          jobs: int = 1,
+          min_chunk_size: int = MIN_CHUNK_SIZE) -> Dict[str, NameSummary]:
+    """Rolls up the matching records of files per operation name.
+    With many `jobs` (0 is a job per CPU), files are split into chunks
+    (of at least `min_chunk_size` bytes), summarized on a pool of
+    processes, and merged."""
+    jobs = _jobs(jobs)
+    tasks = [
+        (filename, format, start, end, record_filter, exact)
+        for filename in filenames
+        for start, end in (split(filename, jobs, min_chunk_size, format) if jobs > 1 else [(0, None)])
+    ]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(min(jobs, len(tasks))) as executor:
+            chunk_summaries = list(executor.map(_summarize_chunk, tasks))
+    else:
+        chunk_summaries = [_summarize_chunk(task) for task in tasks]
+
+    summaries: Dict[str, NameSummary] = {}
+    for chunk_summary in chunk_summaries:
+        for name, summary in chunk_summary.items():
+            if name in summaries:
+                summaries[name].merge(summary)
+            else:
+                summaries[name] = summary
+    return dict(sorted(summaries.items()))
+
+
+def _format_percentile(percentile: float) -> str:
+    return f"p{percentile:g}".replace(".", "_")
+
+
+def _format_ms(duration_ns: Optional[int]) -> str:
+    return f"{duration_ns / 1_000_000:.3f}" if duration_ns is not None else "-"
+
+
+def write_stats(summaries: Dict[str, NameSummary],
+                percentiles: Sequence[float],
+                stream,
+                as_json: bool = False) -> None:
+    if as_json:
+        output = {
+            name: {
+                "count": summary.stats.count,
+                "error_count": summary.stats.error_count,
+                "error_rate": summary.error_rate,
+                **{
+                    f"{_format_percentile(percentile)}_ns": value
+                    for percentile, value in zip(percentiles, summary.percentiles(percentiles))
+                },
+            }
+            for name, summary in summaries.items()
+        }
+        stream.write(json.dumps(output, indent=2) + "\n")
+        return
+
+    header = ["name", "count", "errors", "error_rate",
+              *[f"{_format_percentile(percentile)}_ms" for percentile in percentiles]]
+    rows = [
+        [name, str(summary.stats.count), str(summary.stats.error_count), f"{summary.error_rate:.2%}",
+         *[_format_ms(value) for value in summary.percentiles(percentiles)]]
+        for name, summary in summaries.items()
+    ]
+    _write_table(header, rows, stream)
+
+
+def _write_table(header: List[str], rows: List[List[str]], stream, text_columns: Sequence[int] = (0,)) -> None:
+    widths = [max(len(row[column]) for row in [header, *rows]) for column in range(len(header))]
+    for row in [header, *rows]:
+        # text columns are aligned left, numbers right
+        cells = [cell.ljust(width) if column in text_columns else cell.rjust(width)
+                 for column, (cell, width) in enumerate(zip(row, widths))]
+        stream.write("  ".join(cells).rstrip() + "\n")
+
+
+def trees(filenames: Sequence[str],
+          root_filter: RecordFilter,
+          format: Optional[str] = None,
+          max_pending_trees: int = 10_000) -> Tuple[Dict[str, TraceTreeStats], TraceTreeBuilder]:
+    """Rebuilds the trace trees of files (read in order, on a single
+    process, as trees may span chunks), and rolls them up per root
+    operation name, for roots that match `root_filter`."""
+    builder = TraceTreeBuilder(max_pending_trees=max_pending_trees)
+    records = itertools.chain.from_iterable(open_reader(filename, format) for filename in filenames)
+    matching_trees = (
+        tree for tree in builder.build(records)
+        if tree.root is not None and root_filter(tree.root.record)
+    )
+    return dict(sorted(aggregate(matching_trees).items())), builder
+
+
+def write_trees(tree_stats: Dict[str, TraceTreeStats], top: int, stream, as_json: bool = False) -> None:
+    if as_json:
+        output = {name: root_stats.to_dict() for name, root_stats in tree_stats.items()}
+        stream.write(json.dumps(output, indent=2) + "\n")
+        return
+
+    header = ["root", "trees", "operations", "p50_ms", "p99_ms", "mean_fan_out", "max_fan_out",
+              "critical_path"]
+    rows = [
+        [name, str(root_stats.tree_count), str(root_stats.node_count),
+         _format_ms(root_stats.histogram.percentile(50)), _format_ms(root_stats.histogram.percentile(99)),
+         f"{root_stats.mean_fan_out:.1f}", str(root_stats.max_fan_out),
+         ", ".join(f"{op_name} {share:.1%}" for op_name, share in root_stats.critical_path_shares(top))]
+        for name, root_stats in tree_stats.items()
+    ]
+    _write_table(header, rows, stream, text_columns=(0, len(header) - 1))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="oplog", description="Query operation log files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sources = argparse.ArgumentParser(add_help=False)
+    sources.add_argument("files", nargs="+", help="Operation log files (CSV, JSON lines or binary).")
+    sources.add_argument("--format", choices=FORMATS, default=None,
+                         help="The format of the files, detected by default.")
+
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--name", action="append", default=[], dest="names",
+                         help="Operation name pattern (e.g., 'Calculator.*'), may be repeated.")
+    filters.add_argument("--result", help="Operation result (e.g., Failure).")
+    filters.add_argument("--correlation-id", help="Operation correlation id.")
+    filters.add_argument("--since", type=parse_time,
+                         help="Operations that started at or after it: "
+                              "an ISO 8601 time (UTC, unless it has an offset), "
+                              "or a duration before now (e.g., 1h).")
+    filters.add_argument("--until", type=parse_time,
+                         help="Operations that started before it (as --since).")
+
+    stats_parser = commands.add_parser(
+        "stats", parents=[sources, filters],
+        help="Count, error rate and duration percentiles per operation name.",
+    )
+    stats_parser.add_argument("--percentiles", type=parse_percentiles, default=DEFAULT_PERCENTILES,
+                              help="Comma separated percentiles (default: 50,90,99).")
+    stats_parser.add_argument("--exact", action="store_true",
+                              help="Exact percentiles, keeping every duration in memory. "
+                                   "By default, percentiles are approximate (within ~6%%).")
+    stats_parser.add_argument("--jobs", type=int, default=1,
+                              help="Number of processes, reading chunks of the files (0 is a process per CPU).")
+    stats_parser.add_argument("--json", action="store_true", help="Write the stats as JSON.")
+
+    filter_parser = commands.add_parser("filter", parents=[sources, filters],
+                                        help="Write the matching operations.")
+    filter_parser.add_argument("--output-format", choices=("jsonl", "csv"), default="jsonl",
+                               help="The output format (default: jsonl).")
+
+    trees_parser = commands.add_parser(
+        "trees", parents=[sources],
+        help="Rebuild trace trees (by correlation id and parent id), and report their "
+             "fan-out and critical path per root operation name.",
+    )
+    trees_parser.add_argument("--name", action="append", default=[], dest="names",
+                              help="Root operation name pattern, may be repeated.")
+    trees_parser.add_argument("--top", type=int, default=3,
+                              help="Number of operations listed on the critical path (default: 3).")
+    trees_parser.add_argument("--max-pending-trees", type=int, default=10_000,
+                              help="Maximum number of trees held in memory while waiting for their root.")
+    trees_parser.add_argument("--json", action="store_true", help="Write the stats as JSON.")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "trees":
+            tree_stats, builder = trees(args.files, RecordFilter(names=args.names), args.format,
+                                        args.max_pending_trees)
+            write_trees(tree_stats, args.top, sys.stdout, as_json=args.json)
+            if builder.evicted_trees:
+                sys.stderr.write(f"{parser.prog}: {builder.evicted_trees} incomplete trees "
+                                 f"(without a root) were skipped\n")
+            return 0
+        record_filter = RecordFilter(
+            names=args.names,
+            result=args.result,
+            correlation_id=args.correlation_id,
+            since_ns=args.since,
+            until_ns=args.until,
+        )
+        if args.command == "stats":
+            summaries = stats(args.files, record_filter, args.format, args.exact, args.jobs)
+            write_stats(summaries, args.percentiles, sys.stdout, as_json=args.json)
+        else:
+            for index, filename in enumerate(args.files):
+                records = filter(record_filter, open_reader(filename, args.format))
+                if args.output_format == "csv":
+                    to_csv(records, sys.stdout, header=index == 0)
+                else:
+                    to_json_lines(records, sys.stdout)
+    except BrokenPipeError:
+        # the output was closed early (e.g., piped to `head`), stdout is
+        # redirected so flushing it at exit does not fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+    return 0
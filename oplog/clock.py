@@ -0,0 +1,77 @@
+import datetime
+import time
+from typing import Dict, Tuple
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+_SECOND_FORMAT = "%Y-%m-%d %H:%M:%S"
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class Clock:
+    """A single time source for operations.
+
+    Operations only read the monotonic performance counter. Wall-clock time
+    is derived from it, using an anchor (the offset between the wall clock
+    and the performance counter) that is captured once and re-synced
+    periodically, to follow wall clock adjustments (e.g., NTP).
+    """
+
+    def __init__(self, resync_interval_s: float = 60.0, format_cache_size: int = 64) -> None:
+        self.resync_interval_ns = int(resync_interval_s * 1_000_000_000)
+        self.format_cache_size = format_cache_size
+        # epoch second -> formatted "%Y-%m-%d %H:%M:%S"
+        self._second_strs: Dict[int, str] = {}
+        # formatted "%Y-%m-%d %H:%M:%S" -> epoch second
+        self._second_values: Dict[str, int] = {}
+        self._anchor: Tuple[int, int] = (0, 0)
+        self.resync()
+
+    def resync(self) -> None:
+        perf_ns = time.perf_counter_ns()
+        wall_ns = time.time_ns()
+        # (offset of wall clock from perf counter, next resync perf counter)
+        self._anchor = (wall_ns - perf_ns, perf_ns + self.resync_interval_ns)
+
+    def wall_offset_ns(self, perf_ns: int) -> int:
+        """The offset to add to a performance counter value to get wall-clock
+        nanoseconds since the epoch."""
+        offset_ns, next_resync_ns = self._anchor
+        if perf_ns >= next_resync_ns:
+            self.resync()
+            offset_ns, _ = self._anchor
+        return offset_ns
+
+    @staticmethod
+    def to_datetime(wall_ns: int) -> datetime.datetime:
+        """A naive UTC datetime (as `datetime.utcnow()`) of wall-clock ns."""
+        return _EPOCH + datetime.timedelta(microseconds=wall_ns // 1000)
+
+    def format(self, wall_ns: int) -> str:
+        """Format wall-clock ns with `TIME_FORMAT`.
+        The formatting of the second part is cached per second of wall time."""
+        second, remainder_ns = divmod(wall_ns, 1_000_000_000)
+        second_str = self._second_strs.get(second)
+        if second_str is None:
+            if len(self._second_strs) >= self.format_cache_size:
+                self._second_strs.clear()
+            second_str = (_EPOCH + datetime.timedelta(seconds=second)).strftime(_SECOND_FORMAT)
+            self._second_strs[second] = second_str
+        return f"{second_str}.{remainder_ns // 1000:06d}"
+
+    def parse(self, value: str) -> int:
+        """Parse a `TIME_FORMAT` string (as written by `format`) into
+        wall-clock ns. The parsing of the second part is cached as well."""
+        second_str, _, fraction = value.partition(".")
+        second = self._second_values.get(second_str)
+        if second is None:
+            if len(self._second_values) >= self.format_cache_size:
+                self._second_values.clear()
+            delta = datetime.datetime.strptime(second_str, _SECOND_FORMAT) - _EPOCH
+            second = self._second_values[second_str] = delta.days * 86_400 + delta.seconds
+        if not fraction:
+            return second * 1_000_000_000
+        # up to microseconds, as `TIME_FORMAT`
+        return second * 1_000_000_000 + int(fraction.ljust(6, "0")[:6]) * 1000
+
+
+clock = Clock()
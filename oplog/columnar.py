@@ -0,0 +1,78 @@
+"""The oplog columnar file format.
+
+A file is a sequence of row groups, followed by a JSON footer:
+
+    MAGIC
+    row group 0: column chunk 0, column chunk 1, ...
+    row group 1: ...
+    footer (JSON): schema, dictionaries and the offset/length of every chunk
+    footer length (uint64, little endian)
+    MAGIC
+
+Every column chunk is self-contained, so a reader can load a single
+column by seeking to its chunks, without parsing the rest of the file.
+
+Column types:
+    int64: array of int64 values (little endian).
+    int8: array of int8 values. Used for small enums (e.g., `result`).
+    dict: array of int32 codes into a per-file dictionary of strings
+        (stored in the footer). -1 is a null.
+    string: array of int32 lengths (-1 is a null), followed by the
+        concatenated utf-8 bytes.
+"""
+import sys
+from array import array
+from typing import List, Optional, Sequence
+
+MAGIC = b"OPLCOL1\n"
+FOOTER_LENGTH_SIZE = 8
+
+INT64 = "int64"
+INT8 = "int8"
+DICT = "dict"
+STRING = "string"
+
+CUSTOM_PROPS_PREFIX = "custom_props."
+
+_TYPECODES = {INT64: "q", INT8: "b", DICT: "i"}
+
+# result column codes
+RESULT_CODES = {None: -1, "Success": 0, "Failure": 1}
+RESULTS = {code: result for result, code in RESULT_CODES.items()}
+
+_IS_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def encode_numbers(column_type: str, values: Sequence[int]) -> bytes:
+    encoded = array(_TYPECODES[column_type], values)
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        encoded.byteswap()
+    return encoded.tobytes()
+
+
+def decode_numbers(column_type: str, data: bytes) -> array:
+    decoded = array(_TYPECODES[column_type])
+    decoded.frombytes(data)
+    if _IS_BIG_ENDIAN:  # pragma: no cover
+        decoded.byteswap()
+    return decoded
+
+
+def encode_strings(values: Sequence[Optional[str]]) -> bytes:
+    encoded = [value.encode("utf-8") if value is not None else None for value in values]
+    lengths = encode_numbers(DICT, [len(value) if value is not None else -1 for value in encoded])
+    return lengths + b"".join(value for value in encoded if value is not None)
+
+
+def decode_strings(data: bytes, num_rows: int) -> List[Optional[str]]:
+    lengths_size = num_rows * 4
+    lengths = decode_numbers(DICT, data[:lengths_size])
+    values: List[Optional[str]] = []
+    offset = lengths_size
+    for length in lengths:
+        if length < 0:
+            values.append(None)
+        else:
+            values.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+    return values
@@ -0,0 +1,3 @@
+from .context import submit_with_context, map_with_context  # noqa: F401
+from .operation_thread_pool_executor import OperationThreadPoolExecutor  # noqa: F401
+from .operation_process_pool_executor import OperationProcessPoolExecutor  # noqa: F401
@@ -0,0 +1,68 @@
+import contextvars
+import functools
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from oplog.operation import OperationReference, active_operation
+
+
+def run_in_parent(parent: Optional[OperationReference],
+                  fn: Callable[..., Any],
+                  *args: Any,
+                  **kwargs: Any) -> Any:
+    """Runs `fn` with `parent` as the active operation, so operations
+    created by `fn` are its children (in another process)."""
+    token = active_operation.set(parent)  # type: ignore[arg-type]
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        active_operation.reset(token)
+
+
+def run_in_context(context: contextvars.Context,
+                   fn: Callable[..., Any],
+                   *args: Any,
+                   **kwargs: Any) -> Any:
+    """Runs `fn` in a copy of `context`. A context cannot be entered by two
+    threads at once, so every call (e.g., of a `map`) gets its own copy."""
+    return context.copy().run(fn, *args, **kwargs)
+
+
+def wrap_in_context(executor: Executor, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Binds `fn` to the active operation of the caller, in a form that can
+    be submitted to `executor`.
+
+    For process pools, the active operation is carried as a picklable
+    `OperationReference` (its id, correlation id and sampling decision).
+    Otherwise, `fn` runs in a copy of the caller's context (as with
+    `asyncio.to_thread`), which also carries other context variables.
+    """
+    if isinstance(executor, ProcessPoolExecutor):
+        parent = active_operation.get()
+        reference = OperationReference.of(parent) if parent is not None else None
+        return functools.partial(run_in_parent, reference, fn)
+    return functools.partial(run_in_context, contextvars.copy_context(), fn)
+
+
+def submit_with_context(executor: Executor,
+                        fn: Callable[..., Any],
+                        *args: Any,
+                        **kwargs: Any) -> Future:
+    """Like `executor.submit`, but operations created by `fn` are children of
+    the caller's active operation (and share its correlation id).
+
+    Works with any executor. To ship operations that finish in worker
+    processes back to this process, use `OperationProcessPoolExecutor`.
+    """
+    return executor.submit(wrap_in_context(executor, fn), *args, **kwargs)
+
+
+def map_with_context(executor: Executor,
+                     fn: Callable[..., Any],
+                     *iterables: Iterable[Any],
+                     timeout: Optional[float] = None,
+                     chunksize: int = 1) -> Iterator[Any]:
+    """Like `executor.map`, with the context propagation of `submit_with_context`."""
+    return executor.map(
+        wrap_in_context(executor, fn), *iterables, timeout=timeout, chunksize=chunksize
+    )
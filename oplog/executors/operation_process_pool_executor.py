@@ -0,0 +1,139 @@
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from oplog.executors.context import run_in_parent
+from oplog.operation import Operation, OperationReference, active_operation
+from oplog.sinks.queue_operation_sink import QueueOperationSink
+
+# the sink of the current worker process, see `_init_worker`
+_worker_sink: Optional[QueueOperationSink] = None
+_worker_flush_interval_s = 0.0
+_worker_last_flush = 0.0
+
+
+def _init_worker(ops_queue: Any,
+                 batch_size: int,
+                 flush_interval_s: float,
+                 config: Dict[str, Any],
+                 global_props: Dict[str, Any],
+                 initializer: Optional[Callable[..., Any]],
+                 initargs: Iterable[Any]) -> None:
+    global _worker_sink, _worker_flush_interval_s, _worker_last_flush
+    if initializer is not None:
+        initializer(*initargs)
+    _worker_sink = QueueOperationSink(ops_queue, batch_size=batch_size)
+    _worker_flush_interval_s = flush_interval_s
+    _worker_last_flush = time.monotonic()
+    # remaining operations are shipped when the worker exits
+    Finalize(_worker_sink, _worker_sink.flush, exitpriority=10)
+    Operation.config(sinks=[_worker_sink], **config)
+    Operation._publish_global_props(global_props)
+
+
+def _run_task(parent: Optional[OperationReference],
+              fn: Callable[..., Any],
+              *args: Any,
+              **kwargs: Any) -> Any:
+    try:
+        return run_in_parent(parent, fn, *args, **kwargs)
+    finally:
+        _flush_worker_sink()
+
+
+def _flush_worker_sink() -> None:
+    global _worker_last_flush
+    if _worker_sink is None:
+        return
+    now = time.monotonic()
+    if now - _worker_last_flush >= _worker_flush_interval_s:
+        _worker_last_flush = now
+        _worker_sink.flush()
+
+
+class OperationProcessPoolExecutor(ProcessPoolExecutor):
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 mp_context: Any = None,
+                 initializer: Optional[Callable[..., Any]] = None,
+                 initargs: Iterable[Any] = (),
+                 batch_size: int = 512,
+                 flush_interval_s: float = 1.0,
+                 **kwargs: Any) -> None:
+        """A `ProcessPoolExecutor` that propagates the submitting caller's
+        active operation into the workers, and ships operations that finish
+        in the workers back to this process.
+
+        Tasks run with an `OperationReference` of the caller's active operation
+        (its id, correlation id and sampling decision) as their parent.
+        In the workers, operations are pickled and sent in batches to a
+        listener thread of this process, which dispatches them to this
+        process' sinks or handlers. A batch is sent when it reaches
+        `batch_size` operations, at the end of a task if `flush_interval_s`
+        passed since the last one (0 sends one batch per task), and when
+        the worker exits. All operations are dispatched by the time
+        `shutdown(wait=True)` returns.
+
+        Workers use the global props and the configuration of this process
+        at creation time (`logger_name`, child retention, and a pickled copy
+        of the id generator), and replace any sinks configured by
+        `initializer`. Operations are serialized in this process, with its
+        serializer. Sampling rules (other than the inherited head decision)
+        do not apply in the workers.
+        For the other arguments, refer to `ProcessPoolExecutor`.
+        """
+        if mp_context is None:
+            mp_context = multiprocessing.get_context()
+        self._ops_queue = mp_context.SimpleQueue()
+        super().__init__(
+            max_workers,
+            mp_context,
+            initializer=_init_worker,
+            initargs=(
+                self._ops_queue,
+                batch_size,
+                flush_interval_s,
+                {
+                    # ops are logged (by the listener) to the logger they were bound to
+                    "logger_name": Operation._logger_name,
+                    "id_generator": Operation._id_generator,
+                    "child_retention": Operation._child_retention,
+                    "max_child_ops": Operation._max_child_ops,
+                },
+                Operation.global_props.to_dict(),
+                initializer,
+                tuple(initargs),
+            ),
+            **kwargs,
+        )
+        self._listener = threading.Thread(
+            target=self._listen,
+            name=f"{self.__class__.__name__}-listener",
+            daemon=True,
+        )
+        self._listener.start()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        parent = active_operation.get()
+        reference = OperationReference.of(parent) if parent is not None else None
+        return super().submit(_run_task, reference, fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+        if wait and self._listener.is_alive():
+            # workers have exited, so every batch is already in the queue
+            self._ops_queue.put(None)
+            self._listener.join()
+
+    def _listen(self) -> None:
+        while True:
+            batch = self._ops_queue.get()
+            if batch is None:
+                return
+            for op in batch:
+                level = logging.getLevelName(op.log_level) if op.log_level else logging.INFO
+                op._dispatch(level=level)
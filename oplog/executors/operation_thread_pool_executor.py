@@ -0,0 +1,14 @@
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class OperationThreadPoolExecutor(ThreadPoolExecutor):
+    """A `ThreadPoolExecutor` whose tasks run in a copy of the submitting
+    caller's context. Operations created by a task are children of the
+    caller's active operation, and share its correlation id and sampling
+    decision. `map` goes through `submit`, so it propagates the context too.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(contextvars.copy_context().run, fn, *args, **kwargs)
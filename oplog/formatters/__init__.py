@@ -1,3 +1,4 @@
 from .csv_operation_formatter import CsvOperationFormatter  # noqa: F401
 from .verbose_operation_formatter import VerboseOperationFormatter  # noqa: F401
+from .json_operation_formatter import JsonOperationFormatter  # noqa: F401
 from .base_operation_formatter import BaseOperationFormatter  # noqa: F401
@@ -1,15 +1,127 @@
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
 from oplog.formatters.base_operation_formatter import BaseOperationFormatter
+from oplog.global_props import GlobalPropsCache
 from oplog.operation import Operation
 
+DEFAULT_COLUMNS = (
+    "start_time_utc_str",
+    "duration_ms",
+    "name",
+    "correlation_id",
+    "result",
+    "exception_type",
+    # so operation trees can be rebuilt (see `oplog.traces`)
+    "id",
+    "parent_id",
+    "depth",
+)
+# the default columns of earlier versions, in headerless files
+LEGACY_DEFAULT_COLUMNS = DEFAULT_COLUMNS[:6]
+
+CUSTOM_PROPS_PREFIX = "custom_props."
+GLOBAL_PROPS_PREFIX = "global_props."
+
+
+def escape(value: Any) -> str:
+    """A quoted CSV field (RFC 4180). None is an empty field."""
+    if value is None:
+        return '""'
+    value = str(value)
+    if '"' in value:
+        value = value.replace('"', '""')
+    return f'"{value}"'
+
 
 class CsvOperationFormatter(BaseOperationFormatter):
+    def __init__(self,
+                 columns: Sequence[str] = DEFAULT_COLUMNS,
+                 custom_props: Sequence[str] = (),
+                 global_props: Sequence[str] = ()) -> None:
+        """Formats operations as CSV rows, all fields quoted and embedded
+        quotes doubled (as in RFC 4180). The column schema is compiled once,
+        in the constructor. Rows are terminated by the caller (see
+        `format_ops`), by default with a line feed rather than the CRLF of
+        RFC 4180, which CSV readers (e.g., `csv.reader`) accept as well.
+
+        :param columns: Optional. Operation attributes to write, in order.
+        :param custom_props: Optional. Custom props to write (after `columns`), as
+        `custom_props.<prop name>` columns. A missing prop is an empty field.
+        :param global_props: Optional. Global props to write (after `custom_props`), as
+        `global_props.<prop name>` columns.
+        """
+        super().__init__()
+        for column in columns:
+            if not column.isidentifier() or not hasattr(Operation, column):
+                raise ValueError(f"`{column}` is not an operation attribute")
+        self.columns = tuple(columns)
+        self.custom_props = tuple(custom_props)
+        self.global_props = tuple(global_props)
+
+        self._format_row = self._row_formatter(self.columns, self.custom_props)
+        self._global_fields = GlobalPropsCache(self._escape_global_props)
+
+    @staticmethod
+    def _row_formatter(columns: Sequence[str], custom_props: Sequence[str]) -> Callable[[Operation], str]:
+        # the row of the schema is a generated f-string (as `dataclasses`
+        # generates methods), as fast as a hand-written one. e.g., for
+        # columns ("name", "result"):
+        #
+        #   def format_row(op):
+        #       f0 = op.name
+        #       f0 = "" if f0 is None else f"{f0}"
+        #       f1 = op.result
+        #       f1 = "" if f1 is None else f"{f1}"
+        #       if '"' in f0 or '"' in f1:
+        #           f0 = f0.replace('"', '""')
+        #           f1 = f1.replace('"', '""')
+        #       return f'"{f0}","{f1}"'
+        #
+        # columns are attribute names (checked in `__init__`), and props
+        # are embedded as string literals (with `repr`)
+        getters = [f"op.{column}" for column in columns]
+        getters += [f"op.custom_props.get({prop!r})" for prop in custom_props]
+        if not getters:
+            return lambda op: ""
+        fields = [f"f{index}" for index in range(len(getters))]
+        lines = ["def format_row(op):"]
+        for field, getter in zip(fields, getters):
+            lines.append(f"    {field} = {getter}")
+            lines.append(f'    {field} = "" if {field} is None else f"{{{field}}}"')
+        lines.append("    if " + " or ".join(f"'\"' in {field}" for field in fields) + ":")
+        lines.extend(f"        {field} = {field}.replace('\"', '\"\"')" for field in fields)
+        lines.append("    return f'" + ",".join(f'"{{{field}}}"' for field in fields) + "'")
+        namespace: Dict[str, Any] = {}
+        exec("\n".join(lines), namespace)
+        return namespace["format_row"]
+
+    def _escape_global_props(self, global_props: Mapping[str, Any]) -> str:
+        return ",".join([escape(global_props.get(prop)) for prop in self.global_props])
+
+    @property
+    def column_names(self) -> List[str]:
+        return (list(self.columns)
+                + [f"{CUSTOM_PROPS_PREFIX}{prop}" for prop in self.custom_props]
+                + [f"{GLOBAL_PROPS_PREFIX}{prop}" for prop in self.global_props])
+
+    def header(self) -> str:
+        """The header row of the schema."""
+        return ",".join(escape(column) for column in self.column_names)
+
     def format_op(self, op: Operation) -> str:
-        csv_row = [
-            f'"{op.start_time_utc_str}"',
-            f'"{str(op.duration_ms)}"',
-            f'"{op.name}"',
-            f'"{op.correlation_id}"',
-            f'"{op.result}"',
-            f'"{str(op.exception_type)}"',
-        ]
-        return ','.join(csv_row)
+        row = self._format_row(op)
+        if self.global_props:
+            # read through the operation, so records of other processes
+            # (see `oplog.readers`) are formatted with their own global props
+            global_fields = self._global_fields.get(op.global_props)
+            return f"{row},{global_fields}" if row else global_fields
+        return row
+
+    def format_ops(self, ops: Sequence[Operation], terminator: str = "\n") -> str:
+        """Format many operations into a single string, each row terminated
+        (pass a CRLF terminator for the line breaks of RFC 4180)."""
+        if not ops:
+            return ""
+        # rows without global props are the generated rows, as they are
+        format_op = self.format_op if self.global_props else self._format_row
+        return terminator.join(map(format_op, ops)) + terminator
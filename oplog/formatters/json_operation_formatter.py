@@ -0,0 +1,135 @@
+import json
+import math
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from oplog.formatters.base_operation_formatter import BaseOperationFormatter
+from oplog.global_props import GlobalPropsCache
+from oplog.operation import Operation
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# compact, non-JSON values (e.g., of custom props) are written as strings.
+# NaN and infinity are not JSON, they raise a ValueError (see `_stdlib_encode`)
+_json_encode = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=str, allow_nan=False
+).encode
+
+
+def _stdlib_encode(props: Mapping[str, Any]) -> str:
+    try:
+        return _json_encode(props)
+    except ValueError:
+        # non-finite floats are written as null, as orjson does. a ValueError
+        # of another cause (e.g., a circular reference) is raised again
+        return _json_encode({
+            key: None if isinstance(value, float) and not math.isfinite(value) else value
+            for key, value in props.items()
+        })
+
+
+def _orjson_encode(props: Mapping[str, Any]) -> str:
+    return orjson.dumps(props, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# the encoded values of fields that take a few values
+_RESULTS = {None: "null", "Success": '"Success"', "Failure": '"Failure"'}
+_NO_EXCEPTION = ',"exception_type":null,"exception_msg":null,"traceback_fingerprint":null'
+
+
+def _str(value: Optional[str]) -> str:
+    return encode_basestring(value) if value is not None else "null"
+
+
+def _int(value: Optional[int]) -> str:
+    return str(value) if value is not None else "null"
+
+
+class JsonOperationFormatter(BaseOperationFormatter):
+    def __init__(self, use_orjson: bool = True) -> None:
+        """Formats operations as single line JSON objects (JSON lines), with
+        the keys of `oplog.readers.JSON_KEYS`, in order. The keys, and the
+        fragments that rarely change (process and thread ids, global props),
+        are encoded once, and only the values of an operation are encoded
+        per operation. Props that are not JSON serializable are written as
+        strings.
+
+        :param use_orjson: Optional. If True, props are encoded with `orjson`,
+        when it is installed (`pip install op-log[json]`).
+        """
+        super().__init__()
+        self.use_orjson = use_orjson and orjson is not None
+        # props encoders, tried in order (the last never fails on values)
+        self._props_encoders: Tuple[Callable[[Mapping[str, Any]], str], ...] = (
+            (_orjson_encode, _stdlib_encode) if self.use_orjson else (_stdlib_encode,)
+        )
+        self._process_threads: Dict[Tuple[Optional[int], Optional[int]], str] = {}
+        self._global_props_fragments = GlobalPropsCache(self._global_props_fragment)
+
+    def encode_props(self, props: Mapping[str, Any]) -> str:
+        """Encodes props as a JSON object. Values that are not JSON
+        serializable are written as strings, and non-finite floats as null."""
+        if not props:
+            return "{}"
+        if not isinstance(props, dict):
+            # e.g., `oplog.global_props.GlobalProps`, encoders expect a dict
+            props = dict(props)
+        for encode in self._props_encoders:
+            try:
+                return encode(props)
+            except (TypeError, ValueError):
+                # e.g., keys that are not strings, ints out of the range of
+                # orjson, or circular references
+                continue
+        return _stdlib_encode({str(key): str(value) for key, value in props.items()})
+
+    def _process_thread_fragment(self, process_id: Optional[int], thread_id: Optional[int]) -> str:
+        # the same few processes and threads emit all operations
+        key = (process_id, thread_id)
+        fragment = self._process_threads.get(key)
+        if fragment is None:
+            fragment = f',"process_id":{_int(process_id)},"thread_id":{_int(thread_id)}'
+            if len(self._process_threads) >= 1024:
+                self._process_threads.clear()
+            self._process_threads[key] = fragment
+        return fragment
+
+    def _global_props_fragment(self, global_props: Mapping[str, Any]) -> str:
+        return f',"global_props":{self.encode_props(global_props)}}}'
+
+    def format_op(self, op: Operation) -> str:
+        # the keys are in the order of `oplog.readers.JSON_KEYS`
+        result = op.result
+        exception_type = op.exception_type
+        exception_msg = op.exception_msg
+        # an operation that did not fail has no traceback either
+        if exception_type is None and exception_msg is None:
+            exception = _NO_EXCEPTION
+        else:
+            exception = (f',"exception_type":{_str(exception_type)}'
+                         f',"exception_msg":{_str(exception_msg)}'
+                         f',"traceback_fingerprint":{_str(op.traceback_fingerprint)}')
+        custom_props = op.custom_props
+        return (
+            f'{{"start_time_utc":{_str(op.start_time_utc_str)}'
+            f',"start_time_ns":{_int(op.start_time_ns)}'
+            f',"duration_ns":{_int(op.duration_ns)}'
+            f',"name":{_str(op.name)}'
+            f',"result":{_RESULTS[result] if result in _RESULTS else _str(result)}'
+            f',"id":{_str(op.id)}'
+            f',"correlation_id":{_str(op.correlation_id)}'
+            f',"parent_id":{_str(op.parent_id)}'
+            f',"depth":{_int(op.depth)}'
+            f'{exception}'
+            f'{self._process_thread_fragment(op.process_id, op.thread_id)}'
+            f',"custom_props":{self.encode_props(custom_props) if custom_props else "{}"}'
+            f'{self._global_props_fragments.get(op.global_props)}'
+        )
+
+    def format_ops(self, ops: Sequence[Operation], terminator: str = "\n") -> str:
+        """Format many operations into a single string, each line terminated."""
+        format_op = self.format_op
+        return "".join([format_op(op) + terminator for op in ops])
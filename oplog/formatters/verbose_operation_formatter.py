@@ -1,22 +1,33 @@
-from oplog.operation_step import OperationStep
+from typing import Any, Mapping
 
 from oplog.formatters.base_operation_formatter import BaseOperationFormatter
+from oplog.global_props import GlobalPropsCache
 from oplog.operation import Operation
 
 
 class VerboseOperationFormatter(BaseOperationFormatter):
+    def __init__(self) -> None:
+        super().__init__()
+        self._global_props_fragments = GlobalPropsCache(self._render_global_props)
+
     def format_op(self, op: Operation) -> str:
-        duration = f" ({op.duration_ms}ms)" if op.step == OperationStep.END else ""
+        # finished operations (and `oplog.readers` records) have a duration
+        duration = f" ({op.duration_ms}ms)" if op.duration_ns is not None else ""
         result = op.result if op.result else "started"
         msg = (f"{op.start_time_utc_str}{duration}: "
                f"[{op.name} / {result}]")
+        # child operations are linked to their parent, roots have depth 0
+        parent_id = op.parent_id
+        if parent_id is not None:
+            msg += f" (parent_id={parent_id}, depth={op.depth})"
         if op.exception_type:
             msg += f" {op.exception_type}: {op.exception_msg}"
 
         if len(op.custom_props) > 0:
             msg += f" {op.custom_props}"
 
-        if len(op.global_props) > 0:
-            msg += f" {op.global_props}"
+        return msg + self._global_props_fragments.get(op.global_props)
 
-        return msg
+    @staticmethod
+    def _render_global_props(global_props: Mapping[str, Any]) -> str:
+        return f" {global_props}" if len(global_props) > 0 else ""
@@ -0,0 +1,102 @@
+import os
+from typing import Any, Callable, Dict, Generic, Iterator, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class GlobalProps(Mapping[str, Any]):
+    """An immutable, versioned snapshot of the global props of operations
+    (see `Operation.add_global`). Adding a prop publishes a new snapshot
+    with a higher version, so readers never lock, and caches of anything
+    derived from the props (e.g., their rendering by a formatter) hold the
+    snapshot they were derived from, and compare it by identity.
+
+    Snapshots travel with operations pickled to other processes (e.g., to
+    the collector of an `oplog.OperationFunnel`). Versions are counted per
+    process, so a snapshot is identified by its `origin` (the id of the
+    process that created it) and `version`. Unpickled copies of the same
+    snapshot are the same object, so caches keep working in the receiving
+    process.
+    """
+
+    __slots__ = ("_props", "version", "origin")
+
+    def __init__(self,
+                 props: Optional[Mapping[str, Any]] = None,
+                 version: int = 0,
+                 origin: Optional[int] = None) -> None:
+        # a private copy, so the snapshot cannot change after it is published
+        self._props: Dict[str, Any] = dict(props) if props is not None else {}
+        self.version = version
+        self.origin = origin if origin is not None else os.getpid()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._props[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # faster than the `Mapping` mixin, used per formatted operation
+        return self._props.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._props
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._props)
+
+    def __len__(self) -> int:
+        return len(self._props)
+
+    def with_prop(self, key: str, value: Any) -> "GlobalProps":
+        """A new snapshot, of the next version, with the prop added."""
+        props = dict(self._props)
+        props[key] = value
+        return GlobalProps(props, self.version + 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._props)
+
+    def __reduce__(self):
+        return _restore, (self._props, self.version, self.origin)
+
+    def __repr__(self) -> str:
+        # rendered as a plain dict (e.g., by `VerboseOperationFormatter`)
+        return repr(self._props)
+
+
+class GlobalPropsCache(Generic[T]):
+    """A value derived from global props (e.g., their rendering by a
+    formatter), derived once per snapshot. Plain mappings (e.g., of
+    `oplog.readers` records) are not cached, their value is derived every
+    time. The cached (snapshot, value) pair is replaced as a whole, so
+    concurrent readers need no lock."""
+
+    __slots__ = ("derive", "_cached")
+
+    def __init__(self, derive: Callable[[Mapping[str, Any]], T]) -> None:
+        self.derive = derive
+        self._cached: Tuple[Optional[GlobalProps], Any] = (None, None)
+
+    def get(self, global_props: Mapping[str, Any]) -> T:
+        if not isinstance(global_props, GlobalProps):
+            return self.derive(global_props)
+        snapshot, value = self._cached
+        if snapshot is not global_props:
+            value = self.derive(global_props)
+            self._cached = (global_props, value)
+        return value
+
+
+# unpickled snapshots, by (origin, version)
+_restored: Dict[Tuple[int, int], GlobalProps] = {}
+
+
+def _restore(props: Dict[str, Any], version: int, origin: int) -> GlobalProps:
+    key = (origin, version)
+    snapshot = _restored.get(key)
+    # the props are compared too, in case the origin's process id was reused
+    if snapshot is None or snapshot._props != props:
+        snapshot = GlobalProps(props, version, origin)
+        if len(_restored) >= 1024:
+            _restored.clear()
+        _restored[key] = snapshot
+    return snapshot
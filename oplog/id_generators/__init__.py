@@ -0,0 +1,5 @@
+from .base_id_generator import BaseIdGenerator  # noqa: F401
+from .uuid4_id_generator import Uuid4IdGenerator  # noqa: F401
+from .buffered_random_id_generator import BufferedRandomIdGenerator  # noqa: F401
+from .time_ordered_id_generator import TimeOrderedIdGenerator  # noqa: F401
+from .counter_id_generator import CounterIdGenerator  # noqa: F401
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class BaseIdGenerator(ABC):
+    """Generates operation ids and correlation ids.
+    Configured with `Operation.config(id_generator=...)`.
+
+    Generators are pickled into the workers of
+    `oplog.executors.OperationProcessPoolExecutor`. A generator with
+    per-process state (e.g., locks or buffers) defines `__reduce__`, so the
+    workers create their own."""
+
+    @abstractmethod
+    def generate(self) -> str:  # pragma: no cover
+        raise NotImplementedError("generate is required")
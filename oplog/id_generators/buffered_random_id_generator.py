@@ -0,0 +1,58 @@
+import os
+import threading
+
+from oplog.id_generators.base_id_generator import BaseIdGenerator
+
+_UUID_SIZE = 16
+_VARIANT_CHARS = "89ab"
+
+
+class BufferedRandomIdGenerator(BaseIdGenerator):
+    """Random (version 4) UUIDs, sliced out of a per-thread buffer that is
+    filled with a single `os.urandom` call per batch of ids."""
+
+    # bumped in forked children, so they do not reuse the parent's buffers
+    _fork_generation = 0
+
+    def __init__(self, batch_size: int = 256) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.batch_size = batch_size
+        self._local = threading.local()
+
+    def __reduce__(self):
+        # buffers are per-process (and per-thread), only the batch size is pickled
+        return type(self), (self.batch_size,)
+
+    def _refill(self) -> bytes:
+        buffer = os.urandom(_UUID_SIZE * self.batch_size)
+        self._local.buffer = buffer
+        self._local.generation = BufferedRandomIdGenerator._fork_generation
+        self._local.offset = 0
+        return buffer
+
+    def generate(self) -> str:
+        local = self._local
+        try:
+            buffer = local.buffer
+            offset = local.offset
+            if (offset >= len(buffer)
+                    or local.generation != BufferedRandomIdGenerator._fork_generation):
+                raise AttributeError
+        except AttributeError:
+            buffer = self._refill()
+            offset = 0
+        local.offset = offset + _UUID_SIZE
+
+        h = buffer[offset:offset + _UUID_SIZE].hex()
+        # version 4, RFC 4122 variant
+        variant = _VARIANT_CHARS[int(h[16], 16) & 0x3]
+        return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        cls._fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=BufferedRandomIdGenerator._after_fork)
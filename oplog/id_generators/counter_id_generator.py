@@ -0,0 +1,40 @@
+import itertools
+import os
+import random
+import weakref
+from typing import Iterator
+
+from oplog.id_generators.base_id_generator import BaseIdGenerator
+
+
+class CounterIdGenerator(BaseIdGenerator):
+    """Per-process counter ids: `<process prefix>-<counter>`.
+    The prefix combines the process id with random bits, so ids are unique
+    across processes (and restarts). Forked children get a new prefix."""
+
+    _instances: "weakref.WeakSet[CounterIdGenerator]" = weakref.WeakSet()
+
+    def __init__(self) -> None:
+        self._reset()
+        CounterIdGenerator._instances.add(self)
+
+    def __reduce__(self):
+        # other processes get a prefix of their own
+        return type(self), ()
+
+    def _reset(self) -> None:
+        self.prefix = f"{os.getpid():x}{random.getrandbits(32):08x}"
+        self._counter: Iterator[int] = itertools.count(1)
+
+    def generate(self) -> str:
+        # `next` on itertools.count is atomic, no lock needed
+        return f"{self.prefix}-{next(self._counter):x}"
+
+    @classmethod
+    def _after_fork(cls) -> None:
+        for instance in list(cls._instances):
+            instance._reset()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=CounterIdGenerator._after_fork)
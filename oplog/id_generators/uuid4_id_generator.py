@@ -0,0 +1,10 @@
+import uuid
+
+from oplog.id_generators.base_id_generator import BaseIdGenerator
+
+
+class Uuid4IdGenerator(BaseIdGenerator):
+    """Random (version 4) UUIDs, using `uuid.uuid4`. This is the default."""
+
+    def generate(self) -> str:
+        return str(uuid.uuid4())
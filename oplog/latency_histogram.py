@@ -0,0 +1,108 @@
+import math
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# each power of two range is split into 2**SUB_BUCKET_BITS buckets,
+# so a bucket is at most 1/16 (~6%) wider than its lower bound
+SUB_BUCKET_BITS = 4
+_SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(value: int) -> int:
+    if value < _SUB_BUCKET_COUNT:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - _SUB_BUCKET_COUNT
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """The (inclusive) lower and upper values of a bucket."""
+    if index < 2 * _SUB_BUCKET_COUNT:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = (index & (_SUB_BUCKET_COUNT - 1)) + _SUB_BUCKET_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+
+def percentile_rank(percentile: float, count: int) -> int:
+    """The 1-based nearest rank of a percentile (0-100) of `count` values:
+    the smallest rank with at least `percentile`% of the values at or below it."""
+    # multiplied first, `percentile / 100` is inexact (e.g., 0.07 * 100 > 7)
+    return max(1, math.ceil(percentile * count / 100))
+
+
+class LatencyHistogram:
+    """A compact, log-bucketed histogram of (non-negative) integer values,
+    such as `Operation.duration_ns`. Buckets are stored sparsely, and
+    histograms are mergeable (e.g., across threads or processes)."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, value: int) -> None:
+        index = bucket_index(value)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def record_many(self, values: Iterable[int]) -> None:
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        counts = self.counts
+        for index, count in other.counts.items():
+            counts[index] = counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def percentile(self, percentile: float) -> Optional[int]:
+        """An approximate percentile (0-100), within the bucket precision."""
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"percentile must be between 0 and 100, but got {percentile}")
+        if self.count == 0:
+            return None
+        rank = percentile_rank(percentile, self.count)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = bucket_bounds(index)
+                value = (lower + upper) // 2
+                # the exact extremes are known
+                return min(max(value, self.min), self.max)  # type: ignore[type-var]
+        return self.max  # pragma: no cover
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A JSON-serializable form, see `from_dict`."""
+        return {
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
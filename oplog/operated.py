@@ -1,9 +1,29 @@
-from functools import update_wrapper
+import inspect
+from functools import wraps
 from typing import Optional
 from oplog.operation import Operation
 
 
 class Operated:
+    _enabled: bool = True
+
+    @classmethod
+    def config(cls, enabled: bool = True) -> None:
+        """
+        Configure global behavior of all operated functions.
+
+        :param enabled: Optional. If False, `@Operated` returns the decorated
+        function unchanged, so it has no per-call overhead. Since this is
+        applied at decoration time, it should be configured before the
+        decorated modules are imported.
+        """
+        # Any attributes that are set here should be cleaned in `factory_reset`
+        cls._enabled = enabled
+
+    @classmethod
+    def factory_reset(cls) -> None:
+        cls._enabled = True
+
     def __init__(self, name: Optional[str] = None, suppress: bool = False):
         """Creates an underlying operation. Refer to Operation for more details.
         This should be used as a decorator on a function or method.
@@ -12,25 +32,68 @@ class Operated:
         self.name = name
         self.suppress = suppress
 
+    @staticmethod
+    def _get_op_name(func) -> str:
+        function_name = func.__name__
+        try:
+            # get class name if possible
+            qualifier_name = func.__qualname__.split(".")[0]
+        except AttributeError:
+            # otherwise, get module name
+            qualifier_name = func.__module__
+
+        return f"{qualifier_name}.{function_name}"
+
     def __call__(self, func):
-        def wrapper(*args, **kwargs):
-            if self.name is not None:
-                op_name = self.name
-            else:
-                function_name = func.__name__
+        if not Operated._enabled:
+            return func
+
+        # resolved once, at decoration time
+        op_name = self.name if self.name is not None else self._get_op_name(func)
+        suppress = self.suppress
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def coroutine_wrapper(*args, **kwargs):
+                # the operation spans the awaited execution, not just
+                # the creation of the coroutine object
+                async with Operation(name=op_name, suppress=suppress):
+                    return await func(*args, **kwargs)
+
+            return coroutine_wrapper
+
+        if inspect.isasyncgenfunction(func):
+            @wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                # the operation spans the whole iteration. it is active only
+                # while the generator runs, so operations of the consumer
+                # (between items) are not parented under it
+                op = Operation(name=op_name, suppress=suppress)
+                op.__enter__()
+                agen = func(*args, **kwargs)
                 try:
-                    # get class name if possible
-                    qualifier_name = func.__qualname__.split(".")[0]
-                except AttributeError:
-                    # otherwise, get module name
-                    qualifier_name = func.__module__
+                    async for item in agen:
+                        op._pop_active()
+                        try:
+                            yield item
+                        finally:
+                            op._push_active()
+                except GeneratorExit:
+                    # the consumer stopped iterating early, not a failure
+                    await agen.aclose()
+                    op.__exit__(None, None, None)
+                    raise
+                except BaseException as e:
+                    if not op.__exit__(type(e), e, e.__traceback__):
+                        raise
+                else:
+                    op.__exit__(None, None, None)
 
-                op_name = f"{qualifier_name}.{function_name}"
-                
-            with Operation(name=op_name, suppress=self.suppress):
-                result = func(*args, **kwargs)
+            return async_gen_wrapper
 
-            return result
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with Operation(name=op_name, suppress=suppress):
+                return func(*args, **kwargs)
 
-        update_wrapper(wrapper, func)
         return wrapper
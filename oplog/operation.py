@@ -1,43 +1,128 @@
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 import datetime
-import inspect
 import logging
 import multiprocessing
+import sys
 import threading
 import time
-import traceback
-import uuid
-from contextlib import AbstractContextManager
-from typing import Any, Dict, Iterable, Optional, Type, List, Callable
+import weakref
+from collections import deque
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterable, Optional, Sequence, Tuple, Type, List, Callable
+)
 
+from oplog.child_retention import ChildRetention
+from oplog.clock import clock
 from oplog.exceptions import (
     GlobalOperationPropertyAlreadyExistsException,
     OperationPropertyAlreadyExistsException
 )
+from oplog.global_props import GlobalProps
+from oplog.id_generators.base_id_generator import BaseIdGenerator
+from oplog.id_generators.uuid4_id_generator import Uuid4IdGenerator
 from oplog.operation_step import OperationStep
+from oplog.sampler import Sampler
+from oplog.traceback_cache import TracebackKey, traceback_cache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from oplog.sinks.base_operation_sink import BaseOperationSink
+
 
-active_operation_stack: ContextVar[List['Operation']] = (
-    ContextVar("active_operation_stack", default=[])
+# the innermost active operation of the current context. the rest of the
+# active stack is reachable through `parent_op`, so entering and exiting
+# an operation costs O(1) regardless of the nesting depth.
+active_operation: ContextVar[Optional['Operation']] = (
+    ContextVar("active_operation", default=None)
 )
 
 
-class Operation(AbstractContextManager):
-    global_props: Dict[str, Any] = {}
+class _GlobalPropsAttribute:
+    """`Operation.global_props`. On the class, and on operations of this
+    process, the current global props of the process. On operations
+    unpickled from another process (e.g., by the collector of an
+    `oplog.OperationFunnel`), the global props of that process when the
+    operation was pickled."""
+
+    def __get__(self, op: Optional['Operation'], owner: Type['Operation']) -> GlobalProps:
+        if op is not None:
+            global_props = op._global_props
+            if global_props is not None:
+                return global_props
+        return owner._current_global_props
+
+
+class Operation:
+    # a compact, dict-less layout. timestamps are stored as raw integers
+    # and their datetime/str forms are materialised when they are read.
+    __slots__ = (
+        "parent_op", "depth", "_child_ops", "child_count", "failed_child_count",
+        "name", "suppress", "custom_props",
+        "duration_ns", "step", "is_successful", "result",
+        "exception_type", "exception_msg", "_traceback", "_traceback_key",
+        "_traceback_fingerprint",
+        "logger_name", "log_level",
+        "process_name", "process_id", "thread_name", "thread_id",
+        "_id", "_correlation_id", "_on_start", "_logger", "_enabled", "_sampled",
+        "_perf_start", "_perf_end", "_wall_offset_ns", "_active_token", "_global_props",
+        "__weakref__",
+    )
+
+    # an immutable snapshot, replaced (under `_global_props_lock`) when a prop
+    # is added, so operations and formatters read it without locking
+    global_props = _GlobalPropsAttribute()
+    _current_global_props = GlobalProps()
+    _global_props_lock = threading.Lock()
+    # lazy ids may be read first by several threads at once (e.g., children
+    # running in an `OperationThreadPoolExecutor`), the first one set wins
+    _ids_lock = threading.Lock()
     _serializer: Optional[Callable[['Operation'], str]] = None
     _logger_name: Optional[str] = None
+    _sinks: Tuple['BaseOperationSink', ...] = ()
+    _id_generator: BaseIdGenerator = Uuid4IdGenerator()
+    _sampler: Optional[Sampler] = None
+    _child_retention: ChildRetention = ChildRetention.ALL
+    _max_child_ops: int = 1000
+    # caller module name -> logger of the caller module
+    _caller_loggers: Dict[Optional[str], logging.Logger] = {}
 
     @classmethod
-    def config(cls, logger_name: Optional[str] = None, serializer: Optional[Callable[['Operation'], str]] = None) -> None:
+    def config(cls,
+               logger_name: Optional[str] = None,
+               serializer: Optional[Callable[['Operation'], str]] = None,
+               sinks: Optional[Sequence['BaseOperationSink']] = None,
+               id_generator: Optional[BaseIdGenerator] = None,
+               sampler: Optional[Sampler] = None,
+               child_retention: ChildRetention = ChildRetention.ALL,
+               max_child_ops: int = 1000) -> None:
         """
         Configure global behavior of all operations.
 
         :param serializer: Optional. A function that receives an operation
         and returns a string, to be formatted where relevant.
         :param logger_name: Optional. Will be used to fetch the named logger that will handle the operation logs.
+        :param sinks: Optional. Operation sinks (see `oplog.sinks`) that finished operations
+        are dispatched to directly, instead of logging them through the `logging` stack
+        (no `LogRecord` is created and logger levels do not apply).
+        :param id_generator: Optional. The strategy for generating operation ids and
+        correlation ids (see `oplog.id_generators`). Default is random UUIDs (version 4).
+        :param sampler: Optional. Decides which operations are logged (see `oplog.Sampler`).
+        If None, all operations are logged.
+        :param child_retention: Optional. How parents retain their child operations
+        in `child_ops` (see `oplog.ChildRetention`). Default is retaining all of them,
+        which keeps every descendant of a long-lived operation in memory.
+        :param max_child_ops: Optional. The number of children retained per parent,
+        when `child_retention` is `ChildRetention.RING`.
         """
+        if max_child_ops < 1:
+            raise ValueError(f"max_child_ops must be positive, but got {max_child_ops}")
         # Any attributes that are set here should be cleaned in `factory_reset`
         cls._serializer = serializer
         cls._logger_name = logger_name
+        cls._sinks = tuple(sinks) if sinks else ()
+        cls._id_generator = id_generator if id_generator is not None else Uuid4IdGenerator()
+        cls._sampler = sampler
+        cls._child_retention = child_retention
+        cls._max_child_ops = max_child_ops
 
     def __init__(self,
                  name: str,
@@ -56,75 +141,230 @@ class Operation(AbstractContextManager):
         (as well as on exit).
         """
         # Check if there's an active operation and assign parent-child relationship
-        self.parent_op: Optional[Operation] = None
-        self.child_ops: List[Operation] = []
-        if active_operation_stack.get() and active_operation_stack.get()[-1]:
-            self.parent_op = active_operation_stack.get()[-1]
-            self.parent_op.child_ops.append(self)
+        self.parent_op: Optional[Operation] = active_operation.get()
+        # the nesting level, 0 for a root operation
+        self.depth: int = self.parent_op.depth + 1 if self.parent_op is not None else 0
+        # the container is created with the first retained child
+        self._child_ops: Any = None
+        self.child_count = 0
+        self.failed_child_count = 0
+        if self.parent_op is not None:
+            self.parent_op._add_child(self)
 
         self.name = name
         self.suppress = suppress
         self._on_start = on_start
         self.custom_props: Dict[str, Any] = dict()
 
-        self.start_time_utc: Optional[datetime.datetime] = None
-        self.end_time_utc: Optional[datetime.datetime] = None
-        self.start_time_utc_str: Optional[str] = None
-        self.end_time_utc_str: Optional[str] = None
-        self.duration_ms: Optional[int] = None
+        # performance counter ns, wall-clock time is derived through
+        # `_wall_offset_ns`, see `oplog.clock.Clock`
+        self._perf_start: Optional[int] = None
+        self._perf_end: Optional[int] = None
+        self._wall_offset_ns = 0
         self.duration_ns: Optional[int] = None
-        self.id = str(uuid.uuid4())
+        self._id: Optional[str] = None
         self.step: Optional[OperationStep] = None
         self.is_successful: Optional[bool] = None
         self.result: Optional[str] = None
         self.exception_type: Optional[str] = None
         self.exception_msg: Optional[str] = None
+        self._traceback: Any = ""
+        # formatting is deferred until the traceback is read
+        self._traceback_key: Optional[TracebackKey] = None
+        self._traceback_fingerprint: Optional[str] = None
+        # set on unpickled operations only, see `_GlobalPropsAttribute`
+        self._global_props: Optional[GlobalProps] = None
 
         self._logger = self._get_caller_logger()
         self.logger_name = self._logger.name
         self.log_level: Optional[str] = None
 
-        current_proc = multiprocessing.current_process()
-        self.process_name = current_proc.name
-        self.process_id = current_proc.pid
-        self.thread_name = threading.current_thread().name
-        self.thread_id = threading.get_ident()
+        # collected only when the operation is logged, see `_collect_metadata`
+        self.process_name: Optional[str] = None
+        self.process_id: Optional[int] = None
+        self.thread_name: Optional[str] = None
+        self.thread_id: Optional[int] = None
 
         # inheritable props
-        self.correlation_id: Optional[str] = None
-
-        self._perf_start: Optional[float] = None
+        self._correlation_id: Optional[str] = None
 
+        self._enabled = True
+        # head sampling is decided at the root, and inherited by descendants
+        if self.parent_op is not None:
+            self._sampled: bool = self.parent_op._sampled
+        elif self._sampler is not None:
+            self._sampled = self._sampler.sample_head(name)
+        else:
+            self._sampled = True
+        self._active_token: Optional[Token] = None
+
+    @property
+    def start_time_ns(self) -> Optional[int]:
+        """Wall-clock start time, in ns since the epoch."""
+        if self._perf_start is None:
+            return None
+        return self._perf_start + self._wall_offset_ns
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        """Wall-clock end time, in ns since the epoch."""
+        if self._perf_end is None:
+            return None
+        return self._perf_end + self._wall_offset_ns
+
+    @property
+    def start_time_utc(self) -> Optional[datetime.datetime]:
+        start_time_ns = self.start_time_ns
+        return clock.to_datetime(start_time_ns) if start_time_ns is not None else None
+
+    @property
+    def end_time_utc(self) -> Optional[datetime.datetime]:
+        end_time_ns = self.end_time_ns
+        return clock.to_datetime(end_time_ns) if end_time_ns is not None else None
+
+    @property
+    def start_time_utc_str(self) -> Optional[str]:
+        # time format example: 2023-06-22 06:27:53.922633
+        start_time_ns = self.start_time_ns
+        return clock.format(start_time_ns) if start_time_ns is not None else None
+
+    @property
+    def end_time_utc_str(self) -> Optional[str]:
+        end_time_ns = self.end_time_ns
+        return clock.format(end_time_ns) if end_time_ns is not None else None
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if self.duration_ns is None:
+            return None
+        return round(self.duration_ns / 1_000_000)
+
+    @property
+    def traceback(self) -> Any:
+        """The formatted traceback of a failed operation (a list of lines),
+        or an empty string. Formatted when first read, and shared by failures
+        with the same fingerprint (see `oplog.traceback_cache`)."""
+        key = self._traceback_key
+        if key is not None:
+            return traceback_cache.get(key).lines
+        return self._traceback
+
+    @traceback.setter
+    def traceback(self, value: Any) -> None:
+        self._traceback = value
+        self._traceback_key = None
+        self._traceback_fingerprint = None
+
+    @property
+    def traceback_fingerprint(self) -> Optional[str]:
+        """A short id of the exception type and the code locations of the
+        traceback. Repeated failures at the same site share it."""
+        key = self._traceback_key
+        if key is None:
+            return self._traceback_fingerprint
+        return traceback_cache.get(key).fingerprint
+
+    @property
+    def child_ops(self) -> List['Operation']:
+        """The retained child operations, according to the configured
+        `ChildRetention`. `child_count` counts all of them."""
+        children = self._child_ops
+        if children is None:
+            return []
+        if isinstance(children, list):
+            return children
+        if isinstance(children, weakref.WeakValueDictionary):
+            return list(children.values())
+        return list(children)
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        # allows rebuilding operation trees from logs
+        return self.parent_op.id if self.parent_op is not None else None
+
+    @property
+    def id(self) -> str:
+        # generated on first read, so operations that are never logged
+        # (or referenced by a logged descendant) do not pay for it
+        if self._id is None:
+            generated = self._id_generator.generate()
+            with self._ids_lock:
+                if self._id is None:
+                    self._id = generated
+        return self._id
+
+    @property
+    def correlation_id(self) -> str:
+        if self._correlation_id is None:
+            if self.parent_op is not None:
+                generated = self.parent_op.correlation_id
+            else:
+                generated = self._id_generator.generate()
+            with self._ids_lock:
+                if self._correlation_id is None:
+                    self._correlation_id = generated
+        return self._correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: Optional[str]) -> None:
+        self._correlation_id = value
 
     @classmethod
     def factory_reset(cls) -> None:
-        cls.global_props = {}
+        cls._publish_global_props({})
         cls._serializer = None
         cls._logger_name = None
+        cls._sinks = ()
+        cls._id_generator = Uuid4IdGenerator()
+        cls._sampler = None
+        cls._child_retention = ChildRetention.ALL
+        cls._max_child_ops = 1000
+        cls._caller_loggers = {}
 
     @classmethod
     def _get_caller_logger(cls) -> logging.Logger:
-        logger = None
         if cls._logger_name is not None:
-            logger = logging.getLogger(cls._logger_name)
-        else:
-            # try fetching the caller logger
-            stack = inspect.stack()
-            if len(stack) >= 3:
-                # the caller is the 3rd frame in the stack
-                caller_frame = stack[2]
-                if len(caller_frame) >= 1:
-                    # the caller module is the 1st element in the caller frame
-                    caller_module = inspect.getmodule(caller_frame[0])
-                    if caller_module is not None:
-                        logger = logging.getLogger(caller_module.__name__)
-
-            if logger is None:
-                # could not fetch the caller logger, using the root logger
-                logger = logging.getLogger()
-
+            return logging.getLogger(cls._logger_name)
+
+        # the caller is 2 frames up (this method, then `__init__`).
+        # only the caller frame is inspected, and its logger is cached
+        # per module name (not per code object, which may be created
+        # dynamically, e.g., by `exec`), so no stack walk or source
+        # reading takes place, and `logging`'s lock is not taken.
+        try:
+            caller_frame = sys._getframe(2)
+        except ValueError:
+            # could not fetch the caller frame, using the root logger
+            return logging.getLogger()
+
+        module_name = caller_frame.f_globals.get("__name__")
+        logger = cls._caller_loggers.get(module_name)
+        if logger is None:
+            # the root logger is used when the caller module is unknown
+            logger = logging.getLogger(module_name)
+            cls._caller_loggers[module_name] = logger
         return logger
 
+    def _add_child(self, child: 'Operation') -> None:
+        retention = self._child_retention
+        if retention is ChildRetention.NONE:
+            return
+        self.child_count += 1
+        if retention is ChildRetention.ALL:
+            if self._child_ops is None:
+                self._child_ops = []
+            self._child_ops.append(child)
+        elif retention is ChildRetention.RING:
+            if self._child_ops is None:
+                self._child_ops = deque(maxlen=self._max_child_ops)
+            self._child_ops.append(child)
+        elif retention is ChildRetention.WEAKREF:
+            if self._child_ops is None:
+                self._child_ops = weakref.WeakValueDictionary()
+            # keyed by the (unique) child number, to keep children ordered
+            # without hashing them (which would generate their ids)
+            self._child_ops[self.child_count] = child
+
     def __str__(self):
         if self._serializer is not None:
             return self.__class__._serializer(self)
@@ -134,75 +374,119 @@ class Operation(AbstractContextManager):
         return msg
 
     def __enter__(self) -> "Operation":
-        self.start_time_utc = datetime.datetime.utcnow()
-        # time format example: 2023-06-22 06:27:53.922633
-        self.start_time_utc_str = self.start_time_utc.strftime("%Y-%m-%d %H:%M:%S.%f")
-        self._perf_start = time.perf_counter_ns()
+        # checked once, when nothing consumes the record (the logger is
+        # above INFO), metadata collection is skipped altogether
+        self._enabled = bool(self._sinks) or self._logger.isEnabledFor(logging.INFO)
+        self._perf_start = perf_start = time.perf_counter_ns()
+        # both start and end are derived with the same offset, so they
+        # are consistent with the duration
+        self._wall_offset_ns = clock.wall_offset_ns(perf_start)
 
         self.step = OperationStep.START
 
-        self.set_inheritable_props()
-
         # Push the current operation onto the stack
-        active_operation_stack.set(active_operation_stack.get([]) + [self])
+        self._push_active()
 
-        if self._on_start:
-            self._logger.log(
-                level=logging.INFO,
-                msg=str(self),
-                extra={"oplog": self}
-            )
+        if self._on_start and self._enabled and self._sampled:
+            self._collect_metadata()
+            self._dispatch(level=logging.INFO)
 
         return self
 
     def set_inheritable_props(self) -> None:
-        if self.parent_op is not None:
+        # inheritable props are resolved lazily (when first read),
+        # this resolves them eagerly
+        if self._correlation_id is None and self.parent_op is not None:
             self.correlation_id = self.parent_op.correlation_id
+
+    def _dispatch(self, level: int) -> None:
+        if self._sinks:
+            for sink in self._sinks:
+                sink.handle(self)
         else:
-            self.correlation_id = str(uuid.uuid4())
+            self._logger.log(
+                level=level,
+                msg=str(self),
+                extra={"oplog": self}
+            )
 
-    def __exit__(self, exc_type, exc_value, exc_tb):
-        self.end_time_utc = datetime.datetime.utcnow()
-        self.end_time_utc_str = self.end_time_utc.strftime("%Y-%m-%d %H:%M:%S.%f")
+    def _collect_metadata(self) -> None:
+        if self.thread_id is not None:
+            return
+        current_proc = multiprocessing.current_process()
+        self.process_name = current_proc.name
+        self.process_id = current_proc.pid
+        self.thread_name = threading.current_thread().name
+        self.thread_id = threading.get_ident()
 
-        perf_end = time.perf_counter_ns()
-        self.duration_ms = round((perf_end - self._perf_start) / 1_000_000)
-        self.duration_ns = round(perf_end - self._perf_start)
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self._perf_end = perf_end = time.perf_counter_ns()
+        self.duration_ns = perf_end - self._perf_start
 
         self.step = OperationStep.END
 
         # Pop the current operation off the stack
-        current_stack = active_operation_stack.get([])
-        if current_stack:
-            current_stack.pop()
-            active_operation_stack.set(current_stack)
+        self._pop_active()
 
         is_success = exc_type is None
-        if is_success:
-            result = "Success"
-            tb = ""
-        else:
-            result = "Failure"
+        level = logging.INFO if is_success else logging.ERROR
+        self.is_successful = is_success
+        self.result = "Success" if is_success else "Failure"
+        self.log_level = logging.getLevelName(level)
+        self._traceback_key = None
+        if not is_success:
             self.exception_type = exc_type.__name__
             self.exception_msg = str(exc_value)
-            tb = traceback.extract_tb(exc_tb, limit=10).format()
+            parent_op = self.parent_op
+            if parent_op is not None and self._child_retention is not ChildRetention.NONE:
+                parent_op.failed_child_count += 1
 
-        self.is_successful = is_success
-        self.result = result
-        self.traceback = tb
-        level = logging.INFO if is_success else logging.ERROR
-        self.log_level = logging.getLevelName(level)
+        if not self._enabled and not (
+                level > logging.INFO and self._logger.isEnabledFor(level)):
+            # this will either suppress (if configured) or no,
+            # in case an error was thrown in context
+            return self.suppress
 
-        self._logger.log(
-            level=level,
-            msg=str(self),
-            extra={"oplog": self}
-        )
+        if not self._sampled:
+            sampler = self._sampler
+            if sampler is None or not sampler.keep_tail(self):
+                if sampler is not None:
+                    sampler.count_sampled_out()
+                return self.suppress
+
+        if not is_success:
+            # only the code locations are captured here (no formatting,
+            # and the frames are not kept alive)
+            self._traceback_key = traceback_cache.key(exc_type, exc_tb)
+
+        self._collect_metadata()
+
+        self._dispatch(level=level)
 
         # this will either suppress (if configured) or no,
         # in case an error was thrown in context
         return self.suppress
 
+    async def __aenter__(self) -> "Operation":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        return self.__exit__(exc_type, exc_value, exc_tb)
+
+    def _push_active(self) -> None:
+        self._active_token = active_operation.set(self)
+
+    def _pop_active(self) -> None:
+        token, self._active_token = self._active_token, None
+        if token is None:
+            return
+        try:
+            active_operation.reset(token)
+        except ValueError:
+            # exited in a different context than the one it was entered in
+            # (e.g., an async generator finalized by another task)
+            active_operation.set(self.parent_op)
+
     def __hash__(self):  # pragma: no cover
         return hash(self.id)
 
@@ -238,10 +522,100 @@ class Operation(AbstractContextManager):
 
     @classmethod
     def _add_global_prop(cls, property_name: str, value: Any) -> None:
-        if property_name in cls.global_props:
-            raise GlobalOperationPropertyAlreadyExistsException(prop_name=property_name)
-        cls.global_props[property_name] = value
+        with cls._global_props_lock:
+            if property_name in cls._current_global_props:
+                raise GlobalOperationPropertyAlreadyExistsException(prop_name=property_name)
+            cls._current_global_props = cls._current_global_props.with_prop(property_name, value)
+
+    @classmethod
+    def _publish_global_props(cls, props: Dict[str, Any]) -> None:
+        """Replaces all the global props. The version keeps increasing, so
+        caches of the previous props are never reused."""
+        with cls._global_props_lock:
+            cls._current_global_props = GlobalProps(props, cls._current_global_props.version + 1)
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        # operations are pickled to be shipped across processes (see
+        # `oplog.executors`). the parent is replaced by a reference, and
+        # children are not pickled along, so only this operation is copied.
+        # the state is a flat tuple of plain values, the cheapest to pickle.
+        parent_op = self.parent_op
+        step = self.step
+        return (
+            OperationReference.of(parent_op) if parent_op is not None else None,
+            step.value if step is not None else None,
+            self._logger.name,
+            # code objects (in the traceback key) are not picklable
+            self.traceback,
+            self.traceback_fingerprint,
+            # the global props of this process, shipped with the operation
+            self.global_props,
+            tuple([getattr(self, slot, None) for slot in _PICKLED_SLOTS]),
+        )
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        (parent_op, step, logger_name, traceback, traceback_fingerprint,
+         global_props, values) = state
+        self.parent_op = parent_op
+        self.step = OperationStep(step) if step is not None else None
+        self._logger = logging.getLogger(logger_name)
+        self._traceback = traceback
+        self._traceback_fingerprint = traceback_fingerprint
+        self._global_props = global_props
+        self._traceback_key = None
+        self._child_ops = None
+        self._active_token = None
+        for slot, value in zip(_PICKLED_SLOTS, values):
+            setattr(self, slot, value)
 
     def __repr__(self):  # pragma: no cover
         return f"<Operation name={self.name}>"
 
+
+# slots pickled as they are, see `Operation.__getstate__`
+_PICKLED_SLOTS = tuple(
+    slot for slot in Operation.__slots__
+    if slot not in (
+        "__weakref__", "parent_op", "step", "_logger", "_traceback",
+        "_traceback_fingerprint", "_traceback_key", "_child_ops", "_active_token",
+        "_global_props",
+    )
+)
+
+
+class OperationReference:
+    """A picklable snapshot of an operation's identity, that stands in as the
+    `parent_op` of operations in other processes (or of unpickled operations).
+    """
+    __slots__ = ("id", "correlation_id", "name", "depth", "_sampled",
+                 "child_count", "failed_child_count")
+
+    parent_op = None
+    parent_id = None
+    child_ops: List[Operation] = []
+
+    def __init__(self, id: str, correlation_id: str, name: str, sampled: bool = True, depth: int = 0):
+        self.id = id
+        self.correlation_id = correlation_id
+        self.name = name
+        self.depth = depth
+        self._sampled = sampled
+        self.child_count = 0
+        self.failed_child_count = 0
+
+    @classmethod
+    def of(cls, op: Any) -> "OperationReference":
+        if isinstance(op, OperationReference):
+            return op
+        return cls(id=op.id, correlation_id=op.correlation_id,
+                   name=op.name, sampled=op._sampled, depth=op.depth)
+
+    def _add_child(self, child: Operation) -> None:
+        self.child_count += 1
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self.id, self.correlation_id, self.name, self._sampled, self.depth)
+
+    def __repr__(self):  # pragma: no cover
+        return f"<OperationReference name={self.name} id={self.id}>"
+
@@ -0,0 +1,189 @@
+import multiprocessing
+import os
+import pickle
+import threading
+from multiprocessing.connection import Connection, Listener
+from typing import Any, Callable, List, Optional, Tuple
+
+from oplog.shared_memory_ring import SharedMemoryRing
+from oplog.sinks.base_operation_sink import BaseOperationSink
+from oplog.sinks.shared_memory_operation_sink import SharedMemoryOperationSink
+
+
+class OperationFunnel:
+    def __init__(self,
+                 sink_factory: Callable[[], BaseOperationSink],
+                 batch_size: int = 1024,
+                 poll_interval_s: float = 0.01,
+                 address: Any = None,
+                 authkey: Optional[bytes] = None,
+                 mp_context: Any = None) -> None:
+        """Funnels the operations of many worker processes (e.g., of a
+        gunicorn or uvicorn server) into a single sink, owned by a collector
+        process. Workers write encoded operations into their own shared
+        memory ring (see `oplog.sinks.SharedMemoryOperationSink`), and the
+        collector drains all rings, in batches, into the sink. Slow I/O,
+        and contention on the output file, are kept off the workers.
+
+        Start the funnel in the parent process, then connect each worker
+        (e.g., in a post-fork hook, or with `address` and `authkey` passed
+        to spawned workers):
+
+            funnel = OperationFunnel(functools.partial(FileOperationSink, formatter, "ops.log"))
+            funnel.start()
+            ...
+            # in a worker
+            Operation.config(sinks=[funnel.connect()])
+
+        :param sink_factory: Creates the sink, in the collector process.
+        Must be picklable when the collector is spawned.
+        :param batch_size: Optional. Maximum number of records read from a
+        ring at once.
+        :param poll_interval_s: Optional. How long the collector sleeps when
+        all rings are empty.
+        :param address: Optional. The address the collector listens on for
+        worker registrations (see `multiprocessing.connection.Listener`).
+        By default, a free address is chosen.
+        :param authkey: Optional. The key workers authenticate with.
+        By default, a random key.
+        :param mp_context: Optional. The `multiprocessing` context of the collector.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.sink_factory = sink_factory
+        self.batch_size = batch_size
+        self.poll_interval_s = poll_interval_s
+        self.address = address
+        self.authkey = authkey if authkey is not None else os.urandom(32)
+        self._mp_context = mp_context if mp_context is not None else multiprocessing.get_context()
+        self._stop_event = self._mp_context.Event()
+        self._collector: Optional[multiprocessing.process.BaseProcess] = None
+
+    def start(self) -> None:
+        """Starts the collector process, and waits until it listens."""
+        if self._collector is not None:
+            raise RuntimeError("funnel was already started")
+        receiver, sender = self._mp_context.Pipe(duplex=False)
+        self._collector = self._mp_context.Process(
+            target=_collect,
+            args=(self.sink_factory, self.address, self.authkey, self.batch_size,
+                  self.poll_interval_s, self._stop_event, sender),
+            name=f"{self.__class__.__name__}-collector",
+            daemon=True,
+        )
+        self._collector.start()
+        sender.close()
+        try:
+            self.address = receiver.recv()
+        except EOFError:
+            raise RuntimeError("funnel collector failed to start") from None
+        finally:
+            receiver.close()
+
+    def connect(self, capacity: int = 1 << 20, **kwargs: Any) -> SharedMemoryOperationSink:
+        """Creates a sink for the calling (worker) process, that writes into
+        a new ring of `capacity` bytes, drained by this funnel.
+        For other arguments, refer to `SharedMemoryOperationSink`.
+        """
+        if self.address is None:
+            raise RuntimeError("funnel was not started")
+        return SharedMemoryOperationSink.connect(
+            self.address, self.authkey, capacity=capacity, **kwargs
+        )
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Drains all rings, closes the sink and stops the collector.
+        Workers should close their sinks first, so nothing is left behind.
+        """
+        if self._collector is None:
+            return
+        self._stop_event.set()
+        self._collector.join(timeout)
+        self._collector = None
+
+    def __enter__(self) -> "OperationFunnel":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.stop()
+
+
+class _Collector:
+    """The state of the collector process: the sink and the registered rings."""
+
+    def __init__(self, sink: BaseOperationSink, batch_size: int) -> None:
+        self.sink = sink
+        self.batch_size = batch_size
+        self.rings: List[Tuple[Connection, SharedMemoryRing]] = []
+        self.closed = False
+        self._rings_lock = threading.Lock()
+
+    def accept(self, listener: Listener) -> None:
+        while True:
+            try:
+                connection = listener.accept()
+                ring = SharedMemoryRing.attach(connection.recv())
+                connection.send(True)
+            except (OSError, EOFError):
+                if self.closed:
+                    return
+                # a failed registration
+                continue
+            with self._rings_lock:
+                self.rings.append((connection, ring))
+
+    def drain(self) -> int:
+        """Reads a batch from every ring into the sink. Returns the number of
+        operations read. Rings of disconnected workers are detached once empty.
+        """
+        with self._rings_lock:
+            rings = list(self.rings)
+        drained = 0
+        for connection, ring in rings:
+            records = ring.get_batch(self.batch_size)
+            if records:
+                drained += len(records)
+                ops = [pickle.loads(record) for record in records]
+                try:
+                    self.sink.emit_batch(ops)
+                except Exception:
+                    # the collector must outlive a failing batch, operations
+                    # are retried one by one (with the sink's error handling)
+                    for op in ops:
+                        self.sink.handle(op)
+            elif connection.poll():
+                # the worker closed its sink (or exited), the ring is empty
+                with self._rings_lock:
+                    self.rings.remove((connection, ring))
+                connection.close()
+                ring.close()
+        return drained
+
+
+def _collect(sink_factory: Callable[[], BaseOperationSink],
+             address: Any,
+             authkey: bytes,
+             batch_size: int,
+             poll_interval_s: float,
+             stop_event: Any,
+             address_sender: Connection) -> None:
+    collector = _Collector(sink_factory(), batch_size)
+    listener = Listener(address, authkey=authkey)
+    address_sender.send(listener.address)
+    address_sender.close()
+    threading.Thread(target=collector.accept, args=(listener,), daemon=True).start()
+
+    while True:
+        stopping = stop_event.is_set()
+        if collector.drain():
+            continue
+        if stopping:
+            # everything written before stopping was drained
+            break
+        collector.sink.flush()
+        stop_event.wait(poll_interval_s)
+
+    collector.closed = True
+    listener.close()
+    collector.sink.close()
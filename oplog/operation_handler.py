@@ -24,4 +24,9 @@ class OperationHandler(logging.Handler):
             self.handler.setFormatter(formatter)
 
     def emit(self, record):
-        self.handler.emit(record)
\ No newline at end of file
+        # the wrapped handler may be shared (e.g., with other handlers)
+        self.handler.acquire()
+        try:
+            self.handler.emit(record)
+        finally:
+            self.handler.release()
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional
+
+from oplog.latency_histogram import LatencyHistogram
+
+
+class OperationStats:
+    """Rollup of finished operations with the same name and result."""
+
+    __slots__ = ("name", "result", "error_count", "histogram")
+
+    def __init__(self, name: str, result: Optional[str]) -> None:
+        self.name = name
+        self.result = result
+        self.error_count = 0
+        # holds count, sum, min and max as well
+        self.histogram = LatencyHistogram()
+
+    @property
+    def count(self) -> int:
+        return self.histogram.count
+
+    @property
+    def sum_ns(self) -> int:
+        return self.histogram.total
+
+    @property
+    def min_ns(self) -> Optional[int]:
+        return self.histogram.min
+
+    @property
+    def max_ns(self) -> Optional[int]:
+        return self.histogram.max
+
+    def record(self, duration_ns: int, is_successful: Optional[bool]) -> None:
+        self.histogram.record(duration_ns)
+        if is_successful is False:
+            self.error_count += 1
+
+    def merge(self, other: "OperationStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.error_count += other.error_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A JSON-serializable form, see `from_dict`."""
+        return {
+            "name": self.name,
+            "result": self.result,
+            "count": self.count,
+            "error_count": self.error_count,
+            "sum_ns": self.sum_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.histogram.percentile(50),
+            "p99_ns": self.histogram.percentile(99),
+            "histogram": self.histogram.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OperationStats":
+        stats = cls(name=data["name"], result=data["result"])
+        stats.error_count = data["error_count"]
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        return stats
+
+    def __repr__(self):  # pragma: no cover
+        return f"<OperationStats name={self.name} result={self.result} count={self.count}>"
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+
+class OverflowPolicy(Enum):
+    BLOCK = auto()
+    DROP_NEWEST = auto()
+    DROP_OLDEST = auto()
@@ -0,0 +1,154 @@
+import copy
+import logging
+import threading
+from collections import deque
+from typing import Deque, List, Optional
+
+from oplog.operation_handler import OperationHandler
+from oplog.operation_step import OperationStep
+from oplog.overflow_policy import OverflowPolicy
+
+
+class QueuedOperationHandler(OperationHandler):
+    def __init__(self,
+                 handler: logging.Handler,
+                 formatter: Optional[logging.Formatter] = None,
+                 capacity: int = 10_000,
+                 batch_size: int = 512,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 *args,
+                 **kwargs):
+        """An operation handler that hands records over to a bounded in-memory
+        queue, drained by a background writer thread into the wrapped handler.
+        Slow sinks (files, streams) are therefore kept off the thread that
+        closes the operation.
+
+        Args:
+            handler (logging.Handler): The handler records are written to.
+            formatter (Optional[logging.Formatter], optional): If None,
+                the handler's formatter will be used.
+            capacity (int, optional): Maximum number of queued records.
+            batch_size (int, optional): Maximum number of records written
+                by the writer thread before flushing the wrapped handler.
+            overflow_policy (OverflowPolicy, optional): What to do when the
+                queue is full. BLOCK waits for the writer, DROP_NEWEST drops
+                the emitted record and DROP_OLDEST drops the oldest queued one.
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, but got {capacity}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        super().__init__(handler, formatter, *args, **kwargs)
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+
+        # counters
+        self.queued_records = 0
+        self.dropped_records = 0
+
+        self._queue: Deque[logging.LogRecord] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._queue_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._queue_lock)
+        self._not_full = threading.Condition(self._queue_lock)
+        self._drained = threading.Condition(self._queue_lock)
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name=f"{self.__class__.__name__}-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    @property
+    def pending_records(self) -> int:
+        """Number of records that were queued but not written yet."""
+        with self._queue_lock:
+            return len(self._queue) + self._in_flight
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepares a record for the queue (as `logging.handlers.QueueHandler`
+        does). The operation of a record logged on start is still running,
+        and is formatted by the writer later, so the record gets a snapshot
+        of it. Finished operations do not change, and are queued as they are.
+        """
+        op = record.oplog
+        if op.step is OperationStep.END:
+            return record
+        record = copy.copy(record)
+        # a pickled copy, see `Operation.__getstate__`
+        record.oplog = copy.copy(op)
+        return record
+
+    def emit(self, record):
+        record = self.prepare(record)
+        with self._queue_lock:
+            while not self._closed and len(self._queue) >= self.capacity:
+                if self.overflow_policy is OverflowPolicy.BLOCK:
+                    self._not_full.wait()
+                elif self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                    self.dropped_records += 1
+                    return
+                else:
+                    self._queue.popleft()
+                    self.dropped_records += 1
+
+            if not self._closed:
+                self._queue.append(record)
+                self.queued_records += 1
+                self._not_empty.notify()
+                return
+
+        # the writer is gone (e.g., during shutdown), writing inline, outside
+        # of the lock, so a slow handler does not block other emitting threads
+        self._write_batch([record])
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._queue_lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    # closed and drained
+                    return
+                batch_size = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(batch_size)]
+                self._in_flight = batch_size
+                self._not_full.notify_all()
+
+            self._write_batch(batch)
+
+            with self._queue_lock:
+                self._in_flight = 0
+                if not self._queue:
+                    self._drained.notify_all()
+
+    def _write_batch(self, batch: List[logging.LogRecord]) -> None:
+        for record in batch:
+            try:
+                super().emit(record)
+            except Exception:
+                self.handleError(record)
+        self.handler.flush()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until all queued records are written by the writer thread."""
+        with self._queue_lock:
+            if self._writer.is_alive():
+                self._drained.wait_for(
+                    lambda: not self._queue and self._in_flight == 0,
+                    timeout=timeout,
+                )
+        self.handler.flush()
+
+    def close(self) -> None:
+        """Write all queued records and stop the writer thread."""
+        with self._queue_lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+        self.handler.flush()
+        super().close()
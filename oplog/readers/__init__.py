@@ -0,0 +1,8 @@
+from .operation_record import OperationRecord, JSON_KEYS  # noqa: F401
+from .columnar_operation_reader import ColumnarOperationReader  # noqa: F401
+from .binary_operation_reader import BinaryOperationReader  # noqa: F401
+from .converters import to_csv, to_json_lines  # noqa: F401
+from .csv_operation_reader import CsvOperationReader  # noqa: F401
+from .json_lines_operation_reader import JsonLinesOperationReader  # noqa: F401
+from .log_files import FORMATS, detect_format, open_reader, split  # noqa: F401
+from .sqlite_operation_reader import SqliteOperationReader  # noqa: F401
@@ -0,0 +1,224 @@
+import os
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from oplog import binary
+from oplog.readers.operation_record import OperationRecord
+
+_INT64 = struct.Struct("<q")
+
+
+class BinaryOperationReader:
+    # bytes read from the file at once
+    block_size = 1 << 20
+
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 start: int = 0,
+                 end: Optional[int] = None) -> None:
+        """Streams operation records out of binary operation files, written by
+        `oplog.sinks.BinaryFileOperationSink`. Memory use is constant (a
+        block of the file and the string table of a segment).
+
+        A byte range of the file can be read, to split a file into chunks
+        (e.g., one per process): the reader yields the segments that start
+        in `[start, end)`, even if they end after `end`.
+
+        :param filename: The path of the file to read.
+        :param start: Optional. Reading starts at the first segment at or after it.
+        :param end: Optional. Reading stops at the first segment at or after it.
+        Default is the end of the file.
+        """
+        self.filename = os.fspath(filename)
+        self.start = start
+        self.end = end
+        with open(self.filename, "rb") as f:
+            if f.read(len(binary.MAGIC)) != binary.MAGIC:
+                raise ValueError(f"{self.filename} is not an oplog binary file")
+
+    def __iter__(self) -> Iterator[OperationRecord]:
+        with open(self.filename, "rb") as f:
+            stream = _Stream(f, self.block_size)
+            if stream.seek_sync(max(self.start, len(binary.MAGIC))) is None:
+                return
+            end = self.end
+            strings: List[str] = []
+            global_props: Dict[str, Any] = {}
+            read_record = stream.read_record
+            while True:
+                record = read_record()
+                if record is None:
+                    return
+                record_type, body, position = record
+                if record_type == binary.RECORD_OPERATION:
+                    yield _decode_operation(body, strings, global_props)
+                elif record_type == binary.RECORD_STRING:
+                    strings.append(body.decode("utf-8"))
+                elif record_type == binary.RECORD_SYNC:
+                    if end is not None and position >= end:
+                        return
+                    global_props, _ = binary.read_props(body, 0)
+                    strings = []
+                # unknown record types (of later versions) are skipped
+
+
+class _Stream:
+    """A buffered, forward-only view of a file."""
+
+    def __init__(self, f: BinaryIO, block_size: int) -> None:
+        self._file = f
+        self._block_size = block_size
+        self._buffer = b""
+        self._offset = 0
+        # file position of the start of the buffer
+        self._buffer_position = 0
+
+    @property
+    def position(self) -> int:
+        return self._buffer_position + self._offset
+
+    def _fill(self, size: int) -> bool:
+        """Makes sure `size` bytes are buffered. False at the end of the file."""
+        available = len(self._buffer) - self._offset
+        if available >= size:
+            return True
+        chunks = [self._buffer[self._offset:]]
+        while available < size:
+            chunk = self._file.read(max(self._block_size, size - available))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            available += len(chunk)
+        self._buffer_position += self._offset
+        self._buffer = b"".join(chunks)
+        self._offset = 0
+        return available >= size
+
+    def seek_sync(self, position: int) -> Optional[int]:
+        """Moves to the first sync marker at or after `position`."""
+        self._file.seek(position)
+        self._buffer = b""
+        self._offset = 0
+        self._buffer_position = position
+        sync = binary.SYNC
+        while True:
+            index = self._buffer.find(sync, self._offset)
+            if index >= 0:
+                self._offset = index
+                return self.position
+            # the marker may span the end of the buffer
+            self._offset = max(self._offset, len(self._buffer) - len(sync) + 1)
+            if not self._fill(len(self._buffer) - self._offset + 1):
+                return None
+
+    def read_record(self) -> Optional[Tuple[int, bytes, int]]:
+        """Reads the next record: its type, body and file position.
+        None at the end of the file."""
+        buffer = self._buffer
+        offset = self._offset
+        # fast path, a record that is fully buffered
+        if len(buffer) - offset > 2:
+            record_type = buffer[offset]
+            if record_type != binary.RECORD_SYNC:
+                length = buffer[offset + 1]
+                if length < 0x80:
+                    start = offset + 2
+                    end = start + length
+                    if end <= len(buffer):
+                        self._offset = end
+                        return record_type, buffer[start:end], self._buffer_position + offset
+
+        if not self._fill(1):
+            return None
+        position = self.position
+        record_type = self._buffer[self._offset]
+        self.read(len(binary.SYNC) if record_type == binary.RECORD_SYNC else 1)
+        return record_type, self.read_body(), position
+
+    def read(self, size: int) -> bytes:
+        if not self._fill(size):
+            raise ValueError("truncated oplog binary file")
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return data
+
+    def read_body(self) -> bytes:
+        # a varint is at most 10 bytes, the buffer may end before that
+        self._fill(10)
+        length, offset = binary.read_varint(self._buffer, self._offset)
+        self._offset = offset
+        return self.read(length)
+
+
+def _decode_operation(body: bytes,
+                      strings: List[str],
+                      global_props: Dict[str, Any]) -> OperationRecord:
+    # the common case of single byte varints is decoded inline
+    read_varint = binary.read_varint
+
+    value = body[0]
+    if value < 0x80:
+        name_ref, offset = value, 1
+    else:
+        name_ref, offset = read_varint(body, 0)
+    start_time_ns = _INT64.unpack_from(body, offset)[0]
+    duration_ns, offset = read_varint(body, offset + 8)
+    result = binary.RESULTS[body[offset]]
+    length = body[offset + 1]
+    if length < 0x80:
+        offset += 2
+    else:
+        length, offset = read_varint(body, offset + 1)
+    id = body[offset:offset + length].decode("utf-8")
+    offset += length
+    length = body[offset]
+    if length < 0x80:
+        offset += 1
+    else:
+        length, offset = read_varint(body, offset)
+    correlation_id = body[offset:offset + length].decode("utf-8")
+    offset += length
+    parent_id, offset = binary.read_optional_str(body, offset)
+    exception_type_ref, offset = read_varint(body, offset)
+    if body[offset] == 0:
+        exception_msg = None
+        offset += 1
+    else:
+        exception_msg, offset = binary.read_optional_str(body, offset)
+    num_props = body[offset]
+    offset += 1
+    custom_props = {}
+    if num_props:
+        if num_props >= 0x80:
+            num_props, offset = read_varint(body, offset - 1)
+        read_value = binary.read_value
+        for _ in range(num_props):
+            key_ref, offset = read_varint(body, offset)
+            custom_props[strings[key_ref]], offset = read_value(body, offset)
+    process_id, offset = read_varint(body, offset)
+    thread_id, offset = read_varint(body, offset)
+    traceback_fingerprint, offset = binary.read_optional_str(body, offset)
+    # appended in a later version, missing in older files
+    if offset < len(body):
+        depth, offset = read_varint(body, offset)
+    else:
+        depth = 0
+
+    # positional, in the order of the record fields
+    return OperationRecord(
+        strings[name_ref],
+        start_time_ns,
+        duration_ns - 1 if duration_ns else None,
+        result,
+        id,
+        correlation_id,
+        parent_id,
+        depth - 1 if depth else None,
+        strings[exception_type_ref - 1] if exception_type_ref else None,
+        exception_msg,
+        traceback_fingerprint,
+        process_id - 1 if process_id else None,
+        thread_id - 1 if thread_id else None,
+        custom_props,
+        global_props,
+    )
@@ -0,0 +1,90 @@
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from oplog import columnar
+
+
+class ColumnarOperationReader:
+    def __init__(self, filename: Union[str, os.PathLike]) -> None:
+        """Reads columnar operation files, written by
+        `oplog.sinks.ColumnarOperationSink`. Only the footer is parsed upfront,
+        columns are loaded on demand, one at a time.
+
+        :param filename: The path of the file to read.
+        """
+        self.filename = os.fspath(filename)
+        with open(self.filename, "rb") as f:
+            trailer_size = columnar.FOOTER_LENGTH_SIZE + len(columnar.MAGIC)
+            f.seek(0, os.SEEK_END)
+            file_size = f.tell()
+            f.seek(0)
+            if f.read(len(columnar.MAGIC)) != columnar.MAGIC:
+                raise ValueError(f"{self.filename} is not an oplog columnar file")
+            if file_size < len(columnar.MAGIC) + trailer_size:
+                raise ValueError(f"{self.filename} is incomplete (was the sink closed?)")
+            f.seek(file_size - trailer_size)
+            trailer = f.read(trailer_size)
+            if trailer[columnar.FOOTER_LENGTH_SIZE:] != columnar.MAGIC:
+                raise ValueError(f"{self.filename} is incomplete (was the sink closed?)")
+            footer_length = int.from_bytes(trailer[:columnar.FOOTER_LENGTH_SIZE], "little")
+            f.seek(file_size - trailer_size - footer_length)
+            footer = json.loads(f.read(footer_length).decode("utf-8"))
+
+        self.schema: Dict[str, str] = {column["name"]: column["type"] for column in footer["schema"]}
+        self._dictionaries: Dict[str, List[str]] = footer["dictionaries"]
+        self._results = {int(code): result for code, result in footer["results"].items()}
+        self._row_groups: List[Dict[str, Any]] = footer["row_groups"]
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.schema)
+
+    @property
+    def num_rows(self) -> int:
+        return sum(row_group["num_rows"] for row_group in self._row_groups)
+
+    def dictionary(self, column: str) -> List[str]:
+        """The dictionary of a dictionary-encoded column (values by code)."""
+        return self._dictionaries[column]
+
+    def read_column(self, column: str, decode: bool = True) -> Sequence[Any]:
+        """Load a single column.
+
+        :param column: The column name.
+        :param decode: Optional. If False, dictionary and result columns are
+        returned as their integer codes (an `array`), which is cheaper.
+        """
+        if column not in self.schema:
+            raise KeyError(f"column `{column}` does not exist, columns: {self.columns}")
+        column_type = self.schema[column]
+        values: Any = [] if column_type == columnar.STRING else None
+        with open(self.filename, "rb") as f:
+            for row_group in self._row_groups:
+                offset, length = row_group["columns"][column]
+                f.seek(offset)
+                data = f.read(length)
+                if column_type == columnar.STRING:
+                    values.extend(columnar.decode_strings(data, row_group["num_rows"]))
+                else:
+                    chunk = columnar.decode_numbers(column_type, data)
+                    if values is None:
+                        values = chunk
+                    else:
+                        values.extend(chunk)
+        if values is None:
+            values = columnar.decode_numbers(column_type, b"")
+
+        if decode and column_type == columnar.DICT:
+            dictionary = self._dictionaries[column]
+            return [dictionary[code] if code >= 0 else None for code in values]
+        if decode and column == "result":
+            return [self._results.get(code) for code in values]
+        return values
+
+    def iter_rows(self, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate rows (as dicts) of the given columns (default is all)."""
+        columns = list(columns) if columns is not None else self.columns
+        loaded = [self.read_column(column) for column in columns]
+        for row in zip(*loaded):
+            yield dict(zip(columns, row))
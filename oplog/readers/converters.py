@@ -0,0 +1,58 @@
+from typing import Iterable, Optional, TextIO
+
+from oplog.formatters.csv_operation_formatter import CsvOperationFormatter
+from oplog.formatters.json_operation_formatter import JsonOperationFormatter
+from oplog.readers.operation_record import OperationRecord
+
+# records written per `write` call
+BATCH_SIZE = 1000
+
+
+def to_csv(records: Iterable[OperationRecord],
+           stream: TextIO,
+           formatter: Optional[CsvOperationFormatter] = None,
+           header: bool = True) -> int:
+    """Writes records as CSV rows, as `oplog.formatters.CsvOperationFormatter`
+    formats operations. Returns the number of records written.
+
+    :param records: The records to write, e.g., a `BinaryOperationReader`.
+    :param stream: The text stream to write to (opened with `newline=""`).
+    :param formatter: Optional. The CSV formatter (and its column schema).
+    Columns must be attributes of `OperationRecord`.
+    :param header: Optional. If True, a header row is written first.
+    """
+    formatter = formatter if formatter is not None else CsvOperationFormatter()
+    if header:
+        stream.write(formatter.header() + "\n")
+    return _write_batches(records, stream, formatter.format_ops)
+
+
+def to_json_lines(records: Iterable[OperationRecord],
+                  stream: TextIO,
+                  formatter: Optional[JsonOperationFormatter] = None) -> int:
+    """Writes records as JSON lines, as `oplog.formatters.JsonOperationFormatter`
+    formats operations (one object per line, keys in the order of
+    `oplog.readers.JSON_KEYS`). Values that are not JSON serializable are
+    written as strings. Returns the number of records written.
+
+    :param records: The records to write, e.g., a `BinaryOperationReader`.
+    :param stream: The text stream to write to.
+    :param formatter: Optional. The JSON formatter.
+    """
+    formatter = formatter if formatter is not None else JsonOperationFormatter()
+    return _write_batches(records, stream, formatter.format_ops)
+
+
+def _write_batches(records: Iterable[OperationRecord], stream: TextIO, format_batch) -> int:
+    count = 0
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= BATCH_SIZE:
+            stream.write(format_batch(batch))
+            count += len(batch)
+            batch = []
+    if batch:
+        stream.write(format_batch(batch))
+        count += len(batch)
+    return count
@@ -0,0 +1,199 @@
+import csv
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from oplog.clock import clock
+from oplog.formatters.csv_operation_formatter import (
+    CUSTOM_PROPS_PREFIX,
+    DEFAULT_COLUMNS,
+    GLOBAL_PROPS_PREFIX,
+    LEGACY_DEFAULT_COLUMNS,
+)
+from oplog.operation import Operation
+from oplog.readers.line_chunk import LineChunk
+from oplog.readers.operation_record import OperationRecord
+
+# column -> (record field, conversion), columns that are not listed
+# (e.g., `end_time_utc_str`) are derived, and are ignored when read
+_COLUMN_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "start_time_utc_str": ("start_time_ns", clock.parse),
+    "start_time_ns": ("start_time_ns", int),
+    "duration_ns": ("duration_ns", int),
+    "duration_ms": ("duration_ns", lambda value: int(value) * 1_000_000),
+    "depth": ("depth", int),
+    "process_id": ("process_id", int),
+    "thread_id": ("thread_id", int),
+    **{
+        field: (field, str)
+        for field in ("name", "result", "id", "correlation_id", "parent_id",
+                      "exception_type", "exception_msg", "traceback_fingerprint")
+    },
+}
+
+
+def row_starts(filename: Union[str, os.PathLike], positions: Sequence[int]) -> List[int]:
+    """The start of the first row at or after each of the (ascending)
+    `positions` of a CSV file, found in a single pass over the file: quotes
+    are counted (at the speed of `bytes.count`) up to each position, and
+    lines are skipped until the count is even (out of quoted fields)."""
+    starts = []
+    # the number of quotes before `offset`, the position of `f`
+    quotes = 0
+    offset = 0
+    with open(filename, "rb") as f:
+        for position in positions:
+            if position > offset:
+                # the rest of the line that contains `position - 1`
+                while offset < position - 1:
+                    block = f.read(min(1 << 20, position - 1 - offset))
+                    if not block:
+                        break
+                    quotes += block.count(b'"')
+                    offset += len(block)
+                line = f.readline()
+                quotes += line.count(b'"')
+                offset += len(line)
+                while quotes % 2:
+                    line = f.readline()
+                    if not line:
+                        break
+                    quotes += line.count(b'"')
+                    offset += len(line)
+            starts.append(offset)
+    return starts
+
+
+def is_column(column: str) -> bool:
+    """True if `column` is a column name of `CsvOperationFormatter`."""
+    return (column.startswith(CUSTOM_PROPS_PREFIX)
+            or column.startswith(GLOBAL_PROPS_PREFIX)
+            or hasattr(Operation, column))
+
+
+class CsvOperationReader:
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 columns: Optional[Sequence[str]] = None,
+                 start: int = 0,
+                 end: Optional[int] = None,
+                 aligned: bool = False) -> None:
+        """Streams operation records out of CSV files, written by
+        `oplog.sinks.CsvFileOperationSink` (or `CsvOperationFormatter`).
+        Memory use is constant.
+
+        Fields are read back as the record attributes they were formatted
+        from, e.g., `duration_ms` as `duration_ns` (in whole milliseconds).
+        Props are read as strings. Empty fields are None (missing props).
+
+        A byte range of the file can be read, to split a file into chunks:
+        the reader yields the rows that start in `[start, end)`. Quoted
+        fields may have newlines, so rows are told apart from lines by the
+        parity of the quotes before them, which are counted (at the speed of
+        `bytes.count`) up to `start`, unless `start` is known to be the start
+        of a row (see `row_starts`, and `oplog.readers.split`).
+
+        :param filename: The path of the file to read.
+        :param columns: Optional. The column schema of the file. By default,
+        it is read from the header row, or is the default schema of
+        `CsvOperationFormatter` (of this or of an earlier version, by the
+        number of fields) if the file has no header.
+        :param start: Optional. Reading starts at the first row at or after it.
+        :param end: Optional. Reading stops at the first row at or after it.
+        Default is the end of the file.
+        :param aligned: Optional. If True, `start` is the start of a row, and
+        the quotes before it are not counted.
+        """
+        self.filename = os.fspath(filename)
+        self.start = start
+        self.end = end
+        self.aligned = aligned
+        with open(self.filename, encoding="utf-8", newline="") as f:
+            first_row = next(csv.reader(f), None)
+        self.has_header = first_row is not None and all(is_column(column) for column in first_row)
+        if columns is None:
+            if self.has_header:
+                columns = first_row
+            elif first_row is not None and len(first_row) == len(LEGACY_DEFAULT_COLUMNS):
+                columns = LEGACY_DEFAULT_COLUMNS
+            else:
+                columns = DEFAULT_COLUMNS
+        if "name" not in columns:
+            raise ValueError(f"`name` is not a column of {self.filename}")
+        self.columns = tuple(columns)
+        # earlier versions wrote None as "None" (e.g., the exception type of
+        # a successful operation), in headerless files
+        legacy = not self.has_header and self.columns == LEGACY_DEFAULT_COLUMNS
+        self._convert = self._row_converter(self.columns, none_is_null=legacy)
+
+    @staticmethod
+    def _row_converter(columns: Sequence[str],
+                       none_is_null: bool = False) -> Callable[[List[str]], OperationRecord]:
+        # compiled once: (index, field, conversion) of the field columns,
+        # (index, prop) of the custom and global prop columns
+        # names are never None, a "None" name is a name
+        none_indices = tuple(
+            index for index, column in enumerate(columns) if column != "name"
+        ) if none_is_null else ()
+        fields = []
+        custom_props = []
+        global_props = []
+        for index, column in enumerate(columns):
+            if column in _COLUMN_FIELDS:
+                fields.append((index, *_COLUMN_FIELDS[column]))
+            elif column.startswith(CUSTOM_PROPS_PREFIX):
+                custom_props.append((index, column[len(CUSTOM_PROPS_PREFIX):]))
+            elif column.startswith(GLOBAL_PROPS_PREFIX):
+                global_props.append((index, column[len(GLOBAL_PROPS_PREFIX):]))
+        num_columns = len(columns)
+
+        def convert(row: List[str]) -> OperationRecord:
+            if len(row) != num_columns:
+                raise ValueError(f"expected {num_columns} fields, but got {len(row)}: {row}")
+            for index in none_indices:
+                if row[index] == "None":
+                    row[index] = ""
+            values: Dict[str, Any] = {field: convert_field(row[index])
+                                      for index, field, convert_field in fields if row[index]}
+            if custom_props:
+                values["custom_props"] = {prop: row[index] for index, prop in custom_props if row[index]}
+            if global_props:
+                values["global_props"] = {prop: row[index] for index, prop in global_props if row[index]}
+            return OperationRecord(**values)
+
+        return convert
+
+    def _count_quotes(self, end: int) -> int:
+        count = 0
+        with open(self.filename, "rb") as f:
+            while f.tell() < end:
+                block = f.read(min(1 << 20, end - f.tell()))
+                if not block:
+                    break
+                count += block.count(b'"')
+        return count
+
+    def __iter__(self) -> Iterator[OperationRecord]:
+        with open(self.filename, "rb") as f:
+            lines = LineChunk(f, self.start, self.end)
+            line_iter = iter(lines)
+            if (lines.position > 0 and not self.aligned
+                    and self._count_quotes(lines.position) % 2):
+                # the line is inside a quoted field, of a row that belongs
+                # to the previous chunk. every quote (escaped ones are a
+                # pair) toggles the parity, rows start where it is even
+                quotes = 1
+                while quotes % 2 and not lines.done:
+                    line = next(line_iter, None)
+                    if line is None:
+                        return
+                    quotes += line.count('"')
+            rows = csv.reader(line_iter)
+            if self.has_header and lines.position == 0:
+                next(rows, None)
+            convert = self._convert
+            while not lines.done:
+                row = next(rows, None)
+                if row is None:
+                    return
+                if row:
+                    yield convert(row)
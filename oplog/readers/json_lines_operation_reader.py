@@ -0,0 +1,49 @@
+import json
+import os
+from typing import Iterator, Optional, Union
+
+from oplog.clock import clock
+from oplog.readers.line_chunk import LineChunk
+from oplog.readers.operation_record import OperationRecord
+
+_FIELDS = OperationRecord._fields
+
+
+class JsonLinesOperationReader:
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 start: int = 0,
+                 end: Optional[int] = None) -> None:
+        """Streams operation records out of JSON lines files (one object
+        per line, with the keys of `oplog.readers.JSON_KEYS`), such as the
+        output of `oplog.readers.to_json_lines`. Memory use is constant.
+
+        A byte range of the file can be read, to split a file into chunks:
+        the reader yields the lines that start in `[start, end)`.
+
+        :param filename: The path of the file to read.
+        :param start: Optional. Reading starts at the first line at or after it.
+        :param end: Optional. Reading stops at the first line at or after it.
+        Default is the end of the file.
+        """
+        self.filename = os.fspath(filename)
+        self.start = start
+        self.end = end
+
+    def __iter__(self) -> Iterator[OperationRecord]:
+        decode = json.JSONDecoder().decode
+        with open(self.filename, "rb") as f:
+            lines = LineChunk(f, self.start, self.end)
+            line_iter = iter(lines)
+            while not lines.done:
+                line = next(line_iter, None)
+                if line is None:
+                    return
+                if not line.strip():
+                    continue
+                values = decode(line)
+                record = {field: values[field] for field in _FIELDS
+                          if values.get(field) is not None}
+                if "start_time_ns" not in record and values.get("start_time_utc"):
+                    record["start_time_ns"] = clock.parse(values["start_time_utc"])
+                yield OperationRecord(**record)
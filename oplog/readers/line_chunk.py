@@ -0,0 +1,32 @@
+import io
+from typing import Iterator, Optional
+
+
+class LineChunk:
+    def __init__(self, f: io.BufferedReader, start: int = 0, end: Optional[int] = None) -> None:
+        """The lines of a (binary mode) text file that start in `[start, end)`,
+        decoded. A line that starts before `start` belongs to the previous
+        chunk, so chunks of a file never overlap, nor skip a line.
+        """
+        if start > 0:
+            # the rest of the line that contains `start - 1`
+            f.seek(start - 1)
+            f.readline()
+        else:
+            f.seek(0)
+        self._file = f
+        self.end = end
+        # file position of the next line
+        self.position = f.tell()
+
+    @property
+    def done(self) -> bool:
+        """True once the next line starts at or after `end`."""
+        return self.end is not None and self.position >= self.end
+
+    def __iter__(self) -> Iterator[str]:
+        # lines are yielded past `end` as well, a consumer may need the
+        # continuation of a record (e.g., a quoted CSV field with newlines)
+        for line in self._file:
+            self.position += len(line)
+            yield line.decode("utf-8")
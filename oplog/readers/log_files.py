@@ -0,0 +1,75 @@
+import os
+from typing import Iterable, List, Optional, Tuple, Union
+
+from oplog import binary
+from oplog.readers.binary_operation_reader import BinaryOperationReader
+from oplog.readers.csv_operation_reader import CsvOperationReader, row_starts
+from oplog.readers.json_lines_operation_reader import JsonLinesOperationReader
+from oplog.readers.operation_record import OperationRecord
+
+FORMATS = ("binary", "csv", "jsonl")
+
+# files smaller than this are not split into chunks
+MIN_CHUNK_SIZE = 1 << 24
+
+
+def detect_format(filename: Union[str, os.PathLike]) -> str:
+    """The format of an operation log file (one of `FORMATS`), by its content:
+    binary files start with a magic header, JSON lines with an object."""
+    with open(filename, "rb") as f:
+        head = f.read(4096)
+    if head.startswith(binary.MAGIC):
+        return "binary"
+    if head.lstrip().startswith(b"{"):
+        return "jsonl"
+    return "csv"
+
+
+def open_reader(filename: Union[str, os.PathLike],
+                format: Optional[str] = None,
+                start: int = 0,
+                end: Optional[int] = None,
+                aligned: bool = False) -> Iterable[OperationRecord]:
+    """A reader of the records of an operation log file, in a byte range
+    (see `split`).
+
+    :param filename: The path of the file to read.
+    :param format: Optional. One of `FORMATS`, detected by default.
+    :param start: Optional. See the readers.
+    :param end: Optional. See the readers.
+    :param aligned: Optional. If True, `start` is the start of a record,
+    as are the starts of the ranges of `split` (used by CSV readers).
+    """
+    format = format if format is not None else detect_format(filename)
+    if format == "binary":
+        return BinaryOperationReader(filename, start=start, end=end)
+    if format == "csv":
+        return CsvOperationReader(filename, start=start, end=end, aligned=aligned)
+    if format == "jsonl":
+        return JsonLinesOperationReader(filename, start=start, end=end)
+    raise ValueError(f"unknown format `{format}`, formats: {FORMATS}")
+
+
+def split(filename: Union[str, os.PathLike],
+          count: int,
+          min_size: int = MIN_CHUNK_SIZE,
+          format: Optional[str] = None) -> List[Tuple[int, Optional[int]]]:
+    """Splits a file into (at most) `count` byte ranges of similar size, of
+    at least `min_size` bytes. Readers of the ranges (see `open_reader`)
+    read every record of the file exactly once.
+
+    The ranges of CSV files start at row starts, found in a single pass over
+    the file (see `oplog.readers.csv_operation_reader.row_starts`), so their
+    readers need not count the quotes before them (with `aligned=True`).
+
+    :param format: Optional. One of `FORMATS`, detected by default.
+    """
+    size = os.path.getsize(filename)
+    count = max(1, min(count, size // max(min_size, 1)))
+    chunk_size = size // count
+    starts = [index * chunk_size for index in range(count)]
+    format = format if format is not None else detect_format(filename)
+    if format == "csv" and count > 1:
+        starts = row_starts(filename, starts)
+    ends: List[Optional[int]] = [*starts[1:], None]
+    return list(zip(starts, ends))
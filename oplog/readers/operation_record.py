@@ -0,0 +1,81 @@
+import datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from oplog.clock import clock
+
+# the keys of an operation as a JSON object, in order. shared by the JSON
+# lines converter, formatter and the `oplog` command line
+JSON_KEYS = (
+    "start_time_utc",
+    "start_time_ns",
+    "duration_ns",
+    "name",
+    "result",
+    "id",
+    "correlation_id",
+    "parent_id",
+    "depth",
+    "exception_type",
+    "exception_msg",
+    "traceback_fingerprint",
+    "process_id",
+    "thread_id",
+    "custom_props",
+    "global_props",
+)
+
+
+class OperationRecord(NamedTuple):
+    """A finished operation, read back from a log (see `oplog.readers`).
+    A lightweight, immutable counterpart of `Operation`, with the same
+    attribute names for the fields it has."""
+    name: str
+    start_time_ns: Optional[int] = None
+    duration_ns: Optional[int] = None
+    result: Optional[str] = None
+    id: Optional[str] = None
+    correlation_id: Optional[str] = None
+    parent_id: Optional[str] = None
+    depth: Optional[int] = None
+    exception_type: Optional[str] = None
+    exception_msg: Optional[str] = None
+    traceback_fingerprint: Optional[str] = None
+    process_id: Optional[int] = None
+    thread_id: Optional[int] = None
+    custom_props: Dict[str, Any] = {}
+    global_props: Dict[str, Any] = {}
+
+    @property
+    def is_successful(self) -> Optional[bool]:
+        return self.result == "Success" if self.result is not None else None
+
+    @property
+    def end_time_ns(self) -> Optional[int]:
+        if self.start_time_ns is None or self.duration_ns is None:
+            return None
+        return self.start_time_ns + self.duration_ns
+
+    @property
+    def start_time_utc(self) -> Optional[datetime.datetime]:
+        return clock.to_datetime(self.start_time_ns) if self.start_time_ns is not None else None
+
+    @property
+    def start_time_utc_str(self) -> Optional[str]:
+        return clock.format(self.start_time_ns) if self.start_time_ns is not None else None
+
+    @property
+    def end_time_utc_str(self) -> Optional[str]:
+        end_time_ns = self.end_time_ns
+        return clock.format(end_time_ns) if end_time_ns is not None else None
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if self.duration_ns is None:
+            return None
+        return round(self.duration_ns / 1_000_000)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The record as a JSON object, with `JSON_KEYS` in order."""
+        record = self._asdict()
+        record["start_time_utc"] = self.start_time_utc_str
+        return {key: record[key] for key in JSON_KEYS}
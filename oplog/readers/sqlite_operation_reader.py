@@ -0,0 +1,69 @@
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, List, Union
+
+from oplog import sqlite_schema
+from oplog.readers.operation_record import OperationRecord
+
+# both are answered by an index lookup (see `oplog.sqlite_schema.INDEXES`)
+CORRELATION_QUERY = f"{sqlite_schema.SELECT} WHERE correlation_id = ? ORDER BY start_time_ns"
+SLOWEST_QUERY = f"{sqlite_schema.SELECT} WHERE name = ? ORDER BY duration_ns DESC LIMIT ?"
+
+
+class SqliteOperationReader:
+    def __init__(self, filename: Union[str, os.PathLike]) -> None:
+        """Queries SQLite operation databases, written by
+        `oplog.sinks.SqliteOperationSink`, as operation records.
+        The database is opened read-only, it can be queried while it is written.
+
+        :param filename: The path of the database.
+        """
+        self.filename = os.fspath(filename)
+        if not os.path.exists(self.filename):
+            raise FileNotFoundError(f"{self.filename} does not exist")
+        self._connection = sqlite3.connect(f"{Path(self.filename).absolute().as_uri()}?mode=ro", uri=True)
+        tables = self._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (sqlite_schema.TABLE,)
+        ).fetchall()
+        if not tables:
+            self._connection.close()
+            raise ValueError(f"{self.filename} is not an oplog database")
+
+    @staticmethod
+    def _to_record(row: Any) -> OperationRecord:
+        *fields, custom_props, global_props = row
+        return OperationRecord(
+            *fields,
+            json.loads(custom_props) if custom_props else {},
+            json.loads(global_props) if global_props else {},
+        )
+
+    def _query(self, query: str, *parameters: Any) -> List[OperationRecord]:
+        return [self._to_record(row) for row in self._connection.execute(query, parameters)]
+
+    def __iter__(self) -> Iterator[OperationRecord]:
+        """All the records, in insertion order, streamed."""
+        for row in self._connection.execute(f"{sqlite_schema.SELECT} ORDER BY rowid"):
+            yield self._to_record(row)
+
+    def __len__(self) -> int:
+        return self._connection.execute(f"SELECT COUNT(*) FROM {sqlite_schema.TABLE}").fetchone()[0]
+
+    def by_correlation_id(self, correlation_id: str) -> List[OperationRecord]:
+        """All the operations of a correlation id, by start time."""
+        return self._query(CORRELATION_QUERY, correlation_id)
+
+    def slowest(self, name: str, limit: int = 10) -> List[OperationRecord]:
+        """The `limit` slowest operations of a name, slowest first."""
+        return self._query(SLOWEST_QUERY, name, limit)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteOperationReader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,68 @@
+import random
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from oplog.operation import Operation
+
+
+class Sampler:
+    def __init__(self,
+                 rate: float = 1.0,
+                 rates: Optional[Dict[str, float]] = None,
+                 keep_failures: bool = True,
+                 keep_slower_than_ms: Optional[float] = None) -> None:
+        """
+        Decides which operations are logged, configured with `Operation.config(sampler=...)`.
+
+        Head sampling is decided once per operation tree, at the root, by the rate of the
+        root operation name. Descendants inherit the decision, so a tree is either
+        logged as a whole or not at all. Tail rules are evaluated when an operation
+        exits, and keep head-sampled-out operations that are interesting.
+        Sampled out operations are not formatted nor written.
+
+        :param rate: Optional. The default head sampling rate, between 0 and 1.
+        :param rates: Optional. Head sampling rates per (root) operation name,
+        overriding the default rate.
+        :param keep_failures: Optional. If True, failed operations are always kept.
+        :param keep_slower_than_ms: Optional. If set, operations that took at least
+        this long are always kept.
+        """
+        self._validate_rate(rate)
+        for op_rate in (rates or {}).values():
+            self._validate_rate(op_rate)
+        self.rate = rate
+        self.rates: Dict[str, float] = dict(rates or {})
+        self.keep_failures = keep_failures
+        self.keep_slower_than_ns = (
+            int(keep_slower_than_ms * 1_000_000) if keep_slower_than_ms is not None else None
+        )
+        self._sampled_out_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _validate_rate(rate: float) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"sampling rate must be between 0 and 1, but got {rate}")
+
+    @property
+    def sampled_out_count(self) -> int:
+        """Number of operations that were sampled out (not logged)."""
+        return self._sampled_out_count
+
+    def sample_head(self, op_name: str) -> bool:
+        rate = self.rates.get(op_name, self.rate)
+        if rate >= 1.0:
+            return True
+        return random.random() < rate
+
+    def keep_tail(self, op: "Operation") -> bool:
+        if self.keep_failures and op.is_successful is False:
+            return True
+        return (self.keep_slower_than_ns is not None
+                and op.duration_ns is not None
+                and op.duration_ns >= self.keep_slower_than_ns)
+
+    def count_sampled_out(self) -> None:
+        with self._lock:
+            self._sampled_out_count += 1
@@ -0,0 +1,123 @@
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional
+
+# header: write position, read position (total bytes written/read so far).
+# each position is written by a single side, the producer and the consumer,
+# so the ring needs no lock between processes.
+_POSITION = struct.Struct("<Q")
+WRITE_POSITION_OFFSET = 0
+READ_POSITION_OFFSET = 64  # on another cache line
+HEADER_SIZE = 128
+
+# records are length-prefixed, a record never wraps around the end
+_LENGTH = struct.Struct("<I")
+WRAP_MARKER = 0xFFFFFFFF
+
+
+class SharedMemoryRing:
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        """A single-producer, single-consumer ring buffer of byte records,
+        over a shared memory segment. Use `create` (producer side) and
+        `attach` (consumer side) to construct it.
+        """
+        self._shm = shm
+        self._owner = owner
+        self._buf = shm.buf
+        self.capacity = shm.size - HEADER_SIZE
+        # each side caches its own position
+        self._write_position = self._load(WRITE_POSITION_OFFSET)
+        self._read_position = self._load(READ_POSITION_OFFSET)
+
+    @classmethod
+    def create(cls, capacity: int = 1 << 20, name: Optional[str] = None) -> "SharedMemoryRing":
+        if capacity < _LENGTH.size * 2:
+            raise ValueError(f"capacity is too small, got {capacity}")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        shm = shared_memory.SharedMemory(name=name)
+        # the segment is owned (and unlinked) by the creating process,
+        # attaching must not register it for cleanup in this process
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def used(self) -> int:
+        """Number of bytes written and not yet read."""
+        return self._load(WRITE_POSITION_OFFSET) - self._load(READ_POSITION_OFFSET)
+
+    def _load(self, offset: int) -> int:
+        return _POSITION.unpack_from(self._buf, offset)[0]
+
+    def put(self, record: bytes) -> bool:
+        """Writes a record (producer side). Returns False if the ring is full."""
+        size = _LENGTH.size + len(record)
+        capacity = self.capacity
+        if size > capacity:
+            raise ValueError(f"record of {len(record)} bytes exceeds the ring capacity")
+        write_position = self._write_position
+        free = capacity - (write_position - self._load(READ_POSITION_OFFSET))
+        offset = write_position % capacity
+        tail = capacity - offset
+        needed = size if size <= tail else tail + size
+        if needed > free:
+            return False
+
+        buf = self._buf
+        if size > tail:
+            # the rest of the ring is skipped, the record starts over at 0
+            if tail >= _LENGTH.size:
+                _LENGTH.pack_into(buf, HEADER_SIZE + offset, WRAP_MARKER)
+            write_position += tail
+            offset = 0
+        start = HEADER_SIZE + offset
+        _LENGTH.pack_into(buf, start, len(record))
+        buf[start + _LENGTH.size:start + size] = record
+        write_position += size
+        self._write_position = write_position
+        # published after the record is written
+        _POSITION.pack_into(buf, WRITE_POSITION_OFFSET, write_position)
+        return True
+
+    def get_batch(self, max_records: int = 1024) -> List[bytes]:
+        """Reads up to `max_records` records (consumer side)."""
+        records: List[bytes] = []
+        read_position = self._read_position
+        write_position = self._load(WRITE_POSITION_OFFSET)
+        if read_position == write_position:
+            return records
+
+        buf = self._buf
+        capacity = self.capacity
+        while read_position < write_position and len(records) < max_records:
+            offset = read_position % capacity
+            tail = capacity - offset
+            if tail < _LENGTH.size:
+                read_position += tail
+                continue
+            start = HEADER_SIZE + offset
+            length = _LENGTH.unpack_from(buf, start)[0]
+            if length == WRAP_MARKER:
+                read_position += tail
+                continue
+            records.append(bytes(buf[start + _LENGTH.size:start + _LENGTH.size + length]))
+            read_position += _LENGTH.size + length
+
+        self._read_position = read_position
+        _POSITION.pack_into(buf, READ_POSITION_OFFSET, read_position)
+        return records
+
+    def close(self) -> None:
+        # views of the buffer must be released before the segment is closed
+        self._buf = None  # type: ignore[assignment]
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,11 @@
+from .base_operation_sink import BaseOperationSink  # noqa: F401
+from .stream_operation_sink import StreamOperationSink  # noqa: F401
+from .file_operation_sink import FileOperationSink  # noqa: F401
+from .operation_sink_handler import OperationSinkHandler  # noqa: F401
+from .aggregating_operation_sink import AggregatingOperationSink  # noqa: F401
+from .columnar_operation_sink import ColumnarOperationSink  # noqa: F401
+from .csv_file_operation_sink import CsvFileOperationSink  # noqa: F401
+from .queue_operation_sink import QueueOperationSink  # noqa: F401
+from .shared_memory_operation_sink import SharedMemoryOperationSink  # noqa: F401
+from .binary_file_operation_sink import BinaryFileOperationSink  # noqa: F401
+from .sqlite_operation_sink import SqliteOperationSink  # noqa: F401
@@ -0,0 +1,140 @@
+import json
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from oplog.operation import Operation
+from oplog.operation_stats import OperationStats
+from oplog.operation_step import OperationStep
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+StatsKey = Tuple[str, Optional[str]]
+SummaryWriter = Callable[[Dict[str, Any]], None]
+
+summary_logger = logging.getLogger("oplog.aggregate")
+
+
+def log_summary(summary: Dict[str, Any]) -> None:
+    """The default summary writer, logs the summary as a JSON line."""
+    summary_logger.info(json.dumps(summary))
+
+
+class _Shard:
+    """Per-thread stats. Its lock is only contended while flushing."""
+
+    __slots__ = ("lock", "stats", "thread")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stats: Dict[StatsKey, OperationStats] = {}
+        self.thread = weakref.ref(threading.current_thread())
+
+
+class AggregatingOperationSink(BaseOperationSink):
+    def __init__(self,
+                 interval_s: Optional[float] = 60.0,
+                 writer: Optional[SummaryWriter] = None) -> None:
+        """A sink that writes no line per operation. Instead, it keeps in-memory
+        rollups per operation name and result (count, error count, sum, min, max,
+        and a latency histogram of `duration_ns`), and writes a summary on a fixed
+        interval. Each thread updates its own shard, so updates do not contend.
+
+        :param interval_s: Optional. Seconds between summaries. If None, summaries
+        are only written on `flush` (and `close`).
+        :param writer: Optional. Receives each (JSON-serializable) summary.
+        Default is logging it as a JSON line, with the `oplog.aggregate` logger.
+        """
+        self.interval_s = interval_s
+        self.writer = writer if writer is not None else log_summary
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._period_start_ns = time.time_ns()
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if interval_s is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                name=f"{self.__class__.__name__}-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _get_shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def emit(self, op: Operation) -> None:
+        if op.step is not OperationStep.END:
+            # operations logged on start are not finished yet
+            return
+        shard = self._get_shard()
+        key = (op.name, op.result)
+        with shard.lock:
+            stats = shard.stats.get(key)
+            if stats is None:
+                stats = shard.stats[key] = OperationStats(name=op.name, result=op.result)
+            stats.record(op.duration_ns, op.is_successful)  # type: ignore[arg-type]
+
+    def collect(self, reset: bool = True) -> Dict[StatsKey, OperationStats]:
+        """Merge the stats of all threads, per operation name and result."""
+        with self._shards_lock:
+            shards = list(self._shards)
+            if reset:
+                # shards of finished threads are dropped once their stats are taken
+                self._shards = [shard for shard in shards if shard.thread() is not None]
+
+        merged: Dict[StatsKey, OperationStats] = {}
+        for shard in shards:
+            with shard.lock:
+                stats_by_key = shard.stats
+                if reset:
+                    shard.stats = {}
+                else:
+                    stats_by_key = {
+                        key: self._copy(stats) for key, stats in stats_by_key.items()
+                    }
+            for key, stats in stats_by_key.items():
+                if key in merged:
+                    merged[key].merge(stats)
+                else:
+                    merged[key] = stats
+        return merged
+
+    @staticmethod
+    def _copy(stats: OperationStats) -> OperationStats:
+        copy = OperationStats(name=stats.name, result=stats.result)
+        copy.merge(stats)
+        return copy
+
+    def flush(self) -> None:
+        """Write a summary of the operations since the previous summary."""
+        merged = self.collect(reset=True)
+        period_end_ns = time.time_ns()
+        period_start_ns, self._period_start_ns = self._period_start_ns, period_end_ns
+        if not merged:
+            return
+        self.writer({
+            "start_time_ns": period_start_ns,
+            "end_time_ns": period_end_ns,
+            "stats": [stats.to_dict() for stats in merged.values()],
+        })
+
+    def _flush_loop(self) -> None:
+        while not self._closed.wait(self.interval_s):
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover
+                logging.getLogger(__name__).exception("failed writing summary")
+
+    def close(self) -> None:
+        self._closed.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
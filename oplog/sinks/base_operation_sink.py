@@ -0,0 +1,42 @@
+import logging
+import sys
+import traceback
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from oplog.operation import Operation
+
+
+class BaseOperationSink(ABC):
+    """A destination for finished operations that does not go through the
+    `logging` stack (no `LogRecord` is created).
+    Sinks are registered with `Operation.config(sinks=[...])`, or attached to
+    a logger with `oplog.sinks.OperationSinkHandler`.
+    """
+
+    def handle(self, op: Operation) -> None:
+        try:
+            self.emit(op)
+        except Exception:
+            self.handle_error(op)
+
+    @abstractmethod
+    def emit(self, op: Operation) -> None:  # pragma: no cover
+        raise NotImplementedError("emit is required")
+
+    def emit_batch(self, ops: Iterable[Operation]) -> None:
+        for op in ops:
+            self.emit(op)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def handle_error(self, op: Operation) -> None:
+        # same behavior as `logging.Handler.handleError`
+        if logging.raiseExceptions and sys.stderr:  # pragma: no branch
+            sys.stderr.write(f"--- oplog sink error ({self.__class__.__name__}) ---\n")
+            traceback.print_exc(file=sys.stderr)
+            sys.stderr.write(f"Operation: {op!r}\n")
@@ -0,0 +1,66 @@
+import os
+import threading
+from typing import Union
+
+from oplog.binary import MAGIC, BinaryOperationEncoder
+from oplog.operation import Operation
+from oplog.operation_step import OperationStep
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class BinaryFileOperationSink(BaseOperationSink):
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 batch_size: int = 1_000,
+                 segment_size: int = 65536) -> None:
+        """A sink that appends finished operations to a file, in the compact
+        binary record format (see `oplog.binary`). Read it back with
+        `oplog.readers.BinaryOperationReader`.
+
+        :param filename: The path of the file to append to.
+        :param batch_size: Optional. Number of operations buffered before writing.
+        :param segment_size: Optional. Number of operations per segment
+        (the unit of string interning and of splitting the file).
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.filename = os.fspath(filename)
+        self.batch_size = batch_size
+        self._encoder = BinaryOperationEncoder(segment_size=segment_size)
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._buffered_ops = 0
+        self._file = open(self.filename, "ab")
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        # appended operations start a new segment (with a new string table)
+        self._encoder.start_segment(self._buffer, Operation.global_props)
+
+    def emit(self, op: Operation) -> None:
+        if op.step is not OperationStep.END:
+            return
+        with self._lock:
+            self._encoder.encode(self._buffer, op, op.global_props)
+            self._buffered_ops += 1
+            if self._buffered_ops >= self.batch_size:
+                self._write_batch()
+
+    def _write_batch(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer = bytearray()
+        self._buffered_ops = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_batch()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_batch()
+            self._file.close()
@@ -0,0 +1,150 @@
+import atexit
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from oplog import columnar
+from oplog.operation import Operation
+from oplog.operation_step import OperationStep
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+# base columns: (column name, column type)
+BASE_COLUMNS = (
+    ("name", columnar.DICT),
+    ("start_time_ns", columnar.INT64),
+    ("duration_ns", columnar.INT64),
+    ("result", columnar.INT8),
+    ("exception_type", columnar.DICT),
+    ("id", columnar.STRING),
+    ("correlation_id", columnar.STRING),
+)
+
+
+class ColumnarOperationSink(BaseOperationSink):
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 row_group_size: int = 65_536,
+                 custom_props: Sequence[str] = ()) -> None:
+        """A sink that buffers finished operations into per-field columns, and writes
+        them in row groups to a columnar file (see `oplog.columnar`).
+        Operation names and exception types are dictionary-encoded, timestamps and
+        durations are int64, and results are int8. Read the file with
+        `oplog.readers.ColumnarOperationReader`.
+
+        The file is readable once the sink is closed, which writes its footer.
+        A sink that is not closed (e.g., configured with `Operation.config` for
+        the lifetime of the process) is closed at interpreter exit (with
+        `atexit`). A process that does not exit normally (e.g., killed, or
+        `os._exit`) leaves the file without a footer, which is unreadable.
+
+        :param filename: The path of the file to write (overwritten).
+        :param row_group_size: Optional. Number of operations buffered per row group.
+        :param custom_props: Optional. Custom props to write as (string) columns,
+        named `custom_props.<prop name>`.
+        """
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be positive, but got {row_group_size}")
+        self.filename = os.fspath(filename)
+        self.row_group_size = row_group_size
+        self.custom_props = tuple(custom_props)
+        self.schema = list(BASE_COLUMNS) + [
+            (f"{columnar.CUSTOM_PROPS_PREFIX}{prop}", columnar.STRING)
+            for prop in self.custom_props
+        ]
+
+        self._lock = threading.Lock()
+        self._file = open(self.filename, "wb")
+        self._file.write(columnar.MAGIC)
+        self._closed = False
+        # dictionary column name -> {value: code}
+        self._dictionaries: Dict[str, Dict[str, int]] = {
+            name: {} for name, column_type in self.schema if column_type == columnar.DICT
+        }
+        self._row_groups: List[Dict[str, Any]] = []
+        self._rows: List[Tuple[Any, ...]] = []
+        # the footer is written on close, at the latest at exit
+        atexit.register(self.close)
+
+    def _encode_dict_values(self, column: str, values: Sequence[Optional[str]]) -> List[int]:
+        dictionary = self._dictionaries[column]
+        codes = []
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                continue
+            code = dictionary.get(value)
+            if code is None:
+                code = dictionary[value] = len(dictionary)
+            codes.append(code)
+        return codes
+
+    def emit(self, op: Operation) -> None:
+        if op.step is not OperationStep.END:
+            return
+        row = (
+            op.name,
+            op.start_time_ns,
+            op.duration_ns,
+            op.result,
+            op.exception_type,
+            op.id,
+            op.correlation_id,
+        )
+        if self.custom_props:
+            custom_props = op.custom_props
+            row += tuple(
+                str(custom_props[prop]) if custom_props.get(prop) is not None else None
+                for prop in self.custom_props
+            )
+        with self._lock:
+            # rows are transposed into columns once per row group
+            self._rows.append(row)
+            if len(self._rows) >= self.row_group_size:
+                self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        rows, self._rows = self._rows, []
+        if not rows:
+            return
+        chunks: Dict[str, List[int]] = {}
+        for (name, column_type), values in zip(self.schema, zip(*rows)):
+            if name == "result":
+                values = tuple(columnar.RESULT_CODES.get(value, -1) for value in values)
+            if column_type == columnar.STRING:
+                data = columnar.encode_strings(values)
+            elif column_type == columnar.DICT:
+                data = columnar.encode_numbers(column_type, self._encode_dict_values(name, values))
+            else:
+                data = columnar.encode_numbers(column_type, values)
+            chunks[name] = [self._file.tell(), len(data)]
+            self._file.write(data)
+        self._row_groups.append({"num_rows": len(rows), "columns": chunks})
+
+    def flush(self) -> None:
+        """Write the buffered operations as a (possibly smaller) row group."""
+        with self._lock:
+            if self._closed:
+                return
+            self._write_row_group()
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            atexit.unregister(self.close)
+            self._write_row_group()
+            footer = json.dumps({
+                "schema": [{"name": name, "type": column_type} for name, column_type in self.schema],
+                "dictionaries": {
+                    name: list(dictionary) for name, dictionary in self._dictionaries.items()
+                },
+                "results": {str(code): result for code, result in columnar.RESULTS.items()},
+                "row_groups": self._row_groups,
+            }).encode("utf-8")
+            self._file.write(footer)
+            self._file.write(len(footer).to_bytes(columnar.FOOTER_LENGTH_SIZE, "little"))
+            self._file.write(columnar.MAGIC)
+            self._file.close()
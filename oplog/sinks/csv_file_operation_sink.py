@@ -0,0 +1,66 @@
+import os
+import threading
+from typing import List, Optional, Union
+
+from oplog.formatters.csv_operation_formatter import CsvOperationFormatter
+from oplog.operation import Operation
+from oplog.operation_step import OperationStep
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class CsvFileOperationSink(BaseOperationSink):
+    # rows end with "\n", not the CRLF of RFC 4180 (set "\r\n" on a subclass)
+    terminator = "\n"
+
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 formatter: Optional[CsvOperationFormatter] = None,
+                 batch_size: int = 1_000,
+                 header: bool = True) -> None:
+        """A sink that appends finished operations to a CSV file, writing
+        many rows per `write` call.
+
+        :param filename: The path of the file to append to.
+        :param formatter: Optional. The CSV formatter (and its column schema).
+        :param batch_size: Optional. Number of operations buffered before writing.
+        :param header: Optional. If True, a header row is written to a new (or empty) file.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.filename = os.fspath(filename)
+        self.formatter = formatter if formatter is not None else CsvOperationFormatter()
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._ops: List[Operation] = []
+        # newline="" keeps newlines inside quoted fields as is
+        self._file = open(self.filename, "a", encoding="utf-8", newline="")
+        if header and self._file.tell() == 0:
+            self._file.write(self.formatter.header() + self.terminator)
+
+    def emit(self, op: Operation) -> None:
+        if op.step is not OperationStep.END:
+            return
+        with self._lock:
+            self._ops.append(op)
+            if len(self._ops) >= self.batch_size:
+                self._write_batch()
+
+    def _write_batch(self) -> None:
+        ops, self._ops = self._ops, []
+        if ops:
+            # a single write (and flush) per batch
+            self._file.write(self.formatter.format_ops(ops, terminator=self.terminator))
+            self._file.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_batch()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_batch()
+            self._file.close()
@@ -0,0 +1,29 @@
+import os
+from typing import Optional, Union
+
+from oplog.formatters.base_operation_formatter import BaseOperationFormatter
+from oplog.sinks.stream_operation_sink import StreamOperationSink
+
+
+class FileOperationSink(StreamOperationSink):
+    def __init__(self,
+                 formatter: BaseOperationFormatter,
+                 filename: Union[str, os.PathLike],
+                 mode: str = "a",
+                 encoding: Optional[str] = "utf-8") -> None:
+        """A sink that formats operations and writes them to a file.
+
+        :param formatter: The formatter used to format each operation.
+        :param filename: The path of the file to write to.
+        :param mode: Optional. The mode the file is opened with. Default is append.
+        :param encoding: Optional. The encoding of the file.
+        """
+        self.filename = os.fspath(filename)
+        super().__init__(formatter=formatter,
+                         stream=open(self.filename, mode, encoding=encoding))
+
+    def close(self) -> None:
+        with self._lock:
+            if not self.stream.closed:
+                self.stream.flush()
+                self.stream.close()
@@ -0,0 +1,27 @@
+import logging
+
+from oplog.operation_log_filter import OperationLogFilter
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class OperationSinkHandler(logging.Handler):
+    def __init__(self, sink: BaseOperationSink, *args, **kwargs):
+        """A logging handler that hands operation logs to an operation sink,
+        for using sinks with the standard `logging` setup.
+
+        Args:
+            sink (BaseOperationSink): The sink operations are emitted to.
+        """
+        super().__init__(*args, **kwargs)
+        self.sink = sink
+        self.addFilter(OperationLogFilter())
+
+    def emit(self, record):
+        self.sink.handle(record.oplog)
+
+    def flush(self):
+        self.sink.flush()
+
+    def close(self):
+        self.sink.close()
+        super().close()
@@ -0,0 +1,38 @@
+import threading
+from typing import Any, List
+
+from oplog.operation import Operation
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class QueueOperationSink(BaseOperationSink):
+    def __init__(self, queue: Any, batch_size: int = 512) -> None:
+        """A sink that puts operations into a queue, in batches (lists).
+        Used to ship operations across threads or processes (e.g., with a
+        `multiprocessing` queue, operations are pickled, see
+        `oplog.executors.OperationProcessPoolExecutor`).
+
+        :param queue: Any object with a `put` method.
+        :param batch_size: Optional. The number of buffered operations that
+        triggers a flush. Remaining operations are put on `flush`.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.queue = queue
+        self.batch_size = batch_size
+        self._buffer: List[Operation] = []
+        self._lock = threading.Lock()
+
+    def emit(self, op: Operation) -> None:
+        with self._lock:
+            self._buffer.append(op)
+            if len(self._buffer) < self.batch_size:
+                return
+            batch, self._buffer = self._buffer, []
+        self.queue.put(batch)
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self.queue.put(batch)
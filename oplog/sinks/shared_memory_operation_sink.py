@@ -0,0 +1,96 @@
+import pickle
+import threading
+import time
+from multiprocessing.connection import Client, Connection
+from typing import Any, Optional
+
+from oplog.operation import Operation
+from oplog.overflow_policy import OverflowPolicy
+from oplog.shared_memory_ring import SharedMemoryRing
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class SharedMemoryOperationSink(BaseOperationSink):
+    # how long a full ring is waited on (BLOCK) before retrying
+    block_interval_s = 0.0005
+
+    def __init__(self,
+                 ring: SharedMemoryRing,
+                 connection: Optional[Connection] = None,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+                 close_timeout_s: float = 5.0) -> None:
+        """A sink that encodes operations into a shared memory ring, drained
+        by the collector process of an `oplog.OperationFunnel`.
+        Formatting and I/O take place in the collector, so emitting costs
+        only the encoding and a memory copy. Use `connect` to create a ring
+        and register it with a running funnel.
+
+        :param ring: The ring this (single) process writes to.
+        :param connection: Optional. The registration connection to the
+        collector, closed when this sink is closed.
+        :param overflow_policy: Optional. What to do when the ring is full.
+        DROP_NEWEST drops the emitted operation, BLOCK waits for the collector.
+        :param close_timeout_s: Optional. How long `close` waits for the
+        collector to drain the ring.
+        """
+        if overflow_policy is OverflowPolicy.DROP_OLDEST:
+            # only the collector may advance the read position
+            raise ValueError("DROP_OLDEST is not supported by a shared memory ring")
+        self.ring = ring
+        self.connection = connection
+        self.overflow_policy = overflow_policy
+        self.close_timeout_s = close_timeout_s
+        self.dropped_records = 0
+        # operations may finish on any thread of this process, but the
+        # ring has a single producer
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def connect(cls,
+                address: Any,
+                authkey: bytes,
+                capacity: int = 1 << 20,
+                **kwargs: Any) -> "SharedMemoryOperationSink":
+        """Creates a ring of `capacity` bytes for this process, and registers
+        it with the funnel collector listening on `address`.
+        Other keyword arguments are passed to the sink.
+        """
+        ring = SharedMemoryRing.create(capacity=capacity)
+        try:
+            connection = Client(address, authkey=authkey)
+            connection.send(ring.name)
+            # acknowledged once the collector attached the ring
+            connection.recv()
+        except BaseException:
+            ring.close()
+            raise
+        return cls(ring, connection, **kwargs)
+
+    def emit(self, op: Operation) -> None:
+        record = pickle.dumps(op, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._closed:
+                self.dropped_records += 1
+                return
+            while not self.ring.put(record):
+                if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                    self.dropped_records += 1
+                    return
+                time.sleep(self.block_interval_s)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until the collector has read every record of the ring."""
+        deadline = time.monotonic() + (timeout if timeout is not None else self.close_timeout_s)
+        while self.ring.used and time.monotonic() < deadline:
+            time.sleep(self.block_interval_s)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+        self.ring.close()
@@ -0,0 +1,142 @@
+import logging
+import os
+import sys
+import threading
+import traceback
+from typing import Any, List, Mapping, Optional, Tuple, Union
+
+from oplog import sqlite_schema
+from oplog.formatters.json_operation_formatter import JsonOperationFormatter
+from oplog.global_props import GlobalPropsCache
+from oplog.operation import Operation
+from oplog.operation_step import OperationStep
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class SqliteOperationSink(BaseOperationSink):
+    def __init__(self,
+                 filename: Union[str, os.PathLike],
+                 flush_interval_s: float = 1.0,
+                 batch_size: int = 10_000) -> None:
+        """A sink that inserts finished operations into a local SQLite database
+        (see `oplog.sqlite_schema`), queried with `oplog.readers.SqliteOperationReader`.
+
+        Operations are buffered, and a background writer thread inserts them
+        with a single `executemany` transaction per `flush_interval_s`, so
+        emitting costs only building a row. The database is in WAL mode,
+        so it can be queried while it is written.
+
+        :param filename: The path of the database (created if missing).
+        :param flush_interval_s: Optional. How often buffered operations are inserted.
+        :param batch_size: Optional. Number of buffered operations that wakes
+        the writer before the interval ends.
+        """
+        if flush_interval_s <= 0:
+            raise ValueError(f"flush_interval_s must be positive, but got {flush_interval_s}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, but got {batch_size}")
+        self.filename = os.fspath(filename)
+        self.flush_interval_s = flush_interval_s
+        self.batch_size = batch_size
+        self._connection = sqlite_schema.create(self.filename)
+        self._rows: List[Tuple[Any, ...]] = []
+        self._rows_lock = threading.Lock()
+        # the connection is used by the writer thread, and by `flush`
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._encode_props = JsonOperationFormatter().encode_props
+        self._global_props_json = GlobalPropsCache(self._to_json)
+        self._writer = threading.Thread(
+            target=self._write_loop,
+            name=f"{self.__class__.__name__}-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _to_json(self, props: Mapping[str, Any]) -> Optional[str]:
+        # the props encoding of the JSON lines formatter (e.g., NaN is null)
+        return self._encode_props(props) if props else None
+
+    def emit(self, op: Operation) -> None:
+        if op.step is not OperationStep.END:
+            return
+        row = (
+            op.name,
+            op.start_time_ns,
+            op.duration_ns,
+            op.result,
+            op.id,
+            op.correlation_id,
+            op.parent_id,
+            op.depth,
+            op.exception_type,
+            op.exception_msg,
+            op.traceback_fingerprint,
+            op.process_id,
+            op.thread_id,
+            self._to_json(op.custom_props),
+            self._global_props_json.get(op.global_props),
+        )
+        with self._rows_lock:
+            # checked under the lock `close` drains the rows with, so a row
+            # is either drained or dropped, never left behind
+            if self._closed:
+                return
+            self._rows.append(row)
+            if len(self._rows) >= self.batch_size:
+                self._wake.set()
+
+    def _insert(self, rows: List[Tuple[Any, ...]]) -> None:
+        # a single transaction
+        with self._connection:
+            self._connection.executemany(sqlite_schema.INSERT, rows)
+
+    def _write_rows(self) -> None:
+        with self._write_lock:
+            if self._closed:
+                return
+            with self._rows_lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return
+            try:
+                self._insert(rows)
+            except Exception:
+                # put back (before rows emitted since), and retried by the next write
+                with self._rows_lock:
+                    self._rows[:0] = rows
+                raise
+
+    def _write_loop(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self._write_rows()
+            except Exception:
+                # the writer must outlive a failing batch (e.g., a locked database),
+                # same behavior as `logging.Handler.handleError`. the rows of
+                # the batch were put back, and are retried on the next write
+                if logging.raiseExceptions and sys.stderr:  # pragma: no branch
+                    sys.stderr.write(f"--- oplog sink error ({self.__class__.__name__}) ---\n")
+                    traceback.print_exc(file=sys.stderr)
+
+    def flush(self) -> None:
+        """Inserts the buffered operations now."""
+        self._write_rows()
+
+    def close(self) -> None:
+        with self._write_lock, self._rows_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._writer.join()
+        with self._write_lock, self._rows_lock:
+            rows, self._rows = self._rows, []
+            try:
+                if rows:
+                    self._insert(rows)
+            finally:
+                self._connection.close()
@@ -0,0 +1,40 @@
+import sys
+import threading
+from typing import Iterable, Optional, TextIO
+
+from oplog.formatters.base_operation_formatter import BaseOperationFormatter
+from oplog.operation import Operation
+from oplog.sinks.base_operation_sink import BaseOperationSink
+
+
+class StreamOperationSink(BaseOperationSink):
+    terminator = "\n"
+
+    def __init__(self,
+                 formatter: BaseOperationFormatter,
+                 stream: Optional[TextIO] = None) -> None:
+        """A sink that formats operations and writes them to a text stream.
+
+        :param formatter: The formatter used to format each operation.
+        :param stream: Optional. The stream to write to, defaults to sys.stderr.
+        """
+        self.formatter = formatter
+        self.stream = stream if stream is not None else sys.stderr
+        self._lock = threading.Lock()
+
+    def emit(self, op: Operation) -> None:
+        line = self.formatter.format_op(op=op) + self.terminator
+        with self._lock:
+            self.stream.write(line)
+
+    def emit_batch(self, ops: Iterable[Operation]) -> None:
+        # a single write call per batch
+        terminator = self.terminator
+        lines = "".join(self.formatter.format_op(op=op) + terminator for op in ops)
+        with self._lock:
+            self.stream.write(lines)
+
+    def flush(self) -> None:
+        with self._lock:
+            if hasattr(self.stream, "flush"):
+                self.stream.flush()
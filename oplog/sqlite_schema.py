@@ -0,0 +1,63 @@
+"""The schema of oplog SQLite databases (see `oplog.sinks.SqliteOperationSink`).
+
+A single `operations` table, with a row per finished operation. Columns are
+the fields of `oplog.readers.OperationRecord`, in order, with custom and
+global props as JSON objects (NULL when empty).
+"""
+import os
+import sqlite3
+from typing import Union
+
+TABLE = "operations"
+
+# (column name, column type), in the order of `OperationRecord` fields
+COLUMNS = (
+    ("name", "TEXT NOT NULL"),
+    ("start_time_ns", "INTEGER"),
+    ("duration_ns", "INTEGER"),
+    ("result", "TEXT"),
+    ("id", "TEXT"),
+    ("correlation_id", "TEXT"),
+    ("parent_id", "TEXT"),
+    ("depth", "INTEGER"),
+    ("exception_type", "TEXT"),
+    ("exception_msg", "TEXT"),
+    ("traceback_fingerprint", "TEXT"),
+    ("process_id", "INTEGER"),
+    ("thread_id", "INTEGER"),
+    ("custom_props", "TEXT"),
+    ("global_props", "TEXT"),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+
+# (index name, indexed columns). every index slows down inserts, these
+# serve the lookups of `oplog.readers.SqliteOperationReader`
+INDEXES = (
+    (f"{TABLE}_name_duration", "name, duration_ns"),
+    (f"{TABLE}_start_time", "start_time_ns"),
+    (f"{TABLE}_correlation_id", "correlation_id, start_time_ns"),
+)
+
+CREATE_TABLE = f"CREATE TABLE IF NOT EXISTS {TABLE} ({', '.join(f'{name} {column_type}' for name, column_type in COLUMNS)})"
+CREATE_INDEXES = tuple(f"CREATE INDEX IF NOT EXISTS {name} ON {TABLE} ({columns})" for name, columns in INDEXES)
+INSERT = f"INSERT INTO {TABLE} ({', '.join(COLUMN_NAMES)}) VALUES ({', '.join('?' for _ in COLUMNS)})"
+SELECT = f"SELECT {', '.join(COLUMN_NAMES)} FROM {TABLE}"
+
+
+def create(filename: Union[str, os.PathLike]) -> sqlite3.Connection:
+    """Opens (or creates) a database for writing: in WAL mode, so readers
+    do not block the writer, and with the table and its indexes."""
+    connection = sqlite3.connect(os.fspath(filename), check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # in WAL mode, transactions stay durable across application crashes
+    connection.execute("PRAGMA synchronous=NORMAL")
+    with connection:
+        connection.execute(CREATE_TABLE)
+        # columns added in later versions, to databases of older ones
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({TABLE})")}
+        for name, column_type in COLUMNS:
+            if name not in existing:
+                connection.execute(f"ALTER TABLE {TABLE} ADD COLUMN {name} {column_type}")
+        for create_index in CREATE_INDEXES:
+            connection.execute(create_index)
+    return connection
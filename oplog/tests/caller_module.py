@@ -0,0 +1,12 @@
+from typing import Callable
+
+from oplog.operation import Operation
+
+
+def create_op() -> Operation:
+    return Operation(name="caller_module_op")
+
+
+def call(create: Callable[[], Operation]) -> Operation:
+    # `create` is called from this module, but defined in another one
+    return create()
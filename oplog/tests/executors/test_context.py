@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from oplog.executors import map_with_context, submit_with_context
+from oplog.operation import Operation
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+def child_task(i: int) -> Tuple[Optional[str], str]:
+    with Operation(name=f"child_op{i}") as op:
+        pass
+    return op.parent_id, op.correlation_id
+
+
+class TestContext(OpLogTestCase):
+    def test_submitWithContext_threadPool_childOfSubmittingOperation(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with Operation(name="parent_op") as parent_op:
+                parent_id, correlation_id = submit_with_context(executor, child_task, 0).result()
+
+        self.assertEqual(parent_id, parent_op.id)
+        self.assertEqual(correlation_id, parent_op.correlation_id)
+
+    def test_mapWithContext_threadPool_childrenOfSubmittingOperation(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            with Operation(name="parent_op") as parent_op:
+                results = list(map_with_context(executor, child_task, range(8)))
+
+        self.assertEqual(results, [(parent_op.id, parent_op.correlation_id)] * 8)
+
+    def test_mapWithContext_processPool_childrenOfSubmittingOperation(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            with Operation(name="parent_op") as parent_op:
+                results = list(map_with_context(executor, child_task, range(4)))
+
+        self.assertEqual(results, [(parent_op.id, parent_op.correlation_id)] * 4)
+
+    def test_submitWithContext_noActiveOperation_noParent(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parent_id, _ = submit_with_context(executor, child_task, 0).result()
+
+        self.assertIsNone(parent_id)
@@ -0,0 +1,106 @@
+import itertools
+import multiprocessing
+from typing import Any, Dict
+
+from oplog.executors import OperationProcessPoolExecutor
+from oplog.id_generators import BaseIdGenerator
+from oplog.operation import Operation
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class ChildTaskException(Exception):
+    pass
+
+
+def child_task(i: int) -> int:
+    with Operation(name=f"child_op{i}") as op:
+        op.add("i", i)
+        with Operation(name=f"grandchild_op{i}"):
+            pass
+    return i * 2
+
+
+def failing_task() -> None:
+    with Operation(name="failing_op"):
+        raise ChildTaskException("failure")
+
+
+def global_props_task() -> Dict[str, Any]:
+    return dict(Operation.global_props)
+
+
+def id_task() -> str:
+    with Operation(name="id_op") as op:
+        pass
+    return op.id
+
+
+class PrefixIdGenerator(BaseIdGenerator):
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._counter = itertools.count(1)
+
+    def __reduce__(self):
+        return type(self), (self.prefix,)
+
+    def generate(self) -> str:
+        return f"{self.prefix}-{next(self._counter)}"
+
+
+class TestOperationProcessPoolExecutor(OpLogTestCase):
+    def test_map_opsShippedAndChildrenOfSubmittingOperation(self):
+        with Operation(name="parent_op") as parent_op:
+            with OperationProcessPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(child_task, range(4)))
+
+        self.assertEqual(results, [0, 2, 4, 6])
+        for i in range(4):
+            child_op = self.get_op(f"child_op{i}")
+            grandchild_op = self.get_op(f"grandchild_op{i}")
+            self.assertEqual(child_op.parent_id, parent_op.id)
+            self.assertEqual(child_op.correlation_id, parent_op.correlation_id)
+            self.assertEqual(child_op.custom_props, {"i": i})
+            self.assertEqual(grandchild_op.parent_id, child_op.id)
+            self.assertEqual((child_op.depth, grandchild_op.depth), (parent_op.depth + 1, parent_op.depth + 2))
+            self.assertEqual(grandchild_op.correlation_id, parent_op.correlation_id)
+
+    def test_submit_failure_opShippedWithTraceback(self):
+        with OperationProcessPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(failing_task)
+            with self.assertRaises(ChildTaskException):
+                future.result()
+
+        failing_op = self.get_op("failing_op")
+        self.assertEqual(failing_op.result, "Failure")
+        self.assertIsNotNone(failing_op.traceback_fingerprint)
+        self.assertTrue(any("raise ChildTaskException" in line for line in failing_op.traceback))
+
+    def test_submit_globalProps_usedByWorkers(self):
+        Operation.add_global("service", "test_service")
+
+        # spawned workers do not inherit the global props of this process
+        spawn_context = multiprocessing.get_context("spawn")
+        with OperationProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+            global_props = executor.submit(global_props_task).result()
+
+        self.assertEqual(global_props, {"service": "test_service"})
+
+    def test_submit_configuredIdGenerator_usedByWorkers(self):
+        Operation.config(id_generator=PrefixIdGenerator("worker"))
+
+        spawn_context = multiprocessing.get_context("spawn")
+        with OperationProcessPoolExecutor(max_workers=1, mp_context=spawn_context) as executor:
+            op_id = executor.submit(id_task).result()
+
+        self.assertEqual(op_id, "worker-1")
+
+    def test_map_configuredLoggerName_opsLoggedToIt(self):
+        Operation.config(logger_name="pool_logger")
+
+        with Operation(name="parent_op"):
+            with OperationProcessPoolExecutor(max_workers=1) as executor:
+                list(executor.map(child_task, range(2)))
+
+        logger_names = {log.oplog.name: log.name for log in self.handler.logs}
+        self.assertEqual(set(logger_names.values()), {"pool_logger"})
+        self.assertEqual(len(logger_names), 5)
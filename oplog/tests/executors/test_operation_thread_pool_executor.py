@@ -0,0 +1,68 @@
+import itertools
+import threading
+import time
+
+from oplog.executors import OperationThreadPoolExecutor
+from oplog.id_generators.base_id_generator import BaseIdGenerator
+from oplog.operation import Operation
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class SlowIdGenerator(BaseIdGenerator):
+    """Widens the window in which threads race on the first read of an id."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def generate(self) -> str:
+        time.sleep(0.01)
+        return f"id_{next(self._counter)}"
+
+
+def child_task(i: int) -> int:
+    with Operation(name=f"child_op{i}"):
+        return i * 2
+
+
+class TestOperationThreadPoolExecutor(OpLogTestCase):
+    def test_submit_childOfSubmittingOperation(self):
+        with OperationThreadPoolExecutor(max_workers=2) as executor:
+            with Operation(name="parent_op") as parent_op:
+                result = executor.submit(child_task, 1).result()
+
+        child_op = self.get_op("child_op1")
+        self.assertEqual(result, 2)
+        self.assertIs(child_op.parent_op, parent_op)
+        self.assertEqual(child_op.correlation_id, parent_op.correlation_id)
+
+    def test_map_allChildrenOfSubmittingOperation(self):
+        with OperationThreadPoolExecutor(max_workers=4) as executor:
+            with Operation(name="parent_op") as parent_op:
+                results = list(executor.map(child_task, range(8)))
+
+        self.assertEqual(results, [i * 2 for i in range(8)])
+        for i in range(8):
+            self.assertEqual(self.get_op(f"child_op{i}").parent_id, parent_op.id)
+
+    def test_map_slowIdGenerator_childrenShareParentIds(self):
+        Operation.config(id_generator=SlowIdGenerator())
+        children = 8
+        barrier = threading.Barrier(children)
+
+        def read_parent_ids(_):
+            with Operation(name="child_op") as op:
+                # all children read the (not yet generated) parent ids at once
+                barrier.wait()
+                return op.parent_id, op.correlation_id
+
+        with OperationThreadPoolExecutor(max_workers=children) as executor:
+            with Operation(name="parent_op") as parent_op:
+                results = list(executor.map(read_parent_ids, range(children)))
+
+        self.assertEqual(set(results), {(parent_op.id, parent_op.correlation_id)})
+
+    def test_submit_noActiveOperation_noParent(self):
+        with OperationThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(child_task, 1).result()
+
+        self.assertIsNone(self.get_op("child_op1").parent_op)
@@ -1,4 +1,5 @@
 import csv
+import io
 
 from oplog import Operation
 from oplog.formatters import CsvOperationFormatter
@@ -28,3 +29,134 @@ class TestCsvOperationFormatter(OpLogTestCase):
         first_row = next(csv_reader)
         num_columns = len(first_row)
         return num_columns
+
+    def test_formatOp_embeddedQuotesCommasNewlines_roundTrips(self):
+        # arrange
+        error_msg = 'bad "value", at\nline 2'
+        with Operation(name="test_op", suppress=True) as op:
+            raise ValueError(error_msg)
+        formatter = CsvOperationFormatter(columns=("name", "exception_msg"))
+
+        # act
+        row = next(csv.reader(io.StringIO(formatter.format_op(op=op))))
+
+        # assert
+        self.assertEqual(row, ["test_op", error_msg])
+
+    def test_formatOp_defaultColumns_sameOrderAsHeader(self):
+        # arrange
+        with Operation(name="test_op") as op:
+            pass
+        formatter = CsvOperationFormatter()
+
+        # act
+        header = next(csv.reader([formatter.header()]))
+        row = next(csv.reader([formatter.format_op(op=op)]))
+
+        # assert
+        values = dict(zip(header, row))
+        self.assertEqual(values["name"], "test_op")
+        self.assertEqual(values["result"], "Success")
+        self.assertEqual(values["start_time_utc_str"], op.start_time_utc_str)
+        self.assertEqual(values["exception_type"], "")
+
+    def test_formatOp_customAndGlobalProps_written(self):
+        # arrange
+        Operation.add_global("region", "eu")
+        with Operation(name="test_op") as op:
+            op.add("user", "user_1")
+        formatter = CsvOperationFormatter(
+            columns=("name",), custom_props=("user", "missing"), global_props=("region",))
+
+        # act
+        header = next(csv.reader([formatter.header()]))
+        row = next(csv.reader([formatter.format_op(op=op)]))
+
+        # assert
+        self.assertEqual(header, ["name", "custom_props.user", "custom_props.missing",
+                                  "global_props.region"])
+        self.assertEqual(row, ["test_op", "user_1", "", "eu"])
+
+    def test_formatOp_globalPropAddedAfterFormatting_written(self):
+        # arrange
+        Operation.add_global("region", 'e"u')
+        formatter = CsvOperationFormatter(columns=("name",), global_props=("region", "build"))
+        with Operation(name="test_op") as op:
+            pass
+        formatter.format_op(op=op)
+
+        # act
+        Operation.add_global("build", "1.0")
+        row = next(csv.reader([formatter.format_op(op=op)]))
+
+        # assert
+        self.assertEqual(row, ["test_op", 'e"u', "1.0"])
+
+    def test_formatOp_onlyGlobalProps_written(self):
+        # arrange
+        Operation.add_global("region", "eu")
+        formatter = CsvOperationFormatter(columns=(), global_props=("region",))
+        with Operation(name="test_op") as op:
+            pass
+
+        # act
+        row = formatter.format_op(op=op)
+
+        # assert
+        self.assertEqual(row, '"eu"')
+
+    def test_formatOp_defaultColumns_idsAndDepthWritten(self):
+        # arrange
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="test_op") as op:
+                pass
+        formatter = CsvOperationFormatter()
+
+        # act
+        values = dict(zip(next(csv.reader([formatter.header()])),
+                          next(csv.reader([formatter.format_op(op=op)]))))
+
+        # assert
+        self.assertEqual(values["id"], op.id)
+        self.assertEqual(values["parent_id"], parent_op.id)
+        self.assertEqual(values["depth"], "1")
+
+    def test_init_unknownColumn_raises(self):
+        with self.assertRaises(ValueError):
+            CsvOperationFormatter(columns=("unknown",))
+
+    def test_init_columnNotAnIdentifier_raises(self):
+        with self.assertRaises(ValueError):
+            CsvOperationFormatter(columns=("name; import os",))
+
+    def test_formatOp_quotedPropNameAndNoneValues_written(self):
+        # arrange
+        prop = "it's \"quoted\""
+        with Operation(name="test_op") as op:
+            op.add(prop, 'a "value"')
+        formatter = CsvOperationFormatter(columns=("name", "exception_type"), custom_props=(prop, "missing"))
+
+        # act
+        row = formatter.format_op(op)
+
+        # assert
+        self.assertEqual(row, '"test_op","","a ""value""",""')
+        self.assertEqual(formatter.column_names[2], f"custom_props.{prop}")
+
+    def test_formatOps_noOps_empty(self):
+        self.assertEqual(CsvOperationFormatter().format_ops([]), "")
+
+    def test_formatOps_rowsTerminated(self):
+        # arrange
+        ops = []
+        for i in range(3):
+            with Operation(name=f"test_op_{i}") as op:
+                pass
+            ops.append(op)
+        formatter = CsvOperationFormatter(columns=("name",))
+
+        # act
+        rows = formatter.format_ops(ops)
+
+        # assert
+        self.assertEqual(rows, '"test_op_0"\n"test_op_1"\n"test_op_2"\n')
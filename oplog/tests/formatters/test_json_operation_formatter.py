@@ -0,0 +1,167 @@
+import json
+import unittest
+
+from oplog import Operation
+from oplog.formatters import JsonOperationFormatter
+from oplog.formatters import json_operation_formatter
+from oplog.readers import JSON_KEYS, OperationRecord
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestJsonOperationFormatter(OpLogTestCase):
+    def test_formatOp_keysInOrderOfJsonKeys(self):
+        # arrange
+        Operation.add_global("region", "eu")
+        with Operation(name="test_op") as op:
+            op.add("user", "user_1")
+        formatter = JsonOperationFormatter()
+
+        # act
+        values = json.loads(formatter.format_op(op=op))
+
+        # assert
+        self.assertEqual(list(values), list(JSON_KEYS))
+        self.assertEqual(values["start_time_utc"], op.start_time_utc_str)
+        self.assertEqual(values["start_time_ns"], op.start_time_ns)
+        self.assertEqual(values["duration_ns"], op.duration_ns)
+        self.assertEqual(values["name"], "test_op")
+        self.assertEqual(values["result"], "Success")
+        self.assertEqual(values["id"], op.id)
+        self.assertEqual(values["correlation_id"], op.correlation_id)
+        self.assertEqual(values["process_id"], op.process_id)
+        self.assertEqual(values["thread_id"], op.thread_id)
+        self.assertEqual(values["custom_props"], {"user": "user_1"})
+        self.assertEqual(values["global_props"], {"region": "eu"})
+
+    def test_formatOp_failureWithMultilineMessage_singleLine(self):
+        # arrange
+        error_msg = 'bad "value",\nline 2'
+        with Operation(name="test_op", suppress=True) as op:
+            raise ValueError(error_msg)
+        formatter = JsonOperationFormatter()
+
+        # act
+        line = formatter.format_op(op=op)
+
+        # assert
+        self.assertNotIn("\n", line)
+        values = json.loads(line)
+        self.assertEqual(values["result"], "Failure")
+        self.assertEqual(values["exception_type"], "ValueError")
+        self.assertEqual(values["exception_msg"], error_msg)
+        self.assertEqual(values["traceback_fingerprint"], op.traceback_fingerprint)
+
+    def test_formatOp_nonJsonCustomProps_writtenAsStrings(self):
+        # arrange
+        circular = {}
+        circular["self"] = circular
+        with Operation(name="test_op") as op:
+            pass
+        formatter = JsonOperationFormatter()
+
+        for props in ({"value": object()}, {("a", "b"): 1}, {"value": circular}):
+            with self.subTest(props=props):
+                op.custom_props = props
+
+                # act
+                custom_props = json.loads(formatter.format_op(op=op))["custom_props"]
+
+                # assert
+                self.assertEqual(len(custom_props), 1)
+                self.assertIsInstance(next(iter(custom_props.values())), (str, int))
+
+    def test_formatOp_nonFiniteFloats_writtenAsNullByEveryEncoder(self):
+        # arrange
+        with Operation(name="test_op") as op:
+            op.add("ratio", float("nan"))
+            op.add("limit", float("inf"))
+            op.add("count", 1)
+        encoders = [False] + ([True] if json_operation_formatter.orjson is not None else [])
+
+        for use_orjson in encoders:
+            with self.subTest(use_orjson=use_orjson):
+                # act
+                line = JsonOperationFormatter(use_orjson=use_orjson).format_op(op=op)
+
+                # assert, strict parsing rejects NaN and Infinity
+                values = json.loads(line, parse_constant=self.fail)
+                self.assertEqual(values["custom_props"], {"ratio": None, "limit": None, "count": 1})
+
+    def test_formatOp_intOutOfRange_writtenExactly(self):
+        # arrange
+        with Operation(name="test_op") as op:
+            op.add("big", 2 ** 70)
+        formatter = JsonOperationFormatter()
+
+        # act
+        values = json.loads(formatter.format_op(op=op))
+
+        # assert
+        self.assertEqual(values["custom_props"], {"big": 2 ** 70})
+
+    def test_formatOp_globalPropAddedAfterFormatting_written(self):
+        # arrange
+        formatter = JsonOperationFormatter()
+        with Operation(name="test_op") as op:
+            pass
+        formatter.format_op(op=op)
+
+        # act
+        Operation.add_global("region", "eu")
+        values = json.loads(formatter.format_op(op=op))
+
+        # assert
+        self.assertEqual(values["global_props"], {"region": "eu"})
+
+    def test_formatOp_record_sameAsRecordToDict(self):
+        # arrange
+        record = OperationRecord(
+            name="test_op",
+            start_time_ns=1_687_415_273_922_633_123,
+            duration_ns=2_500_000,
+            result="Success",
+            id="id_0",
+            correlation_id="correlation_0",
+            depth=1,
+            custom_props={"user": "user_0"},
+            global_props={"service": "test_service"},
+        )
+        formatter = JsonOperationFormatter()
+
+        # act
+        values = json.loads(formatter.format_op(op=record))
+
+        # assert
+        self.assertEqual(values, record.to_dict())
+
+    @unittest.skipIf(json_operation_formatter.orjson is None, "orjson is not installed")
+    def test_formatOp_withAndWithoutOrjson_sameValues(self):
+        # arrange
+        Operation.add_global("region", "eu")
+        with Operation(name="test_op") as op:
+            op.add("user", "üser")
+            op.add("ratio", 0.5)
+            op.add("enabled", True)
+
+        # act
+        fast = JsonOperationFormatter(use_orjson=True).format_op(op=op)
+        slow = JsonOperationFormatter(use_orjson=False).format_op(op=op)
+
+        # assert
+        self.assertEqual(fast, slow)
+
+    def test_formatOps_linesTerminated(self):
+        # arrange
+        ops = []
+        for i in range(3):
+            with Operation(name=f"test_op_{i}") as op:
+                pass
+            ops.append(op)
+        formatter = JsonOperationFormatter()
+
+        # act
+        lines = formatter.format_ops(ops).splitlines()
+
+        # assert
+        self.assertEqual([json.loads(line)["name"] for line in lines],
+                         ["test_op_0", "test_op_1", "test_op_2"])
@@ -1,5 +1,6 @@
 from oplog import Operation
 from oplog.formatters import VerboseOperationFormatter
+from oplog.readers import OperationRecord
 from oplog.tests.logged_test_case import OpLogTestCase
 
 
@@ -40,6 +41,36 @@ class TestVerboseOperationFormatter(OpLogTestCase):
         self.assertIn(global_prop_name, log_line)
         self.assertIn(global_prop_value, log_line)
 
+    def test_formatOp_globalPropAddedAfterFormatting_rendered(self):
+        # arrange
+        formatter = VerboseOperationFormatter()
+        with Operation(name="test_operation") as op:
+            pass
+        before = formatter.format_op(op=op)
+
+        # act
+        Operation.add_global("some_global_prop", "some_global_value")
+        after = formatter.format_op(op=op)
+
+        # assert
+        self.assertNotIn("some_global_prop", before)
+        self.assertTrue(after.endswith(" {'some_global_prop': 'some_global_value'}"))
+
+    def test_formatOp_childOperation_parentIdAndDepthRendered(self):
+        # arrange
+        with Operation(name="parent_operation") as parent_op:
+            with Operation(name="test_operation") as op:
+                pass
+        formatter = VerboseOperationFormatter()
+
+        # act
+        child_line = formatter.format_op(op=op)
+        root_line = formatter.format_op(op=parent_op)
+
+        # assert
+        self.assertIn(f"(parent_id={parent_op.id}, depth=1)", child_line)
+        self.assertNotIn("parent_id", root_line)
+
     def test_formatOp_operationFailure(self):
         # arrange
         op_name = "test_operation"
@@ -54,3 +85,32 @@ class TestVerboseOperationFormatter(OpLogTestCase):
         # assert
         self.assertIn(VerboseOplogLineFormatterTestException.__name__, log_line)
         self.assertIn(error_msg, log_line)
+
+    def test_formatOp_record_formattedAsOperation(self):
+        # arrange
+        record = OperationRecord(name="test_operation", start_time_ns=1_693_736_701_000_000_000,
+                                 duration_ns=5_000_000, result="Success", parent_id="parent_0", depth=1,
+                                 custom_props={"some_custom_prop": 1},
+                                 global_props={"some_global_prop": "some_global_value"})
+        formatter = VerboseOperationFormatter()
+
+        # act
+        log_line = formatter.format_op(op=record)
+
+        # assert
+        self.assertEqual(log_line,
+                         f"{record.start_time_utc_str} (5ms): [test_operation / Success]"
+                         " (parent_id=parent_0, depth=1) {'some_custom_prop': 1}"
+                         " {'some_global_prop': 'some_global_value'}")
+
+    def test_formatOp_started_noDuration(self):
+        # arrange
+        formatter = VerboseOperationFormatter()
+
+        # act
+        with Operation(name="test_operation") as op:
+            log_line = formatter.format_op(op=op)
+
+        # assert
+        self.assertIn(": [test_operation / started]", log_line)
+        self.assertNotIn("ms)", log_line)
@@ -0,0 +1,56 @@
+import pickle
+import threading
+import unittest
+import uuid
+
+from oplog.id_generators import BufferedRandomIdGenerator
+
+
+class TestBufferedRandomIdGenerator(unittest.TestCase):
+    def test_generate_validUuid4(self):
+        generator = BufferedRandomIdGenerator(batch_size=4)
+
+        for _ in range(10):
+            id_ = generator.generate()
+            parsed = uuid.UUID(id_)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+            self.assertEqual(str(parsed), id_)
+
+    def test_pickle_batchSizeKept(self):
+        generator = BufferedRandomIdGenerator(batch_size=4)
+        generator.generate()
+
+        unpickled = pickle.loads(pickle.dumps(generator))
+
+        self.assertEqual(unpickled.batch_size, 4)
+        self.assertEqual(uuid.UUID(unpickled.generate()).version, 4)
+
+    def test_generate_manyThreads_unique(self):
+        generator = BufferedRandomIdGenerator(batch_size=8)
+        ids = []
+
+        def run():
+            ids.extend(generator.generate() for _ in range(1000))
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(ids)), 4000)
+
+    def test_generate_afterFork_bufferRefilled(self):
+        generator = BufferedRandomIdGenerator()
+        generator.generate()
+        buffer = generator._local.buffer
+
+        BufferedRandomIdGenerator._after_fork()
+        generator.generate()
+
+        self.assertIsNot(generator._local.buffer, buffer)
+
+    def test_init_invalidBatchSize_raises(self):
+        with self.assertRaises(ValueError):
+            BufferedRandomIdGenerator(batch_size=0)
@@ -0,0 +1,34 @@
+import pickle
+import unittest
+
+from oplog.id_generators import CounterIdGenerator
+
+
+class TestCounterIdGenerator(unittest.TestCase):
+    def test_generate_sequentialWithProcessPrefix(self):
+        generator = CounterIdGenerator()
+
+        ids = [generator.generate() for _ in range(3)]
+
+        self.assertEqual(ids, [f"{generator.prefix}-{i}" for i in (1, 2, 3)])
+
+    def test_generate_generatorsHaveDistinctPrefixes(self):
+        self.assertNotEqual(CounterIdGenerator().prefix, CounterIdGenerator().prefix)
+
+    def test_pickle_newPrefix(self):
+        generator = CounterIdGenerator()
+
+        unpickled = pickle.loads(pickle.dumps(generator))
+
+        self.assertIsInstance(unpickled, CounterIdGenerator)
+        self.assertNotEqual(unpickled.prefix, generator.prefix)
+
+    def test_generate_afterFork_newPrefix(self):
+        generator = CounterIdGenerator()
+        first = generator.generate()
+        prefix = generator.prefix
+
+        CounterIdGenerator._after_fork()
+
+        self.assertNotEqual(generator.prefix, prefix)
+        self.assertNotEqual(generator.generate(), first)
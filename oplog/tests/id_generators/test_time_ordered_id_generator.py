@@ -0,0 +1,42 @@
+import time
+import unittest
+import uuid
+from unittest.mock import patch
+
+from oplog.id_generators import TimeOrderedIdGenerator
+
+
+class TestTimeOrderedIdGenerator(unittest.TestCase):
+    def test_generate_validUuid7(self):
+        generator = TimeOrderedIdGenerator()
+
+        parsed = uuid.UUID(generator.generate())
+
+        self.assertEqual(parsed.version, 7)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_generate_timestampIsNow(self):
+        generator = TimeOrderedIdGenerator()
+
+        parsed = uuid.UUID(generator.generate())
+
+        timestamp_ms = parsed.int >> 80
+        self.assertLess(abs(timestamp_ms - time.time_ns() // 1_000_000), 1000)
+
+    def test_generate_sorted(self):
+        generator = TimeOrderedIdGenerator()
+
+        ids = [generator.generate() for _ in range(10_000)]
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_generate_clockMovedBackwards_stillSorted(self):
+        generator = TimeOrderedIdGenerator()
+        first = generator.generate()
+
+        with patch("oplog.id_generators.time_ordered_id_generator.clock") as clock_mock:
+            clock_mock.wall_offset_ns.return_value = -10 ** 12
+            second = generator.generate()
+
+        self.assertLess(first, second)
@@ -2,6 +2,7 @@ import logging
 from typing import List
 import unittest
 
+from oplog.operated import Operated
 from oplog.operation import Operation
 
 
@@ -42,6 +43,7 @@ class OpLogTestCase(LoggedTestCase):
 
     def tearDown(self):
         Operation.factory_reset()
+        Operated.factory_reset()
         return super().tearDown()
 
     
@@ -73,4 +75,5 @@ class OpLogAsyncTestCase(LoggedAsyncTestCase):
 
     async def asyncTearDown(self):
         Operation.factory_reset()
+        Operated.factory_reset()
         return super().tearDown()
\ No newline at end of file
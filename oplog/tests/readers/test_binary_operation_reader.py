@@ -0,0 +1,103 @@
+import os
+import tempfile
+
+from oplog import Operation, binary
+from oplog.readers import BinaryOperationReader
+from oplog.sinks import BinaryFileOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class BinaryTestException(Exception):
+    pass
+
+
+class TestBinaryOperationReader(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.opb")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _write_ops(self, num_ops=5, **sink_kwargs):
+        sink = BinaryFileOperationSink(self.filename, **sink_kwargs)
+        Operation.config(sinks=[sink])
+        ops = []
+        with Operation(name="parent_op") as parent_op:
+            for i in range(num_ops):
+                with Operation(name=f"test_op_{i % 2}") as op:
+                    op.add("user", f"user_{i}")
+                    op.add("count", -i)
+                    op.add("ratio", i / 2)
+                    op.add("flag", i % 2 == 0)
+                ops.append(op)
+            with Operation(name="failed_op", suppress=True) as op:
+                raise BinaryTestException("test exception")
+            ops.append(op)
+        ops.append(parent_op)
+        sink.close()
+        return ops
+
+    def test_iter_recordsMatchOperations(self):
+        Operation.add_global("service", "test_service")
+        ops = self._write_ops()
+
+        records = list(BinaryOperationReader(self.filename))
+
+        self.assertEqual(len(records), len(ops))
+        for record, op in zip(records, ops):
+            self.assertEqual(record.name, op.name)
+            self.assertEqual(record.start_time_ns, op.start_time_ns)
+            self.assertEqual(record.duration_ns, op.duration_ns)
+            self.assertEqual(record.result, op.result)
+            self.assertEqual(record.id, op.id)
+            self.assertEqual(record.correlation_id, op.correlation_id)
+            self.assertEqual(record.parent_id, op.parent_id)
+            self.assertEqual(record.depth, op.depth)
+            self.assertEqual(record.exception_type, op.exception_type)
+            self.assertEqual(record.exception_msg, op.exception_msg)
+            self.assertEqual(record.traceback_fingerprint, op.traceback_fingerprint)
+            self.assertEqual(record.process_id, op.process_id)
+            self.assertEqual(record.thread_id, op.thread_id)
+            self.assertEqual(record.custom_props, op.custom_props)
+            self.assertEqual(record.global_props, {"service": "test_service"})
+            self.assertEqual(record.start_time_utc_str, op.start_time_utc_str)
+            self.assertEqual(record.duration_ms, op.duration_ms)
+
+    def test_iter_smallSegmentsAndBlocks_allRecordsRead(self):
+        ops = self._write_ops(num_ops=50, segment_size=3, batch_size=7)
+        reader = BinaryOperationReader(self.filename)
+        reader.block_size = 16
+
+        self.assertEqual([record.id for record in reader], [op.id for op in ops])
+
+    def test_iter_byteRanges_eachRecordReadOnce(self):
+        ops = self._write_ops(num_ops=50, segment_size=4)
+        file_size = os.path.getsize(self.filename)
+        bounds = [0, 100, 101, file_size // 2, file_size - 1, file_size]
+
+        ids = []
+        for start, end in zip(bounds, bounds[1:]):
+            ids.extend(record.id for record in BinaryOperationReader(self.filename, start, end))
+
+        self.assertEqual(ids, [op.id for op in ops])
+
+    def test_iter_appendedFile_allRecordsRead(self):
+        first_ops = self._write_ops(num_ops=2)
+        second_ops = self._write_ops(num_ops=2)
+
+        records = list(BinaryOperationReader(self.filename))
+
+        self.assertEqual([record.name for record in records],
+                         [op.name for op in first_ops + second_ops])
+        with open(self.filename, "rb") as f:
+            self.assertEqual(f.read().count(binary.MAGIC), 1)
+
+    def test_init_notBinaryFile_raises(self):
+        with open(self.filename, "wb") as f:
+            f.write(b"not an oplog file")
+
+        with self.assertRaises(ValueError):
+            BinaryOperationReader(self.filename)
@@ -0,0 +1,101 @@
+import os
+import tempfile
+
+from oplog import Operation
+from oplog.readers import ColumnarOperationReader
+from oplog.sinks import ColumnarOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class ColumnarTestException(Exception):
+    pass
+
+
+class TestColumnarOperationReader(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.opc")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _write_ops(self, **sink_kwargs):
+        sink = ColumnarOperationSink(self.filename, **sink_kwargs)
+        Operation.config(sinks=[sink])
+        ops = []
+        for i in range(5):
+            with Operation(name=f"test_op_{i % 2}") as op:
+                op.add("user", f"user_{i}")
+            ops.append(op)
+        with Operation(name="failed_op", suppress=True) as op:
+            raise ColumnarTestException("test exception")
+        ops.append(op)
+        sink.close()
+        return ops
+
+    def test_readColumn_valuesMatchOperations(self):
+        ops = self._write_ops(row_group_size=2, custom_props=("user",))
+
+        reader = ColumnarOperationReader(self.filename)
+
+        self.assertEqual(reader.num_rows, 6)
+        self.assertEqual(reader.read_column("name"), [op.name for op in ops])
+        self.assertEqual(list(reader.read_column("start_time_ns")), [op.start_time_ns for op in ops])
+        self.assertEqual(list(reader.read_column("duration_ns")), [op.duration_ns for op in ops])
+        self.assertEqual(reader.read_column("result"), [op.result for op in ops])
+        self.assertEqual(reader.read_column("exception_type"), [op.exception_type for op in ops])
+        self.assertEqual(reader.read_column("correlation_id"), [op.correlation_id for op in ops])
+        self.assertEqual(
+            reader.read_column("custom_props.user"),
+            [op.custom_props.get("user") for op in ops])
+
+    def test_readColumn_notDecoded_dictionaryCodes(self):
+        self._write_ops()
+
+        reader = ColumnarOperationReader(self.filename)
+
+        codes = reader.read_column("name", decode=False)
+        self.assertEqual(list(codes), [0, 1, 0, 1, 0, 2])
+        self.assertEqual(reader.dictionary("name"), ["test_op_0", "test_op_1", "failed_op"])
+
+    def test_iterRows_selectedColumns(self):
+        ops = self._write_ops()
+
+        rows = list(ColumnarOperationReader(self.filename).iter_rows(["name", "result"]))
+
+        self.assertEqual(rows[-1], {"name": "failed_op", "result": "Failure"})
+        self.assertEqual(len(rows), len(ops))
+
+    def test_readColumn_unknownColumn_raises(self):
+        self._write_ops()
+
+        with self.assertRaises(KeyError):
+            ColumnarOperationReader(self.filename).read_column("unknown")
+
+    def test_reader_sinkNotClosed_raises(self):
+        sink = ColumnarOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+        with Operation(name="test_op"):
+            pass
+        sink.flush()
+
+        with self.assertRaises(ValueError):
+            ColumnarOperationReader(self.filename)
+        sink.close()
+
+    def test_reader_notColumnarFile_raises(self):
+        with open(self.filename, "w") as f:
+            f.write("not columnar")
+
+        with self.assertRaises(ValueError):
+            ColumnarOperationReader(self.filename)
+
+    def test_reader_noOperations_emptyColumns(self):
+        ColumnarOperationSink(self.filename).close()
+
+        reader = ColumnarOperationReader(self.filename)
+
+        self.assertEqual(reader.num_rows, 0)
+        self.assertEqual(list(reader.read_column("duration_ns")), [])
@@ -0,0 +1,64 @@
+import io
+import json
+import unittest
+
+from oplog.formatters import CsvOperationFormatter
+from oplog.readers import JSON_KEYS, OperationRecord, to_csv, to_json_lines
+
+RECORDS = [
+    OperationRecord(
+        name="test_op",
+        start_time_ns=1_687_415_273_922_633_123,
+        duration_ns=2_500_000,
+        result="Success",
+        id="id_0",
+        correlation_id="correlation_0",
+        custom_props={"user": 'user "0"'},
+        global_props={"service": "test_service"},
+    ),
+    OperationRecord(
+        name="failed_op",
+        start_time_ns=1_687_415_274_000_000_000,
+        duration_ns=1_000,
+        result="Failure",
+        id="id_1",
+        correlation_id="correlation_0",
+        parent_id="id_0",
+        exception_type="ValueError",
+        exception_msg="failure",
+        custom_props={"user": object()},
+        global_props={"service": "test_service"},
+    ),
+]
+
+
+class TestConverters(unittest.TestCase):
+    def test_toCsv_rowsAsCsvFormatter(self):
+        stream = io.StringIO()
+        formatter = CsvOperationFormatter(
+            columns=["start_time_utc_str", "duration_ms", "name", "result"],
+            custom_props=["user"],
+            global_props=["service"],
+        )
+
+        count = to_csv(RECORDS[:1], stream, formatter=formatter)
+
+        self.assertEqual(count, 1)
+        self.assertEqual(stream.getvalue().splitlines(), [
+            '"start_time_utc_str","duration_ms","name","result",'
+            '"custom_props.user","global_props.service"',
+            '"2023-06-22 06:27:53.922633","2","test_op","Success","user ""0""","test_service"',
+        ])
+
+    def test_toJsonLines_keysInOrderAndValuesSerialized(self):
+        stream = io.StringIO()
+
+        count = to_json_lines(RECORDS, stream)
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(count, 2)
+        self.assertEqual(list(lines[0]), list(JSON_KEYS))
+        self.assertEqual(lines[0]["start_time_utc"], "2023-06-22 06:27:53.922633")
+        self.assertEqual(lines[0]["custom_props"], {"user": 'user "0"'})
+        self.assertEqual(lines[1]["parent_id"], "id_0")
+        self.assertTrue(lines[1]["custom_props"]["user"].startswith("<object object"))
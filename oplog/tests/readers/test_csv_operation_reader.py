@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from oplog.formatters import CsvOperationFormatter
+from oplog.readers import CsvOperationReader, OperationRecord, split, to_csv
+from oplog.readers.csv_operation_reader import row_starts
+
+RECORDS = [
+    OperationRecord(
+        name=f"test_op_{i % 2}",
+        start_time_ns=1_687_415_273_000_000_000 + i * 1_000_000_000,
+        duration_ns=i * 1_000_000,
+        result="Failure" if i % 3 == 0 else "Success",
+        correlation_id=f"correlation_{i % 4}",
+        exception_type="ValueError" if i % 3 == 0 else None,
+        custom_props={"user": f'user "{i}"\nline'},
+    )
+    for i in range(50)
+]
+
+
+class TestCsvOperationReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.csv")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, formatter=None, header=True):
+        with open(self.filename, "w", encoding="utf-8", newline="") as f:
+            to_csv(RECORDS, f, formatter=formatter, header=header)
+
+    def test_iter_header_recordsOfColumns(self):
+        self._write(CsvOperationFormatter(custom_props=["user"]))
+
+        reader = CsvOperationReader(self.filename)
+        records = list(reader)
+
+        self.assertTrue(reader.has_header)
+        self.assertEqual(len(records), len(RECORDS))
+        for record, expected in zip(records, RECORDS):
+            self.assertEqual(record.name, expected.name)
+            # formatted with microseconds
+            self.assertEqual(record.start_time_ns, expected.start_time_ns)
+            self.assertEqual(record.duration_ns, expected.duration_ns)
+            self.assertEqual(record.result, expected.result)
+            self.assertEqual(record.correlation_id, expected.correlation_id)
+            self.assertEqual(record.exception_type, expected.exception_type)
+            self.assertEqual(record.custom_props, expected.custom_props)
+
+    def test_iter_noHeader_defaultColumns(self):
+        self._write(header=False)
+
+        reader = CsvOperationReader(self.filename)
+        records = list(reader)
+
+        self.assertFalse(reader.has_header)
+        self.assertEqual([record.name for record in records], [record.name for record in RECORDS])
+        self.assertEqual(records[0].custom_props, {})
+
+    def test_iter_noHeaderLegacyDefaultColumns_read(self):
+        with open(self.filename, "w", encoding="utf-8", newline="") as f:
+            f.write("2023-09-03 10:25:01.294820,0,Calculator.add,correlation_0,Success,None\n")
+
+        [record] = CsvOperationReader(self.filename)
+
+        self.assertEqual(record.name, "Calculator.add")
+        self.assertEqual(record.correlation_id, "correlation_0")
+        self.assertIsNone(record.id)
+
+    def test_iter_noHeaderLegacyNone_null(self):
+        with open(self.filename, "w", encoding="utf-8", newline="") as f:
+            f.write("2023-09-03 10:25:01.294820,0,None,correlation_0,Success,None\n"
+                    "2023-09-03 10:25:01.294820,0,Calculator.div,correlation_1,Failure,ZeroDivisionError\n")
+
+        success, failure = CsvOperationReader(self.filename)
+
+        self.assertIsNone(success.exception_type)
+        self.assertEqual(success.name, "None")
+        self.assertEqual(failure.exception_type, "ZeroDivisionError")
+
+    def test_iter_headerNone_str(self):
+        with open(self.filename, "w", encoding="utf-8", newline="") as f:
+            f.write('"name","exception_type"\n"Calculator.add","None"\n')
+
+        [record] = CsvOperationReader(self.filename)
+
+        self.assertEqual(record.exception_type, "None")
+
+    def test_iter_givenColumns_used(self):
+        formatter = CsvOperationFormatter(columns=["name", "duration_ns", "end_time_utc_str"])
+        self._write(formatter, header=False)
+
+        records = list(CsvOperationReader(self.filename, columns=formatter.column_names))
+
+        self.assertEqual(records[3].duration_ns, RECORDS[3].duration_ns)
+        self.assertIsNone(records[3].start_time_ns)
+
+    def test_init_noNameColumn_raises(self):
+        self._write(CsvOperationFormatter(columns=["duration_ms"]))
+
+        with self.assertRaises(ValueError):
+            CsvOperationReader(self.filename)
+
+    def test_iter_chunks_everyRecordOnce(self):
+        self._write(CsvOperationFormatter(custom_props=["user"]))
+
+        records = []
+        for start, end in split(self.filename, 7, min_size=1):
+            records.extend(CsvOperationReader(self.filename, start=start, end=end))
+
+        self.assertEqual([record.custom_props for record in records],
+                         [record.custom_props for record in RECORDS])
+
+    def test_rowStarts_insideQuotedField_nextRow(self):
+        with open(self.filename, "wb") as f:
+            f.write(b'"name"\n"a\nb"\n"c"\n')
+
+        # rows start at 0, 7 and 13. line 10 ("b"\n) is inside the field "a\nb"
+        self.assertEqual(row_starts(self.filename, [0, 3, 9, 11, 14, 100]), [0, 7, 13, 13, 17, 17])
+
+    def test_iter_alignedChunks_everyRecordOnceWithoutCountingQuotes(self):
+        self._write(CsvOperationFormatter(custom_props=["user"]))
+        ranges = split(self.filename, 7, min_size=1)
+
+        records = []
+        with patch.object(CsvOperationReader, "_count_quotes") as count_quotes:
+            for start, end in ranges:
+                records.extend(CsvOperationReader(self.filename, start=start, end=end, aligned=True))
+
+        count_quotes.assert_not_called()
+        self.assertEqual(len(ranges), 7)
+        self.assertEqual([record.custom_props for record in records],
+                         [record.custom_props for record in RECORDS])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from oplog.readers import JsonLinesOperationReader, OperationRecord, split, to_json_lines
+
+RECORDS = [
+    OperationRecord(
+        name=f"test_op_{i % 2}",
+        start_time_ns=1_687_415_273_922_633_000 + i,
+        duration_ns=i * 1_000,
+        result="Success",
+        id=f"id_{i}",
+        correlation_id="correlation_0",
+        parent_id="id_0" if i else None,
+        process_id=1,
+        thread_id=2,
+        custom_props={"count": i, "flag": i % 2 == 0},
+        global_props={"service": "test_service"},
+    )
+    for i in range(30)
+]
+
+
+class TestJsonLinesOperationReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.jsonl")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            to_json_lines(RECORDS, f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_iter_recordsRoundTrip(self):
+        self.assertEqual(list(JsonLinesOperationReader(self.filename)), RECORDS)
+
+    def test_iter_onlyStartTimeUtc_parsed(self):
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write('{"name": "test_op", "start_time_utc": "2023-06-22 06:27:53.922633"}\n\n')
+
+        records = list(JsonLinesOperationReader(self.filename))
+
+        self.assertEqual(records, [OperationRecord(name="test_op", start_time_ns=1_687_415_273_922_633_000)])
+
+    def test_iter_chunks_everyRecordOnce(self):
+        records = []
+        for start, end in split(self.filename, 4, min_size=1):
+            records.extend(JsonLinesOperationReader(self.filename, start=start, end=end))
+
+        self.assertEqual(records, RECORDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+
+from oplog.readers import (
+    BinaryOperationReader,
+    CsvOperationReader,
+    JsonLinesOperationReader,
+    detect_format,
+    open_reader,
+    split,
+)
+from oplog.sinks import BinaryFileOperationSink
+
+
+class TestLogFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _file(self, name, content=b""):
+        filename = os.path.join(self.tmp_dir.name, name)
+        with open(filename, "wb") as f:
+            f.write(content)
+        return filename
+
+    def test_detectFormat_byContent(self):
+        binary_file = os.path.join(self.tmp_dir.name, "oplogs.opb")
+        BinaryFileOperationSink(binary_file).close()
+
+        self.assertEqual(detect_format(binary_file), "binary")
+        self.assertEqual(detect_format(self._file("a.log", b'\n {"name": "op"}\n')), "jsonl")
+        self.assertEqual(detect_format(self._file("b.log", b'"name"\n"op"\n')), "csv")
+
+    def test_openReader_readerOfFormat(self):
+        filename = self._file("oplogs.log", b'"name"\n')
+
+        self.assertIsInstance(open_reader(filename, "csv"), CsvOperationReader)
+        self.assertIsInstance(open_reader(filename, "jsonl"), JsonLinesOperationReader)
+        with self.assertRaises(ValueError):
+            open_reader(filename, "xml")
+        binary_file = os.path.join(self.tmp_dir.name, "oplogs.opb")
+        BinaryFileOperationSink(binary_file).close()
+        self.assertIsInstance(open_reader(binary_file, start=10, end=20), BinaryOperationReader)
+
+    def test_split_rangesCoverFile(self):
+        # lines of a (CSV) file with no quotes, every byte starts a row
+        filename = self._file("oplogs.log", b"\n" * 100)
+
+        self.assertEqual(split(filename, 4, min_size=1), [(0, 25), (25, 50), (50, 75), (75, None)])
+        # chunks are not smaller than min_size
+        self.assertEqual(split(filename, 4, min_size=40), [(0, 50), (50, None)])
+        self.assertEqual(split(filename, 4, min_size=1000), [(0, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
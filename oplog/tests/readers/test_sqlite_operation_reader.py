@@ -0,0 +1,81 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from oplog import sqlite_schema
+from oplog.operation import Operation
+from oplog.readers import SqliteOperationReader
+from oplog.readers.sqlite_operation_reader import CORRELATION_QUERY, SLOWEST_QUERY
+from oplog.sinks import SqliteOperationSink
+
+
+class TestSqliteOperationReader(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.db")
+        connection = sqlite_schema.create(self.filename)
+        with connection:
+            connection.executemany(sqlite_schema.INSERT, [
+                (f"test_op_{i % 2}", 1_000 + i, (i * 7) % 10, "Success", f"id_{i}",
+                 f"correlation_{i % 3}", None, 0, None, None, None, 1, 2, None, None)
+                for i in range(10)
+            ])
+        connection.close()
+
+    def tearDown(self):
+        Operation.factory_reset()
+        self.tmp_dir.cleanup()
+
+    def test_byCorrelationId_byStartTime(self):
+        with SqliteOperationReader(self.filename) as reader:
+            records = reader.by_correlation_id("correlation_1")
+
+        self.assertEqual([record.id for record in records], ["id_1", "id_4", "id_7"])
+
+    def test_slowest_slowestFirst(self):
+        with SqliteOperationReader(self.filename) as reader:
+            records = reader.slowest("test_op_0", limit=2)
+
+        self.assertEqual([record.duration_ns for record in records], [8, 6])
+        self.assertTrue(all(record.name == "test_op_0" for record in records))
+
+    def test_queries_indexLookups(self):
+        connection = sqlite3.connect(self.filename)
+        for query, parameters in ((CORRELATION_QUERY, ("c",)), (SLOWEST_QUERY, ("n", 1))):
+            plan = " ".join(row[-1] for row in connection.execute(f"EXPLAIN QUERY PLAN {query}", parameters))
+            self.assertIn("USING INDEX", plan)
+            # no sorting step, rows come in index order
+            self.assertNotIn("TEMP B-TREE", plan)
+        connection.close()
+
+    def test_iter_insertionOrder(self):
+        with SqliteOperationReader(self.filename) as reader:
+            self.assertEqual(len(reader), 10)
+            self.assertEqual([record.id for record in reader], [f"id_{i}" for i in range(10)])
+
+    def test_whileWritten_readable(self):
+        sink = SqliteOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+        with Operation(name="test_op"):
+            pass
+        sink.flush()
+
+        with SqliteOperationReader(self.filename) as reader:
+            self.assertEqual(len(reader), 11)
+        sink.close()
+
+    def test_init_notOplogDatabase_raises(self):
+        other = os.path.join(self.tmp_dir.name, "other.db")
+        sqlite3.connect(other).close()
+        with open(other, "wb") as f:
+            f.write(b"")
+
+        with self.assertRaises(ValueError):
+            SqliteOperationReader(other)
+        with self.assertRaises(FileNotFoundError):
+            SqliteOperationReader(os.path.join(self.tmp_dir.name, "missing.db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
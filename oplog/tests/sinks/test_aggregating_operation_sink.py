@@ -0,0 +1,131 @@
+import gc
+import threading
+from unittest.mock import Mock
+
+from oplog import Operation
+from oplog.operation_stats import OperationStats
+from oplog.sinks import AggregatingOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class AggregatingSinkTestException(Exception):
+    pass
+
+
+class TestAggregatingOperationSink(OpLogTestCase):
+    def _create_sink(self) -> AggregatingOperationSink:
+        self.writer_mock = Mock()
+        sink = AggregatingOperationSink(interval_s=None, writer=self.writer_mock)
+        Operation.config(sinks=[sink])
+        return sink
+
+    def test_flush_summaryPerNameAndResult(self):
+        sink = self._create_sink()
+
+        for _ in range(3):
+            with Operation(name="test_op"):
+                pass
+        with Operation(name="test_op", suppress=True):
+            raise AggregatingSinkTestException("test exception")
+        sink.flush()
+
+        self.writer_mock.assert_called_once()
+        summary = self.writer_mock.call_args[0][0]
+        stats = {(s["name"], s["result"]): s for s in summary["stats"]}
+        self.assertEqual(stats[("test_op", "Success")]["count"], 3)
+        self.assertEqual(stats[("test_op", "Success")]["error_count"], 0)
+        self.assertEqual(stats[("test_op", "Failure")]["count"], 1)
+        self.assertEqual(stats[("test_op", "Failure")]["error_count"], 1)
+        self.assertLessEqual(summary["start_time_ns"], summary["end_time_ns"])
+
+    def test_flush_noPerOperationRecords(self):
+        self._create_sink()
+
+        with Operation(name="test_op"):
+            pass
+
+        self.assertEqual(len(self.ops), 0)
+        self.writer_mock.assert_not_called()
+
+    def test_flush_statsReset(self):
+        sink = self._create_sink()
+        with Operation(name="test_op"):
+            pass
+
+        sink.flush()
+        sink.flush()
+
+        self.writer_mock.assert_called_once()
+
+    def test_collect_manyThreads_allCounted(self):
+        sink = self._create_sink()
+
+        def run():
+            for _ in range(500):
+                with Operation(name="test_op"):
+                    pass
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = sink.collect(reset=False)
+        self.assertEqual(stats[("test_op", "Success")].count, 2000)
+        # collected again, since not reset
+        self.assertEqual(sink.collect()[("test_op", "Success")].count, 2000)
+        self.assertEqual(sink.collect(), {})
+
+    def test_collectWithoutReset_finishedThread_statsKeptForFlush(self):
+        sink = self._create_sink()
+
+        def run():
+            for _ in range(5):
+                with Operation(name="test_op"):
+                    pass
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        # the shard of a finished (and collected) thread
+        del thread
+        gc.collect()
+
+        self.assertEqual(sink.collect(reset=False)[("test_op", "Success")].count, 5)
+        sink.flush()
+
+        summary = self.writer_mock.call_args[0][0]
+        self.assertEqual(summary["stats"][0]["count"], 5)
+        self.assertEqual(sink.collect(), {})
+
+    def test_onStart_notAggregated(self):
+        sink = self._create_sink()
+
+        with Operation(name="test_op", on_start=True):
+            pass
+
+        self.assertEqual(sink.collect()[("test_op", "Success")].count, 1)
+
+    def test_interval_summaryWritten(self):
+        written = threading.Event()
+        sink = AggregatingOperationSink(interval_s=0.01, writer=lambda summary: written.set())
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op"):
+            pass
+
+        self.assertTrue(written.wait(timeout=5))
+        sink.close()
+
+    def test_operationStats_dictRoundTrip_mergeable(self):
+        sink = self._create_sink()
+        with Operation(name="test_op"):
+            pass
+        stats = sink.collect()[("test_op", "Success")]
+
+        restored = OperationStats.from_dict(stats.to_dict())
+        restored.merge(stats)
+
+        self.assertEqual(restored.count, 2)
+        self.assertEqual(restored.sum_ns, 2 * stats.sum_ns)
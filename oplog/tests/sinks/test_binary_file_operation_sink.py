@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+
+from oplog.binary import MAGIC
+from oplog.operation import Operation
+from oplog.readers import BinaryOperationReader
+from oplog.sinks import BinaryFileOperationSink
+
+
+class TestBinaryFileOperationSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.opb")
+
+    def tearDown(self):
+        Operation.factory_reset()
+        self.tmp_dir.cleanup()
+
+    def test_emit_batchSizeReached_written(self):
+        sink = BinaryFileOperationSink(self.filename, batch_size=2)
+        Operation.config(sinks=[sink])
+
+        for i in range(3):
+            with Operation(name=f"test_op{i}"):
+                pass
+
+        self.assertEqual([record.name for record in BinaryOperationReader(self.filename)],
+                         ["test_op0", "test_op1"])
+        sink.close()
+        self.assertEqual(len(list(BinaryOperationReader(self.filename))), 3)
+
+    def test_emit_startStep_skipped(self):
+        sink = BinaryFileOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op", on_start=True):
+            pass
+        sink.close()
+
+        records = list(BinaryOperationReader(self.filename))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].result, "Success")
+
+    def test_init_newFile_magicWritten(self):
+        BinaryFileOperationSink(self.filename).close()
+
+        with open(self.filename, "rb") as f:
+            self.assertTrue(f.read().startswith(MAGIC))
+
+    def test_init_batchSizeNotPositive_raises(self):
+        with self.assertRaises(ValueError):
+            BinaryFileOperationSink(self.filename, batch_size=0)
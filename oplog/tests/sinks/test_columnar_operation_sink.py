@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from oplog import Operation
+from oplog.readers import ColumnarOperationReader
+from oplog.sinks import ColumnarOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestColumnarOperationSink(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.opc")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def test_emit_rowGroupSizeReached_rowGroupWritten(self):
+        sink = ColumnarOperationSink(self.filename, row_group_size=2)
+        Operation.config(sinks=[sink])
+
+        for _ in range(5):
+            with Operation(name="test_op"):
+                pass
+
+        self.assertEqual(len(sink._row_groups), 2)
+        sink.close()
+        self.assertEqual(ColumnarOperationReader(self.filename).num_rows, 5)
+
+    def test_emit_onStart_onlyFinishedOperationWritten(self):
+        sink = ColumnarOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op", on_start=True):
+            pass
+        sink.close()
+
+        self.assertEqual(ColumnarOperationReader(self.filename).num_rows, 1)
+
+    def test_close_twice_noError(self):
+        sink = ColumnarOperationSink(self.filename)
+
+        sink.close()
+        sink.close()
+        sink.flush()
+
+    def test_init_invalidRowGroupSize_raises(self):
+        with self.assertRaises(ValueError):
+            ColumnarOperationSink(self.filename, row_group_size=0)
+
+    def test_exit_notClosed_fileComplete(self):
+        # a sink configured for the lifetime of a process, which is never closed
+        script = textwrap.dedent(f"""
+            from oplog import Operation
+            from oplog.sinks import ColumnarOperationSink
+
+            Operation.config(sinks=[ColumnarOperationSink({self.filename!r})])
+            for _ in range(3):
+                with Operation(name="test_op"):
+                    pass
+        """)
+
+        subprocess.run([sys.executable, "-c", script], check=True)
+
+        reader = ColumnarOperationReader(self.filename)
+        self.assertEqual(reader.num_rows, 3)
+        self.assertEqual(reader.read_column("name"), ["test_op"] * 3)
@@ -0,0 +1,68 @@
+import csv
+import os
+import tempfile
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter
+from oplog.sinks import CsvFileOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestCsvFileOperationSink(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.csv")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _read_rows(self):
+        with open(self.filename, newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))
+
+    def test_close_headerAndRowsWritten(self):
+        sink = CsvFileOperationSink(
+            self.filename, formatter=CsvOperationFormatter(columns=("name", "exception_msg")))
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op"):
+            pass
+        with Operation(name="failed_op", suppress=True):
+            raise ValueError('multi\nline, "quoted"')
+        sink.close()
+
+        self.assertEqual(self._read_rows(), [
+            ["name", "exception_msg"],
+            ["test_op", ""],
+            ["failed_op", 'multi\nline, "quoted"'],
+        ])
+
+    def test_emit_batchSizeReached_batchWritten(self):
+        sink = CsvFileOperationSink(self.filename, batch_size=2)
+        Operation.config(sinks=[sink])
+
+        for _ in range(3):
+            with Operation(name="test_op"):
+                pass
+
+        # header + first batch, the third row is still buffered
+        self.assertEqual(len(self._read_rows()), 3)
+        sink.close()
+        self.assertEqual(len(self._read_rows()), 4)
+
+    def test_init_existingFile_headerNotRepeated(self):
+        CsvFileOperationSink(self.filename).close()
+        sink = CsvFileOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op"):
+            pass
+        sink.close()
+
+        self.assertEqual(len(self._read_rows()), 2)
+
+    def test_init_invalidBatchSize_raises(self):
+        with self.assertRaises(ValueError):
+            CsvFileOperationSink(self.filename, batch_size=0)
@@ -0,0 +1,28 @@
+import os
+import tempfile
+
+from oplog import Operation
+from oplog.formatters import CsvOperationFormatter
+from oplog.sinks import FileOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestFileOperationSink(OpLogTestCase):
+    def test_close_operationsWrittenToFile(self):
+        # arrange
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "oplogs.csv")
+            sink = FileOperationSink(formatter=CsvOperationFormatter(), filename=filename)
+            Operation.config(sinks=[sink])
+
+            # act
+            for i in range(3):
+                with Operation(name=f"test_op_{i}"):
+                    pass
+            sink.close()
+
+            # assert
+            with open(filename, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertIn("test_op_0", lines[0])
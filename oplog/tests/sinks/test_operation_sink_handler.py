@@ -0,0 +1,35 @@
+import logging
+from unittest import mock
+
+from oplog import Operation
+from oplog.sinks import BaseOperationSink, OperationSinkHandler
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestOperationSinkHandler(OpLogTestCase):
+    def test_operationSinkHandler_loggingOperationAndInfo_onlyOperationEmitted(self):
+        # arrange
+        sink_mock = mock.Mock(spec=BaseOperationSink)
+        handler = OperationSinkHandler(sink=sink_mock)
+        logging.getLogger().addHandler(handler)
+
+        # act
+        with Operation(name="test_op") as op:
+            logging.getLogger().info("test_info")
+        logging.getLogger().removeHandler(handler)
+
+        # assert
+        sink_mock.handle.assert_called_once_with(op)
+
+    def test_operationSinkHandler_close_sinkClosed(self):
+        # arrange
+        sink_mock = mock.Mock(spec=BaseOperationSink)
+        handler = OperationSinkHandler(sink=sink_mock)
+
+        # act
+        handler.flush()
+        handler.close()
+
+        # assert
+        sink_mock.flush.assert_called_once()
+        sink_mock.close.assert_called_once()
@@ -0,0 +1,39 @@
+import queue
+import unittest
+
+from oplog.operation import Operation
+from oplog.sinks import QueueOperationSink
+
+
+class TestQueueOperationSink(unittest.TestCase):
+    def tearDown(self):
+        Operation.factory_reset()
+
+    def test_emit_batchSizeReached_batchPut(self):
+        ops_queue: queue.Queue = queue.Queue()
+        Operation.config(sinks=[QueueOperationSink(ops_queue, batch_size=2)])
+
+        for i in range(3):
+            with Operation(name=f"op{i}"):
+                pass
+
+        batch = ops_queue.get_nowait()
+        self.assertEqual([op.name for op in batch], ["op0", "op1"])
+        self.assertTrue(ops_queue.empty())
+
+    def test_flush_remainingOpsPut(self):
+        ops_queue: queue.Queue = queue.Queue()
+        sink = QueueOperationSink(ops_queue, batch_size=10)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="op"):
+            pass
+        sink.flush()
+        sink.flush()
+
+        self.assertEqual([op.name for op in ops_queue.get_nowait()], ["op"])
+        self.assertTrue(ops_queue.empty())
+
+    def test_init_batchSizeNotPositive_raises(self):
+        with self.assertRaises(ValueError):
+            QueueOperationSink(queue.Queue(), batch_size=0)
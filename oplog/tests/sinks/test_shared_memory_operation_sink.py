@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from oplog.operation import Operation
+from oplog.overflow_policy import OverflowPolicy
+from oplog.shared_memory_ring import SharedMemoryRing
+from oplog.sinks import SharedMemoryOperationSink
+
+
+class TestSharedMemoryOperationSink(unittest.TestCase):
+    def setUp(self):
+        self.ring = SharedMemoryRing.create(capacity=1 << 16)
+        self.consumer = SharedMemoryRing.attach(self.ring.name)
+
+    def tearDown(self):
+        Operation.factory_reset()
+        self.consumer.close()
+        self.ring.close()
+
+    def test_emit_opEncodedIntoRing(self):
+        Operation.config(sinks=[SharedMemoryOperationSink(self.ring)])
+
+        with Operation(name="test_op") as op:
+            op.add("prop", 1)
+
+        [record] = self.consumer.get_batch()
+        decoded = pickle.loads(record)
+        self.assertEqual(decoded.name, "test_op")
+        self.assertEqual(decoded.custom_props, {"prop": 1})
+        self.assertEqual(decoded.start_time_utc_str, op.start_time_utc_str)
+
+    def test_emit_globalPropsOfEmittingProcessKept(self):
+        Operation.config(sinks=[SharedMemoryOperationSink(self.ring)])
+        Operation.add_global("worker", 1)
+        with Operation(name="test_op"):
+            pass
+
+        # the props of the reading process differ from the emitting one's
+        Operation.factory_reset()
+        Operation.add_global("worker", 2)
+        [record] = self.consumer.get_batch()
+        decoded = pickle.loads(record)
+
+        self.assertEqual(dict(decoded.global_props), {"worker": 1})
+        self.assertEqual(dict(Operation.global_props), {"worker": 2})
+
+    def test_emit_ringFull_dropped(self):
+        small_ring = SharedMemoryRing.create(capacity=1024)
+        sink = SharedMemoryOperationSink(small_ring, close_timeout_s=0)
+        Operation.config(sinks=[sink])
+
+        for _ in range(10):
+            with Operation(name="test_op"):
+                pass
+
+        self.assertGreater(sink.dropped_records, 0)
+        sink.close()
+
+    def test_init_dropOldest_raises(self):
+        with self.assertRaises(ValueError):
+            SharedMemoryOperationSink(self.ring, overflow_policy=OverflowPolicy.DROP_OLDEST)
@@ -0,0 +1,199 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from oplog import sqlite_schema
+from oplog.operation import Operation
+from oplog.readers import SqliteOperationReader
+from oplog.sinks import SqliteOperationSink
+
+
+class SqliteTestException(Exception):
+    pass
+
+
+class TestSqliteOperationSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "oplogs.db")
+
+    def tearDown(self):
+        Operation.factory_reset()
+        self.tmp_dir.cleanup()
+
+    def _count(self):
+        with SqliteOperationReader(self.filename) as reader:
+            return len(reader)
+
+    def test_init_walModeAndIndexes(self):
+        SqliteOperationSink(self.filename).close()
+
+        connection = sqlite3.connect(self.filename)
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        connection.close()
+        self.assertEqual(journal_mode, "wal")
+        self.assertEqual(indexes, {name for name, _ in sqlite_schema.INDEXES})
+
+    def test_emit_insertedPerFlushInterval(self):
+        sink = SqliteOperationSink(self.filename, flush_interval_s=0.05)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op"):
+            pass
+        self.assertEqual(self._count(), 0)
+
+        deadline = time.monotonic() + 5
+        while self._count() == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self._count(), 1)
+        sink.close()
+
+    def test_emit_batchSizeReached_writerWoken(self):
+        sink = SqliteOperationSink(self.filename, flush_interval_s=60, batch_size=3)
+        Operation.config(sinks=[sink])
+
+        for _ in range(3):
+            with Operation(name="test_op"):
+                pass
+
+        deadline = time.monotonic() + 5
+        while self._count() < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self._count(), 3)
+        sink.close()
+
+    def test_emit_allFieldsStored(self):
+        sink = SqliteOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+        Operation.add_global("service", "test_service")
+
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op", suppress=True) as child_op:
+                child_op.add("user", "user_0")
+                child_op.add("items", 3)
+                raise SqliteTestException("test exception")
+        sink.close()
+
+        with SqliteOperationReader(self.filename) as reader:
+            child_record, parent_record = list(reader)
+        self.assertEqual(child_record.name, child_op.name)
+        self.assertEqual(child_record.start_time_ns, child_op.start_time_ns)
+        self.assertEqual(child_record.duration_ns, child_op.duration_ns)
+        self.assertEqual(child_record.result, "Failure")
+        self.assertEqual(child_record.id, child_op.id)
+        self.assertEqual(child_record.correlation_id, parent_op.correlation_id)
+        self.assertEqual(child_record.parent_id, parent_op.id)
+        self.assertEqual(child_record.exception_type, SqliteTestException.__name__)
+        self.assertEqual(child_record.exception_msg, "test exception")
+        self.assertEqual(child_record.traceback_fingerprint, child_op.traceback_fingerprint)
+        self.assertEqual(child_record.process_id, child_op.process_id)
+        self.assertEqual(child_record.thread_id, child_op.thread_id)
+        self.assertEqual(child_record.custom_props, {"user": "user_0", "items": 3})
+        self.assertEqual(child_record.global_props, {"service": "test_service"})
+        self.assertEqual(child_record.depth, 1)
+        self.assertIsNone(parent_record.parent_id)
+        self.assertEqual(parent_record.depth, 0)
+        self.assertEqual(parent_record.custom_props, {})
+
+    def test_emit_nonFiniteFloatProp_storedAsValidJson(self):
+        sink = SqliteOperationSink(self.filename, flush_interval_s=60)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op") as op:
+            op.add("ratio", float("nan"))
+        sink.close()
+
+        connection = sqlite3.connect(self.filename)
+        [(valid, ratio)] = connection.execute(
+            "SELECT json_valid(custom_props), json_extract(custom_props, '$.ratio') FROM operations"
+        ).fetchall()
+        connection.close()
+        self.assertEqual(valid, 1)
+        self.assertIsNone(ratio)
+
+    def test_flush_insertFails_rowsRetriedByNextFlush(self):
+        sink = SqliteOperationSink(self.filename, flush_interval_s=60)
+        Operation.config(sinks=[sink])
+        with Operation(name="test_op_1"):
+            pass
+        insert = sink._insert
+
+        def locked(rows):
+            raise sqlite3.OperationalError("database is locked")
+
+        sink._insert = locked
+        with self.assertRaises(sqlite3.OperationalError):
+            sink.flush()
+        sink._insert = insert
+        with Operation(name="test_op_2"):
+            pass
+        sink.flush()
+
+        with SqliteOperationReader(self.filename) as reader:
+            names = sorted(record.name for record in reader)
+        sink.close()
+        self.assertEqual(names, ["test_op_1", "test_op_2"])
+
+    def test_emit_afterClose_dropped(self):
+        sink = SqliteOperationSink(self.filename, flush_interval_s=60)
+        Operation.config(sinks=[sink])
+        sink.close()
+
+        with Operation(name="test_op"):
+            pass
+
+        self.assertEqual(sink._rows, [])
+        self.assertEqual(self._count(), 0)
+
+    def test_emit_startStep_skipped(self):
+        sink = SqliteOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+
+        with Operation(name="test_op", on_start=True):
+            pass
+        sink.close()
+
+        self.assertEqual(self._count(), 1)
+
+    def test_close_reopened_appends(self):
+        for _ in range(2):
+            sink = SqliteOperationSink(self.filename)
+            Operation.config(sinks=[sink])
+            with Operation(name="test_op"):
+                pass
+            sink.close()
+            # closing twice is a no-op
+            sink.close()
+
+        self.assertEqual(self._count(), 2)
+
+    def test_init_olderDatabase_columnsAdded(self):
+        connection = sqlite3.connect(self.filename)
+        connection.execute(f"CREATE TABLE {sqlite_schema.TABLE} (name TEXT NOT NULL, duration_ns INTEGER)")
+        connection.execute(f"INSERT INTO {sqlite_schema.TABLE} VALUES ('old_op', 1)")
+        connection.commit()
+        connection.close()
+
+        sink = SqliteOperationSink(self.filename)
+        Operation.config(sinks=[sink])
+        with Operation(name="test_op"):
+            pass
+        sink.close()
+
+        with SqliteOperationReader(self.filename) as reader:
+            old_record, record = list(reader)
+        self.assertIsNone(old_record.depth)
+        self.assertEqual(record.depth, 0)
+
+    def test_init_invalidArguments_raises(self):
+        with self.assertRaises(ValueError):
+            SqliteOperationSink(self.filename, flush_interval_s=0)
+        with self.assertRaises(ValueError):
+            SqliteOperationSink(self.filename, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
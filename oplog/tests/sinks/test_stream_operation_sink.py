@@ -0,0 +1,70 @@
+import io
+from contextlib import redirect_stderr
+
+from oplog import Operation
+from oplog.formatters import VerboseOperationFormatter
+from oplog.sinks import StreamOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class TestStreamOperationSink(OpLogTestCase):
+    def test_emit_formattedLineWritten(self):
+        # arrange
+        stream = io.StringIO()
+        sink = StreamOperationSink(formatter=VerboseOperationFormatter(), stream=stream)
+        Operation.config(sinks=[sink])
+
+        # act
+        with Operation(name="test_op"):
+            pass
+
+        # assert
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn("[test_op / Success]", lines[0])
+
+    def test_config_sinks_loggingBypassed(self):
+        # arrange
+        sink = StreamOperationSink(formatter=VerboseOperationFormatter(), stream=io.StringIO())
+        Operation.config(sinks=[sink])
+
+        # act
+        with Operation(name="test_op"):
+            pass
+
+        # assert
+        self.assertEqual(len(self.ops), 0)
+
+    def test_emitBatch_allLinesWritten(self):
+        # arrange
+        stream = io.StringIO()
+        sink = StreamOperationSink(formatter=VerboseOperationFormatter(), stream=stream)
+        ops = []
+        for i in range(3):
+            with Operation(name=f"test_op_{i}") as op:
+                pass
+            ops.append(op)
+
+        # act
+        sink.emit_batch(ops)
+
+        # assert
+        self.assertEqual(len(stream.getvalue().splitlines()), 3)
+
+    def test_handle_formatterFails_errorHandled(self):
+        # arrange
+        stream = io.StringIO()
+        formatter = VerboseOperationFormatter()
+        formatter.format_op = None  # type: ignore
+        sink = StreamOperationSink(formatter=formatter, stream=stream)
+        Operation.config(sinks=[sink])
+
+        # act
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            with Operation(name="test_op"):
+                pass
+
+        # assert
+        self.assertIn("oplog sink error", stderr.getvalue())
+        self.assertEqual(stream.getvalue(), "")
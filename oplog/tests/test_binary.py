@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from parameterized import parameterized  # type: ignore
+
+from oplog import binary
+from oplog.readers import BinaryOperationReader, OperationRecord
+
+
+class TestBinary(unittest.TestCase):
+    @parameterized.expand([(0,), (1,), (127,), (128,), (300,), (2 ** 63 + 5,)])
+    def test_varint_roundTrip(self, value):
+        out = bytearray(b"\xff")
+        binary.write_varint(out, value)
+
+        self.assertEqual(binary.read_varint(bytes(out), 1), (value, len(out)))
+
+    @parameterized.expand([
+        (None,), (True,), (False,), (0,), (-1,), (-(2 ** 70),), (2 ** 70,),
+        (1.5,), ("text",), ("",), ("ünïcode",),
+    ])
+    def test_value_roundTrip(self, value):
+        out = bytearray()
+        binary.write_value(out, value)
+
+        decoded, offset = binary.read_value(bytes(out), 0)
+        self.assertEqual(decoded, value)
+        self.assertIs(type(decoded), type(value))
+        self.assertEqual(offset, len(out))
+
+    def test_value_otherType_decodedAsRepr(self):
+        out = bytearray()
+        binary.write_value(out, [1, 2])
+
+        self.assertEqual(binary.read_value(bytes(out), 0)[0], "[1, 2]")
+
+    def test_optionalStr_roundTrip(self):
+        out = bytearray()
+        binary.write_optional_str(out, None)
+        binary.write_optional_str(out, "")
+        binary.write_optional_str(out, "value")
+
+        data = bytes(out)
+        none, offset = binary.read_optional_str(data, 0)
+        empty, offset = binary.read_optional_str(data, offset)
+        value, offset = binary.read_optional_str(data, offset)
+        self.assertEqual((none, empty, value), (None, "", "value"))
+        self.assertEqual(offset, len(data))
+
+    def test_encoderInit_segmentSizeNotPositive_raises(self):
+        with self.assertRaises(ValueError):
+            binary.BinaryOperationEncoder(segment_size=0)
+
+    def test_encoderEncode_plainGlobalPropsValueChanged_newSegment(self):
+        record = OperationRecord(name="test_op", id="id_0", correlation_id="correlation_0",
+                                 start_time_ns=0, duration_ns=1_000_000, result="Success")
+        encoder = binary.BinaryOperationEncoder()
+        out = bytearray(binary.MAGIC)
+        encoder.start_segment(out, {"region": "eu"})
+        for region in ("eu", "us", "us"):
+            encoder.encode(out, record, {"region": region})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "oplogs.bin")
+            with open(filename, "wb") as f:
+                f.write(out)
+            records = list(BinaryOperationReader(filename))
+
+        self.assertEqual([dict(record.global_props) for record in records],
+                         [{"region": "eu"}, {"region": "us"}, {"region": "us"}])
@@ -0,0 +1,206 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from oplog import Operation
+from oplog.cli import NameSummary, RecordFilter, main, parse_time, stats
+from oplog.readers import JsonLinesOperationReader, OperationRecord, to_csv, to_json_lines
+from oplog.sinks import BinaryFileOperationSink, CsvFileOperationSink
+from oplog.tests.logged_test_case import OpLogTestCase
+
+START_NS = 1_693_736_701_000_000_000  # 2023-09-03 10:25:01
+
+RECORDS = [
+    OperationRecord(
+        name=f"Calculator.{'add' if i % 2 else 'divide'}",
+        start_time_ns=START_NS + i * 1_000_000_000,
+        duration_ns=(i + 1) * 1_000_000,
+        result="Failure" if i % 4 == 0 else "Success",
+        correlation_id=f"correlation_{i % 3}",
+    )
+    for i in range(100)
+]
+
+
+class CliTestException(Exception):
+    pass
+
+
+class TestCli(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.tmp_dir.name, "oplogs.csv")
+        with open(self.csv_file, "w", encoding="utf-8", newline="") as f:
+            to_csv(RECORDS, f)
+        self.jsonl_file = os.path.join(self.tmp_dir.name, "oplogs.jsonl")
+        with open(self.jsonl_file, "w", encoding="utf-8") as f:
+            to_json_lines(RECORDS, f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        return super().tearDown()
+
+    def _main(self, *argv):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(main(argv), 0)
+        return stdout.getvalue()
+
+    def test_parseTime_iso(self):
+        self.assertEqual(parse_time("2023-09-03 10:25:01"), START_NS)
+        self.assertEqual(parse_time("2023-09-03T12:25:01+02:00"), START_NS)
+
+    def test_parseTime_zSuffix_utc(self):
+        self.assertEqual(parse_time("2023-09-03T10:25:01Z"), START_NS)
+        self.assertEqual(parse_time("2023-09-03T10:25:01.500Z"), START_NS + 500_000_000)
+
+    def test_parseTime_duration_beforeNow(self):
+        self.assertEqual(parse_time("1h", now_ns=START_NS), START_NS - 3600 * 1_000_000_000)
+        self.assertEqual(parse_time("1.5s", now_ns=START_NS), START_NS - 1_500_000_000)
+
+    def test_parseTime_invalid_raises(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_time("yesterday")
+
+    def test_recordFilter_allCriteria(self):
+        record_filter = RecordFilter(names=["*.add"], result="Success", correlation_id="correlation_1",
+                                     since_ns=START_NS + 10_000_000_000, until_ns=START_NS + 20_000_000_000)
+
+        matched = [record for record in RECORDS if record_filter(record)]
+
+        self.assertEqual([record.start_time_ns for record in matched],
+                         [START_NS + i * 1_000_000_000 for i in (13, 19)])
+
+    def test_recordFilter_timeRange_recordsWithoutTimeExcluded(self):
+        self.assertFalse(RecordFilter(since_ns=0)(OperationRecord(name="op")))
+        self.assertTrue(RecordFilter()(OperationRecord(name="op")))
+
+    def test_nameSummary_exactPercentiles(self):
+        summary = NameSummary("op", exact=True)
+        for duration_ns in range(100, 0, -1):
+            summary.record(OperationRecord(name="op", duration_ns=duration_ns, result="Success"))
+
+        self.assertEqual(summary.percentiles([0, 50, 99, 100]), [1, 50, 99, 100])
+        self.assertEqual(summary.error_rate, 0)
+
+    def test_nameSummary_exactPercentilesOfFew_nearestRank(self):
+        summary = NameSummary("op", exact=True)
+        for duration_ns in (10, 20, 30, 40):
+            summary.record(OperationRecord(name="op", duration_ns=duration_ns, result="Success"))
+
+        self.assertEqual(summary.percentiles([50, 60, 90]), [20, 30, 40])
+
+    def test_stats_jobs_sameAsSingleProcess(self):
+        record_filter = RecordFilter()
+
+        expected = stats([self.csv_file], record_filter, exact=True)
+        summaries = stats([self.csv_file, self.jsonl_file], record_filter, exact=True,
+                          jobs=3, min_chunk_size=1)
+
+        self.assertEqual(list(summaries), ["Calculator.add", "Calculator.divide"])
+        for name, summary in summaries.items():
+            self.assertEqual(summary.stats.count, 2 * expected[name].stats.count)
+            self.assertEqual(summary.stats.error_count, 2 * expected[name].stats.error_count)
+            self.assertEqual(summary.percentiles([50, 99]), expected[name].percentiles([50, 99]))
+
+    def test_main_statsJson(self):
+        output = json.loads(self._main("stats", self.csv_file, "--name", "*.divide",
+                                       "--percentiles", "50", "--exact", "--json"))
+
+        self.assertEqual(output, {
+            "Calculator.divide": {
+                "count": 50, "error_count": 25, "error_rate": 0.5, "p50_ns": 49_000_000,
+            },
+        })
+
+    def test_main_statsTable(self):
+        lines = self._main("stats", self.jsonl_file, "--until", "2023-09-03 10:25:03").splitlines()
+
+        self.assertEqual(lines[0].split(), ["name", "count", "errors", "error_rate",
+                                            "p50_ms", "p90_ms", "p99_ms"])
+        self.assertEqual(lines[1].split(), ["Calculator.add", "1", "0", "0.00%", "2.000", "2.000", "2.000"])
+        self.assertEqual(lines[2].split(), ["Calculator.divide", "1", "1", "100.00%", "1.000", "1.000", "1.000"])
+
+    def test_main_statsBinary(self):
+        binary_file = os.path.join(self.tmp_dir.name, "oplogs.opb")
+        sink = BinaryFileOperationSink(binary_file)
+        Operation.config(sinks=[sink])
+        with Operation(name="test_op"):
+            pass
+        with Operation(name="test_op", suppress=True):
+            raise CliTestException()
+        sink.close()
+
+        output = json.loads(self._main("stats", binary_file, "--result", "Failure", "--json"))
+
+        self.assertEqual(output["test_op"]["count"], 1)
+
+    def test_main_filter_jsonLines(self):
+        output_file = os.path.join(self.tmp_dir.name, "filtered.jsonl")
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(self._main("filter", self.csv_file, "--correlation-id", "correlation_2"))
+
+        records = list(JsonLinesOperationReader(output_file))
+
+        self.assertEqual(len(records), 33)
+        self.assertTrue(all(record.correlation_id == "correlation_2" for record in records))
+
+    def test_main_filter_csv(self):
+        lines = self._main("filter", self.csv_file, self.csv_file, "--result", "Failure",
+                           "--output-format", "csv").splitlines()
+
+        # a single header
+        self.assertEqual(len(lines), 1 + 2 * 25)
+
+    def test_main_trees(self):
+        binary_file = os.path.join(self.tmp_dir.name, "oplogs.opb")
+        sink = BinaryFileOperationSink(binary_file)
+        Operation.config(sinks=[sink])
+        for _ in range(2):
+            with Operation(name="request"):
+                with Operation(name="db"):
+                    pass
+        with Operation(name="other_request"):
+            pass
+        sink.close()
+
+        output = json.loads(self._main("trees", binary_file, "--name", "request", "--json"))
+        lines = self._main("trees", binary_file, "--top", "1").splitlines()
+
+        self.assertEqual(list(output), ["request"])
+        self.assertEqual(output["request"]["tree_count"], 2)
+        self.assertEqual(output["request"]["node_count"], 4)
+        self.assertEqual(output["request"]["max_fan_out"], 1)
+        self.assertEqual(lines[0].split()[:3], ["root", "trees", "operations"])
+        self.assertEqual([line.split()[0] for line in lines[1:]], ["other_request", "request"])
+
+    def test_main_treesOfDefaultCsv_childrenLinked(self):
+        csv_file = os.path.join(self.tmp_dir.name, "trees.csv")
+        sink = CsvFileOperationSink(csv_file)
+        Operation.config(sinks=[sink])
+        with Operation(name="request"):
+            with Operation(name="db"):
+                pass
+        sink.close()
+
+        output = json.loads(self._main("trees", csv_file, "--json"))
+
+        self.assertEqual(list(output), ["request"])
+        self.assertEqual(output["request"]["node_count"], 2)
+
+    def test_main_missingFile_exits(self):
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit) as cm:
+            main(["stats", os.path.join(self.tmp_dir.name, "missing.csv")])
+
+        self.assertEqual(cm.exception.code, 1)
+        self.assertIn("missing.csv", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import datetime
+import time
+import unittest
+from unittest.mock import patch
+
+from oplog.clock import TIME_FORMAT, Clock
+from oplog.operation import Operation
+
+
+class TestClock(unittest.TestCase):
+    def test_format_matchesStrftime(self):
+        clock = Clock()
+        wall_ns = 1_687_415_273_922_633_123
+        expected = datetime.datetime(2023, 6, 22, 6, 27, 53, 922633).strftime(TIME_FORMAT)
+
+        self.assertEqual(clock.format(wall_ns), expected)
+        # second call is served from the per-second cache
+        self.assertEqual(clock.format(wall_ns), expected)
+
+    def test_format_cacheFull_cacheCleared(self):
+        clock = Clock(format_cache_size=2)
+
+        for second in range(5):
+            clock.format(second * 1_000_000_000)
+
+        self.assertLessEqual(len(clock._second_strs), 2)
+        self.assertEqual(clock.format(1_500_000), "1970-01-01 00:00:00.001500")
+
+    def test_parse_formatted_roundTrips(self):
+        clock = Clock()
+        wall_ns = 1_687_415_273_922_633_000
+
+        self.assertEqual(clock.parse(clock.format(wall_ns)), wall_ns)
+        # second call is served from the per-second cache
+        self.assertEqual(clock.parse(clock.format(wall_ns)), wall_ns)
+
+    def test_parse_noFraction_wholeSecond(self):
+        clock = Clock()
+
+        self.assertEqual(clock.parse("1970-01-01 00:00:02"), 2_000_000_000)
+
+    def test_parse_invalid_raises(self):
+        with self.assertRaises(ValueError):
+            Clock().parse("not a time")
+
+    def test_wallOffsetNs_closeToWallClock(self):
+        clock = Clock()
+        perf_ns = time.perf_counter_ns()
+
+        wall_ns = perf_ns + clock.wall_offset_ns(perf_ns)
+
+        self.assertLess(abs(wall_ns - time.time_ns()), 50_000_000)
+
+    def test_wallOffsetNs_resyncIntervalPassed_resynced(self):
+        clock = Clock(resync_interval_s=1)
+        perf_ns = time.perf_counter_ns()
+
+        with patch.object(clock, clock.resync.__name__) as resync_mock:
+            clock.wall_offset_ns(perf_ns)
+            resync_mock.assert_not_called()
+            clock.wall_offset_ns(perf_ns + 2_000_000_000)
+            resync_mock.assert_called_once()
+
+    def test_operation_endTimeConsistentWithDuration(self):
+        with Operation(name="test_op") as op:
+            time.sleep(0.01)
+
+        self.assertEqual(op.end_time_ns - op.start_time_ns, op.duration_ns)
+        self.assertEqual(op.start_time_utc_str, op.start_time_utc.strftime(TIME_FORMAT))
@@ -0,0 +1,101 @@
+import pickle
+import unittest
+
+from oplog.global_props import GlobalProps, GlobalPropsCache
+
+
+class TestGlobalProps(unittest.TestCase):
+    def test_withProp_newVersionAndOriginalUnchanged(self):
+        props = GlobalProps({"region": "eu"}, version=3)
+
+        updated = props.with_prop("build", "1.0")
+
+        self.assertEqual(updated.version, 4)
+        self.assertEqual(dict(updated), {"region": "eu", "build": "1.0"})
+        self.assertEqual(dict(props), {"region": "eu"})
+
+    def test_init_sourceChanged_snapshotUnchanged(self):
+        source = {"region": "eu"}
+        props = GlobalProps(source)
+
+        source["build"] = "1.0"
+
+        self.assertNotIn("build", props)
+        self.assertEqual(len(props), 1)
+
+    def test_setItem_raises(self):
+        props = GlobalProps({"region": "eu"})
+
+        with self.assertRaises(TypeError):
+            props["region"] = "us"
+
+    def test_repr_likeDict(self):
+        props = GlobalProps({"region": "eu"})
+
+        self.assertEqual(repr(props), repr({"region": "eu"}))
+        self.assertEqual(f"{props}", "{'region': 'eu'}")
+
+    def test_pickle_propsAndVersionKept(self):
+        props = GlobalProps({"region": "eu"}, version=7)
+
+        loaded = pickle.loads(pickle.dumps(props))
+
+        self.assertEqual(loaded, props)
+        self.assertEqual(loaded.version, 7)
+
+    def test_pickle_sameSnapshotTwice_sameObject(self):
+        data = pickle.dumps(GlobalProps({"region": "eu"}, version=3, origin=1))
+
+        self.assertIs(pickle.loads(data), pickle.loads(data))
+
+    def test_pickle_sameVersionOfOtherOrigins_distinctSnapshots(self):
+        first = pickle.loads(pickle.dumps(GlobalProps({"worker": 1}, version=3, origin=1)))
+        second = pickle.loads(pickle.dumps(GlobalProps({"worker": 2}, version=3, origin=2)))
+
+        self.assertEqual(dict(first), {"worker": 1})
+        self.assertEqual(dict(second), {"worker": 2})
+
+    def test_toDict_copy(self):
+        props = GlobalProps({"region": "eu"})
+
+        copy = props.to_dict()
+        copy["build"] = "1.0"
+
+        self.assertEqual(dict(props), {"region": "eu"})
+
+
+class TestGlobalPropsCache(unittest.TestCase):
+    def setUp(self):
+        self.derived = []
+        self.cache = GlobalPropsCache(self._derive)
+
+    def _derive(self, global_props):
+        self.derived.append(dict(global_props))
+        return repr(global_props)
+
+    def test_get_sameSnapshot_derivedOnce(self):
+        snapshot = GlobalProps({"service": "api"})
+
+        values = [self.cache.get(snapshot) for _ in range(3)]
+
+        self.assertEqual(values, ["{'service': 'api'}"] * 3)
+        self.assertEqual(len(self.derived), 1)
+
+    def test_get_newSnapshot_derivedAgain(self):
+        snapshot = GlobalProps({"service": "api"})
+        self.cache.get(snapshot)
+
+        value = self.cache.get(snapshot.with_prop("region", "eu"))
+
+        self.assertEqual(value, "{'service': 'api', 'region': 'eu'}")
+        self.assertEqual(len(self.derived), 2)
+
+    def test_get_plainMapping_derivedEveryTime(self):
+        props = {"service": "api"}
+        self.cache.get(props)
+        props["service"] = "worker"
+
+        value = self.cache.get(props)
+
+        self.assertEqual(value, "{'service': 'worker'}")
+        self.assertEqual(len(self.derived), 2)
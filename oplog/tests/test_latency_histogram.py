@@ -0,0 +1,80 @@
+import json
+import random
+import unittest
+
+from oplog.latency_histogram import LatencyHistogram, bucket_bounds, bucket_index, percentile_rank
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_bucketIndex_valueWithinBucketBounds(self):
+        for value in list(range(100)) + [random.randrange(10 ** 12) for _ in range(1000)]:
+            lower, upper = bucket_bounds(bucket_index(value))
+            self.assertLessEqual(lower, value)
+            self.assertLessEqual(value, upper)
+            self.assertLessEqual(upper - lower, max(lower // 16, 0) + 1)
+
+    def test_bucketIndex_monotonic(self):
+        indexes = [bucket_index(value) for value in range(10_000)]
+        self.assertEqual(indexes, sorted(indexes))
+
+    def test_record_countSumMinMax(self):
+        histogram = LatencyHistogram()
+
+        histogram.record_many([5, 1_000, 3_000_000])
+
+        self.assertEqual(histogram.count, 3)
+        self.assertEqual(histogram.total, 3_001_005)
+        self.assertEqual(histogram.min, 5)
+        self.assertEqual(histogram.max, 3_000_000)
+
+    def test_percentile_withinPrecision(self):
+        histogram = LatencyHistogram()
+        values = list(range(1, 100_001))
+        histogram.record_many(values)
+
+        for percentile in (50, 90, 99):
+            exact = values[int(percentile / 100 * len(values)) - 1]
+            approximate = histogram.percentile(percentile)
+            self.assertLess(abs(approximate - exact) / exact, 0.07)
+        self.assertEqual(histogram.percentile(0), 1)
+        self.assertEqual(histogram.percentile(100), 100_000)
+
+    def test_percentile_smallCount_nearestRank(self):
+        histogram = LatencyHistogram()
+        histogram.record_many([1, 2, 3, 4])
+
+        # ranks ceil(0.5 * 4) = 2, ceil(0.6 * 4) = 3 and ceil(0.9 * 4) = 4
+        self.assertEqual([histogram.percentile(p) for p in (50, 60, 90)], [2, 3, 4])
+
+    def test_percentileRank_nearestRank(self):
+        self.assertEqual(percentile_rank(0, 10), 1)
+        self.assertEqual(percentile_rank(7, 100), 7)
+        self.assertEqual(percentile_rank(12.5, 4), 1)
+        self.assertEqual(percentile_rank(62.5, 4), 3)
+        self.assertEqual(percentile_rank(99.9, 1000), 999)
+        self.assertEqual(percentile_rank(100, 10), 10)
+
+    def test_percentile_empty_none(self):
+        self.assertIsNone(LatencyHistogram().percentile(50))
+
+    def test_percentile_invalid_raises(self):
+        with self.assertRaises(ValueError):
+            LatencyHistogram().percentile(101)
+
+    def test_merge_sameAsRecordingAll(self):
+        first, second, expected = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        first.record_many(range(0, 1000, 3))
+        second.record_many(range(500, 5000, 7))
+        expected.record_many(list(range(0, 1000, 3)) + list(range(500, 5000, 7)))
+
+        first.merge(second)
+
+        self.assertEqual(first.to_dict(), expected.to_dict())
+
+    def test_toDict_jsonRoundTrip(self):
+        histogram = LatencyHistogram()
+        histogram.record_many([1, 20, 300, 4_000])
+
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+
+        self.assertEqual(restored.to_dict(), histogram.to_dict())
@@ -61,3 +61,30 @@ class TestOperated(OpLogTestCase):
 
         op = self.ops[0]
         self.assertEqual(op.name, "operated_function.operated_function")
+
+    def test_operated_disabled_originalFunctionReturned(self):
+        def func():
+            pass
+
+        Operated.config(enabled=False)
+        operated_func = Operated()(func)
+        operated_func()
+
+        self.assertIs(operated_func, func)
+        self.assertEqual(len(self.ops), 0)
+
+    def test_operated_returnValue_returned(self):
+        @Operated()
+        def func(a, b=0):
+            return a + b
+
+        self.assertEqual(func(1, b=2), 3)
+        self.assertEqual(func.__name__, "func")
+
+    def test_operated_suppressedFailure_noneReturned(self):
+        @Operated(suppress=True)
+        def func():
+            raise ValueError("test exception")
+
+        self.assertIsNone(func())
+        self.assertEqual(self.ops[0].result, "Failure")
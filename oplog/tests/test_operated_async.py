@@ -1,5 +1,6 @@
 import asyncio
 from oplog.operated import Operated
+from oplog.operation import Operation
 
 
 from oplog.tests.logged_test_case import OpLogAsyncTestCase
@@ -11,6 +12,18 @@ class OperatedTestClass:
         await asyncio.sleep(0.1)
         return "success"
 
+    @Operated("test_op_async_gen")
+    async def operated_async_gen(self, count: int):
+        for i in range(count):
+            await asyncio.sleep(0.05)
+            yield i
+
+    @Operated("test_op_async_failure")
+    async def operated_async_failure(self):
+        await asyncio.sleep(0)
+        raise ValueError("test exception")
+
+
 class TestOperatedAsync(OpLogAsyncTestCase):
     async def test_operated_asyncMethod_underlyingOperationCreated(self):
         otc = OperatedTestClass()
@@ -20,4 +33,69 @@ class TestOperatedAsync(OpLogAsyncTestCase):
         self.assertEqual(success, "success")
         self.assertEqual(len(self.ops), 1)
         op = self.ops[0]
-        self.assertEqual(op.name, "test_op_async")
\ No newline at end of file
+        self.assertEqual(op.name, "test_op_async")
+
+    async def test_operated_asyncMethod_durationCoversAwait(self):
+        otc = OperatedTestClass()
+
+        await otc.operated_async_method()
+
+        op = self.get_op("test_op_async")
+        self.assertGreaterEqual(op.duration_ms, 100)
+
+    async def test_operated_asyncMethodFails_failureLogged(self):
+        otc = OperatedTestClass()
+
+        with self.assertRaises(ValueError):
+            await otc.operated_async_failure()
+
+        op = self.get_op("test_op_async_failure")
+        self.assertEqual(op.result, "Failure")
+        self.assertEqual(op.exception_type, "ValueError")
+
+    async def test_operated_asyncGenerator_durationCoversIteration(self):
+        otc = OperatedTestClass()
+
+        items = [item async for item in otc.operated_async_gen(3)]
+
+        self.assertEqual(items, [0, 1, 2])
+        op = self.get_op("test_op_async_gen")
+        self.assertEqual(op.result, "Success")
+        self.assertGreaterEqual(op.duration_ms, 150)
+
+    async def test_operated_asyncGeneratorClosedEarly_successLogged(self):
+        otc = OperatedTestClass()
+
+        agen = otc.operated_async_gen(3)
+        async for _ in agen:
+            break
+        await agen.aclose()
+
+        op = self.get_op("test_op_async_gen")
+        self.assertEqual(op.result, "Success")
+
+    async def test_operated_asyncGenerator_consumerOpsNotParented(self):
+        otc = OperatedTestClass()
+
+        async for _ in otc.operated_async_gen(1):
+            with Operation(name="consumer_op"):
+                pass
+
+        self.assertIsNone(self.get_op("consumer_op").parent_op)
+
+    async def test_operated_concurrentTasks_parentIsOfEachTask(self):
+        @Operated("child_op")
+        async def child():
+            await asyncio.sleep(0.01)
+
+        async def task(name: str):
+            async with Operation(name=name) as op:
+                await asyncio.sleep(0.01)
+                await child()
+            return op
+
+        parent_ops = await asyncio.gather(*(task(f"task{i}") for i in range(5)))
+
+        for parent_op in parent_ops:
+            self.assertEqual(len(parent_op.child_ops), 1)
+            self.assertIs(parent_op.child_ops[0].parent_op, parent_op)
@@ -1,14 +1,21 @@
+import asyncio
+import gc
 import inspect
 import logging
+import threading
 from unittest.mock import patch, call, ANY, Mock
 from parameterized import parameterized  # type: ignore
+from oplog.child_retention import ChildRetention
 from oplog.exceptions import (
     GlobalOperationPropertyAlreadyExistsException,
     OperationPropertyAlreadyExistsException
 )
-from oplog.operation import Operation
+from oplog.id_generators import BaseIdGenerator, CounterIdGenerator
+from oplog.operation import Operation, active_operation
 from oplog.operation_step import OperationStep
+from oplog.sinks import BaseOperationSink
 
+from oplog.tests import caller_module
 from oplog.tests.logged_test_case import OpLogTestCase
 
 
@@ -16,6 +23,11 @@ class OperationExceptionTest(Exception):
     pass
 
 
+class NullSink(BaseOperationSink):
+    def emit(self, op: Operation) -> None:
+        pass
+
+
 class TestOperation(OpLogTestCase):
     def test_operation_loggerLogCalled(self):
         with patch.object(
@@ -91,6 +103,24 @@ class TestOperation(OpLogTestCase):
             Operation.add_global(prop_name=prop_name, value=prop_value_1)
             Operation.add_global(prop_name=prop_name, value=prop_value_2)
 
+    def test_addGlobal_newSnapshotPublished(self):
+        before = Operation.global_props
+
+        Operation.add_global(prop_name="test_global_prop", value=1)
+
+        self.assertIsNot(Operation.global_props, before)
+        self.assertGreater(Operation.global_props.version, before.version)
+        self.assertNotIn("test_global_prop", before)
+
+    def test_factoryReset_propsClearedAndVersionIncreased(self):
+        Operation.add_global(prop_name="test_global_prop", value=1)
+        version = Operation.global_props.version
+
+        Operation.factory_reset()
+
+        self.assertEqual(len(Operation.global_props), 0)
+        self.assertGreater(Operation.global_props.version, version)
+
     def test_addGlobal_unsupportedType_raises(self):
         prop_name = "test_global_prop"
         prop_value = {"test": 1}
@@ -332,3 +362,272 @@ class TestOperation(OpLogTestCase):
             extra={"oplog": op}
         )
 
+
+    def test_operation_nestedCallers_loggerIsOfEachCallerModule(self):
+        # arrange
+        def create_op():
+            return Operation(name="test_op")
+
+        # act
+        # this module calls into `caller_module`, which creates an operation,
+        # and calls back into this module, which creates another one
+        other_module_op = caller_module.create_op()
+        this_module_op = caller_module.call(create_op)
+        other_module_op_again = caller_module.create_op()
+
+        # assert
+        self.assertEqual(other_module_op._logger, logging.getLogger(caller_module.__name__))
+        self.assertEqual(this_module_op._logger, logging.getLogger(__name__))
+        self.assertNotEqual(caller_module.__name__, __name__)
+        # the cached logger of each caller is kept apart
+        self.assertEqual(other_module_op_again._logger, other_module_op._logger)
+        self.assertIn(__name__, Operation._caller_loggers)
+        self.assertIn(caller_module.__name__, Operation._caller_loggers)
+
+    def test_operation_dynamicallyCreatedCallers_oneCachedLoggerPerModule(self):
+        # arrange
+        namespace = {"Operation": Operation, "__name__": __name__}
+        create_ops = []
+        for _ in range(10):
+            exec("def create_op():\n    return Operation(name='test_op')", namespace)
+            create_ops.append(namespace["create_op"])
+
+        # act
+        ops = [create_op() for create_op in create_ops]
+
+        # assert
+        self.assertEqual({op._logger for op in ops}, {logging.getLogger(__name__)})
+        self.assertEqual(list(Operation._caller_loggers), [__name__])
+
+    def test_operation_exit_activeOperationRestored(self):
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op"):
+                self.assertEqual(active_operation.get().name, "child_op")
+            self.assertIs(active_operation.get(), parent_op)
+
+        self.assertIsNone(active_operation.get())
+
+    def test_operation_otherThread_noParent(self):
+        thread_ops = []
+
+        def run():
+            with Operation(name="thread_op") as thread_op:
+                thread_ops.append(thread_op)
+
+        with Operation(name="parent_op") as parent_op:
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        self.assertIsNone(thread_ops[0].parent_op)
+        self.assertEqual(parent_op.child_ops, [])
+
+    def test_operation_concurrentTasks_parentIsOfEachTask(self):
+        task_ops = {}
+
+        async def task(name: str):
+            with Operation(name=f"{name}_parent") as parent_op:
+                await asyncio.sleep(0.01)
+                with Operation(name=f"{name}_child") as child_op:
+                    await asyncio.sleep(0.01)
+            task_ops[name] = (parent_op, child_op)
+
+        async def run_tasks():
+            await asyncio.gather(*(task(f"task{i}") for i in range(5)))
+
+        asyncio.run(run_tasks())
+
+        for parent_op, child_op in task_ops.values():
+            self.assertEqual(child_op.parent_op, parent_op)
+            self.assertEqual(parent_op.child_ops, [child_op])
+        self.assertIsNone(active_operation.get())
+
+    def test_operation_loggerDisabled_notLoggedAndMetadataSkipped(self):
+        # arrange
+        logger_name = "test_disabled_logger"
+        logger = logging.getLogger(logger_name)
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.CRITICAL)
+        Operation.config(logger_name=logger_name)
+
+        # act
+        with Operation(name="test_op") as op:
+            pass
+
+        # assert
+        self.assertEqual(len(self.ops), 0)
+        self.assertIsNone(op._id)
+        self.assertIsNone(op._correlation_id)
+        self.assertIsNone(op.thread_id)
+        self.assertEqual(op.result, "Success")
+
+    def test_operation_loggerAboveInfo_failureLogged(self):
+        # arrange
+        logger_name = "test_error_logger"
+        logger = logging.getLogger(logger_name)
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.ERROR)
+        Operation.config(logger_name=logger_name)
+
+        # act
+        with Operation(name="test_op", suppress=True):
+            raise OperationExceptionTest("test exception")
+
+        # assert
+        op = self.get_op("test_op")
+        self.assertEqual(op.result, "Failure")
+        self.assertIsNotNone(op.start_time_utc_str)
+        self.assertIsNotNone(op.thread_id)
+        self.assertNotEqual(op.traceback, "")
+
+    def test_operation_parentDisabled_enabledChildInheritsCorrelation(self):
+        # arrange
+        logger_name = "test_disabled_logger"
+        logger = logging.getLogger(logger_name)
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.CRITICAL)
+        Operation.config(logger_name=logger_name)
+
+        # act
+        with Operation(name="parent_op") as parent_op:
+            Operation.config()
+            with Operation(name="child_op"):
+                pass
+
+        # assert
+        self.assertEqual(len(self.ops), 1)
+        child_op = self.get_op("child_op")
+        self.assertIs(child_op.parent_op, parent_op)
+        self.assertEqual(child_op.correlation_id, parent_op.correlation_id)
+
+    def test_config_idGenerator_usedForIdsAndCorrelation(self):
+        # arrange
+        Operation.config(id_generator=CounterIdGenerator())
+
+        # act
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op") as child_op:
+                pass
+
+        # assert
+        prefix = Operation._id_generator.prefix
+        self.assertTrue(parent_op.id.startswith(prefix))
+        self.assertTrue(child_op.id.startswith(prefix))
+        self.assertTrue(parent_op.correlation_id.startswith(prefix))
+        self.assertEqual(child_op.correlation_id, parent_op.correlation_id)
+        self.assertNotEqual(parent_op.id, child_op.id)
+
+    def test_operation_idsNotRead_notGenerated(self):
+        # arrange
+        generator_mock = Mock(spec=BaseIdGenerator)
+        Operation.config(id_generator=generator_mock)
+
+        # act
+        with Operation(name="parent_op"):
+            with Operation(name="child_op"):
+                pass
+
+        # assert
+        generator_mock.generate.assert_not_called()
+
+    def test_operation_parentId_isIdOfParent(self):
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op") as child_op:
+                pass
+
+        self.assertIsNone(parent_op.parent_id)
+        self.assertEqual(child_op.parent_id, parent_op.id)
+
+    def test_operation_depth_nestingLevel(self):
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op") as child_op:
+                with Operation(name="grandchild_op") as grandchild_op:
+                    pass
+
+        self.assertEqual([parent_op.depth, child_op.depth, grandchild_op.depth], [0, 1, 2])
+
+    def test_childRetention_all_childrenRetainedAndCounted(self):
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op1") as child_op1:
+                pass
+            with Operation(name="child_op2", suppress=True) as child_op2:
+                raise OperationExceptionTest()
+
+        self.assertEqual(parent_op.child_ops, [child_op1, child_op2])
+        self.assertEqual(parent_op.child_count, 2)
+        self.assertEqual(parent_op.failed_child_count, 1)
+
+    def test_childRetention_ring_lastChildrenRetained(self):
+        Operation.config(child_retention=ChildRetention.RING, max_child_ops=2)
+
+        with Operation(name="parent_op") as parent_op:
+            child_ops = []
+            for i in range(5):
+                with Operation(name=f"child_op{i}") as child_op:
+                    child_ops.append(child_op)
+
+        self.assertEqual(parent_op.child_ops, child_ops[-2:])
+        self.assertEqual(parent_op.child_count, 5)
+
+    def test_childRetention_weakref_collectedChildrenDropped(self):
+        Operation.config(sinks=[NullSink()], child_retention=ChildRetention.WEAKREF)
+
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op1"):
+                pass
+            with Operation(name="child_op2") as child_op2:
+                pass
+            gc.collect()
+
+            self.assertEqual(parent_op.child_ops, [child_op2])
+            self.assertEqual(parent_op.child_count, 2)
+
+    def test_childRetention_summary_onlyCounted(self):
+        Operation.config(child_retention=ChildRetention.SUMMARY)
+
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op1"):
+                pass
+            with Operation(name="child_op2", suppress=True) as child_op2:
+                raise OperationExceptionTest()
+
+        self.assertEqual(parent_op.child_ops, [])
+        self.assertEqual(parent_op.child_count, 2)
+        self.assertEqual(parent_op.failed_child_count, 1)
+        self.assertIs(child_op2.parent_op, parent_op)
+
+    def test_childRetention_none_notTracked(self):
+        Operation.config(child_retention=ChildRetention.NONE)
+
+        with Operation(name="parent_op") as parent_op:
+            with Operation(name="child_op", suppress=True) as child_op:
+                raise OperationExceptionTest()
+
+        self.assertEqual(parent_op.child_ops, [])
+        self.assertEqual(parent_op.child_count, 0)
+        self.assertEqual(parent_op.failed_child_count, 0)
+        self.assertEqual(child_op.parent_id, parent_op.id)
+
+    def test_config_maxChildOpsNotPositive_raises(self):
+        with self.assertRaises(ValueError):
+            Operation.config(max_child_ops=0)
+
+    def test_operation_failure_tracebackFormattedAndFingerprinted(self):
+        def fail():
+            with Operation(name="test_op", suppress=True) as op:
+                raise OperationExceptionTest("test exception")
+            return op
+
+        first_op, second_op = fail(), fail()
+
+        self.assertTrue(any("raise OperationExceptionTest" in line for line in first_op.traceback))
+        self.assertIs(first_op.traceback, second_op.traceback)
+        self.assertIsNotNone(first_op.traceback_fingerprint)
+        self.assertEqual(first_op.traceback_fingerprint, second_op.traceback_fingerprint)
+
+    def test_operation_success_noTracebackNorFingerprint(self):
+        with Operation(name="test_op") as op:
+            pass
+
+        self.assertEqual(op.traceback, "")
+        self.assertIsNone(op.traceback_fingerprint)
@@ -0,0 +1,108 @@
+import functools
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from oplog import OperationFunnel
+from oplog.formatters import CsvOperationFormatter, VerboseOperationFormatter
+from oplog.operation import Operation
+from oplog.sinks import FileOperationSink, SharedMemoryOperationSink
+
+
+def worker(address, authkey, worker_id: int, num_ops: int) -> None:
+    sink = SharedMemoryOperationSink.connect(address, authkey)
+    Operation.config(sinks=[sink])
+    for i in range(num_ops):
+        with Operation(name=f"worker{worker_id}_op{i}"):
+            pass
+    sink.close()
+
+
+def global_props_worker(address, authkey, worker_id: int) -> None:
+    Operation.add_global("worker", worker_id)
+    worker(address, authkey, worker_id, 2)
+
+
+class TestOperationFunnel(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, "ops.csv")
+        self.funnel = OperationFunnel(
+            sink_factory=functools.partial(
+                FileOperationSink, CsvOperationFormatter(columns=["name"]), self.filename
+            ),
+        )
+
+    def tearDown(self):
+        Operation.factory_reset()
+        self.funnel.stop()
+        self.tmp_dir.cleanup()
+
+    def read_names(self):
+        with open(self.filename) as f:
+            return sorted(line.strip().strip('"') for line in f)
+
+    def test_workers_allOpsWrittenBySingleSink(self):
+        self.funnel.start()
+
+        processes = [
+            multiprocessing.Process(
+                target=worker, args=(self.funnel.address, self.funnel.authkey, worker_id, 50)
+            )
+            for worker_id in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.funnel.stop()
+
+        expected = sorted(f"worker{w}_op{i}" for w in range(3) for i in range(50))
+        self.assertEqual(self.read_names(), expected)
+
+    def test_workers_globalPropsOfEachWorkerWritten(self):
+        self.funnel.sink_factory = functools.partial(
+            FileOperationSink, VerboseOperationFormatter(), self.filename
+        )
+        self.funnel.start()
+
+        processes = [
+            multiprocessing.Process(
+                target=global_props_worker,
+                args=(self.funnel.address, self.funnel.authkey, worker_id),
+            )
+            for worker_id in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        self.funnel.stop()
+
+        with open(self.filename) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        for line in lines:
+            worker_id = line.split("[worker")[1][0]
+            self.assertTrue(line.endswith(f" {{'worker': {worker_id}}}"), line)
+
+    def test_connect_sameProcess_opsWritten(self):
+        with self.funnel:
+            sink = self.funnel.connect(capacity=4096)
+            Operation.config(sinks=[sink])
+            with Operation(name="test_op") as op:
+                op.add("prop", 1)
+            sink.close()
+
+        self.assertEqual(self.read_names(), ["test_op"])
+
+    def test_connect_notStarted_raises(self):
+        with self.assertRaises(RuntimeError):
+            self.funnel.connect()
+
+    def test_start_alreadyStarted_raises(self):
+        self.funnel.start()
+
+        with self.assertRaises(RuntimeError):
+            self.funnel.start()
@@ -0,0 +1,173 @@
+import logging
+import threading
+from unittest import mock
+
+from oplog import OverflowPolicy, QueuedOperationHandler
+from oplog.operation import Operation
+from oplog.operation_step import OperationStep
+from oplog.tests.logged_test_case import ListLoggingHandler, OpLogTestCase
+
+
+class BlockingListLoggingHandler(ListLoggingHandler):
+    def __init__(self):
+        super().__init__()
+        self.release_event = threading.Event()
+        self.blocked_event = threading.Event()
+
+    def emit(self, record):
+        self.blocked_event.set()
+        self.release_event.wait()
+        super().emit(record)
+
+
+class TestQueuedOperationHandler(OpLogTestCase):
+    def setUp(self):
+        super().setUp()
+        self.op_handlers = []
+
+    def tearDown(self):
+        for op_handler in self.op_handlers:
+            logging.getLogger().removeHandler(op_handler)
+            op_handler.close()
+        return super().tearDown()
+
+    def _add_op_handler(self, handler: logging.Handler, **kwargs) -> QueuedOperationHandler:
+        op_handler = QueuedOperationHandler(handler, **kwargs)
+        self.op_handlers.append(op_handler)
+        logging.getLogger().addHandler(op_handler)
+        return op_handler
+
+    def test_queuedOperationHandler_flush_operationsWritten(self):
+        list_handler = ListLoggingHandler()
+        op_handler = self._add_op_handler(list_handler)
+
+        for i in range(100):
+            with Operation(name=f"test_op_{i}"):
+                pass
+        op_handler.flush()
+
+        self.assertEqual(len(list_handler.logs), 100)
+        self.assertEqual(op_handler.queued_records, 100)
+        self.assertEqual(op_handler.dropped_records, 0)
+        self.assertEqual(op_handler.pending_records, 0)
+
+    def test_queuedOperationHandler_loggingInfo_infoNotQueued(self):
+        handler_mock = mock.Mock()
+        op_handler = self._add_op_handler(handler_mock)
+
+        logging.getLogger().info("test_info")
+        op_handler.flush()
+
+        self.assertEqual(op_handler.queued_records, 0)
+        handler_mock.emit.assert_not_called()
+
+    def test_queuedOperationHandler_close_queuedOperationsWritten(self):
+        list_handler = BlockingListLoggingHandler()
+        op_handler = self._add_op_handler(list_handler)
+
+        for i in range(10):
+            with Operation(name=f"test_op_{i}"):
+                pass
+        list_handler.release_event.set()
+        op_handler.close()
+
+        self.assertEqual(len(list_handler.logs), 10)
+
+    def test_queuedOperationHandler_dropNewest_newestDropped(self):
+        list_handler = BlockingListLoggingHandler()
+        op_handler = self._add_op_handler(
+            list_handler, capacity=2, overflow_policy=OverflowPolicy.DROP_NEWEST)
+
+        with Operation(name="in_flight_op"):
+            pass
+        # wait for the writer to take the first record
+        list_handler.blocked_event.wait()
+        for name in ("op_1", "op_2", "op_3"):
+            with Operation(name=name):
+                pass
+        list_handler.release_event.set()
+        op_handler.flush()
+
+        names = [record.oplog.name for record in list_handler.logs]
+        self.assertEqual(names, ["in_flight_op", "op_1", "op_2"])
+        self.assertEqual(op_handler.dropped_records, 1)
+
+    def test_queuedOperationHandler_dropOldest_oldestDropped(self):
+        list_handler = BlockingListLoggingHandler()
+        op_handler = self._add_op_handler(
+            list_handler, capacity=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+        with Operation(name="in_flight_op"):
+            pass
+        list_handler.blocked_event.wait()
+        for name in ("op_1", "op_2", "op_3"):
+            with Operation(name=name):
+                pass
+        list_handler.release_event.set()
+        op_handler.flush()
+
+        names = [record.oplog.name for record in list_handler.logs]
+        self.assertEqual(names, ["in_flight_op", "op_2", "op_3"])
+        self.assertEqual(op_handler.dropped_records, 1)
+
+    def test_queuedOperationHandler_block_allWritten(self):
+        list_handler = ListLoggingHandler()
+        op_handler = self._add_op_handler(
+            list_handler, capacity=1, batch_size=1, overflow_policy=OverflowPolicy.BLOCK)
+
+        def run():
+            for i in range(50):
+                with Operation(name=f"test_op_{i}"):
+                    pass
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        op_handler.flush()
+
+        self.assertEqual(len(list_handler.logs), 200)
+        self.assertEqual(op_handler.dropped_records, 0)
+
+    def test_queuedOperationHandler_onStart_startRecordWrittenAsLogged(self):
+        list_handler = BlockingListLoggingHandler()
+        op_handler = self._add_op_handler(list_handler)
+
+        with Operation(name="test_op", on_start=True):
+            # the writer holds the start record until the operation ended
+            list_handler.blocked_event.wait()
+        list_handler.release_event.set()
+        op_handler.flush()
+
+        start_op, end_op = [record.oplog for record in list_handler.logs]
+        self.assertEqual(start_op.step, OperationStep.START)
+        self.assertIsNone(start_op.duration_ns)
+        self.assertIsNone(start_op.result)
+        self.assertEqual(end_op.step, OperationStep.END)
+
+    def test_queuedOperationHandler_closed_inlineWriteDoesNotHoldLock(self):
+        list_handler = BlockingListLoggingHandler()
+        op_handler = self._add_op_handler(list_handler)
+        op_handler.close()
+
+        def run():
+            with Operation(name="test_op"):
+                pass
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        list_handler.blocked_event.wait()
+        # the lock is free while the inline write is blocked
+        acquired = op_handler._queue_lock.acquire(timeout=5)
+        if acquired:
+            op_handler._queue_lock.release()
+        list_handler.release_event.set()
+        thread.join()
+
+        self.assertTrue(acquired)
+        self.assertEqual(len(list_handler.logs), 1)
+
+    def test_queuedOperationHandler_invalidCapacity_raises(self):
+        with self.assertRaises(ValueError):
+            QueuedOperationHandler(ListLoggingHandler(), capacity=0)
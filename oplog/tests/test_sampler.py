@@ -0,0 +1,102 @@
+import time
+from unittest.mock import patch
+
+from oplog import Operation, Sampler
+from oplog.tests.logged_test_case import OpLogTestCase
+
+
+class SamplerTestException(Exception):
+    pass
+
+
+class TestSampler(OpLogTestCase):
+    def test_sampler_rateZero_sampledOutAndCounted(self):
+        sampler = Sampler(rate=0.0)
+        Operation.config(sampler=sampler)
+
+        with Operation(name="test_op"):
+            pass
+
+        self.assertEqual(len(self.ops), 0)
+        self.assertEqual(sampler.sampled_out_count, 1)
+
+    def test_sampler_rateOne_allLogged(self):
+        sampler = Sampler(rate=1.0)
+        Operation.config(sampler=sampler)
+
+        for _ in range(10):
+            with Operation(name="test_op"):
+                pass
+
+        self.assertEqual(len(self.ops), 10)
+        self.assertEqual(sampler.sampled_out_count, 0)
+
+    def test_sampler_rateByName_overridesDefault(self):
+        Operation.config(sampler=Sampler(rate=0.0, rates={"kept_op": 1.0}))
+
+        with Operation(name="kept_op"):
+            pass
+        with Operation(name="dropped_op"):
+            pass
+
+        self.assertEqual([op.name for op in self.ops], ["kept_op"])
+
+    def test_sampler_decidedAtRoot_childrenInherit(self):
+        Operation.config(sampler=Sampler(rate=0.0, rates={"child_op": 1.0}))
+
+        with Operation(name="root_op"):
+            with Operation(name="child_op"):
+                pass
+
+        self.assertEqual(len(self.ops), 0)
+
+    def test_sampler_partialRate_treeLoggedAsWhole(self):
+        Operation.config(sampler=Sampler(rate=0.5))
+
+        with patch("oplog.sampler.random.random", side_effect=[0.1, 0.9]):
+            for i in range(2):
+                with Operation(name=f"root_op_{i}"):
+                    with Operation(name=f"child_op_{i}"):
+                        pass
+
+        self.assertEqual(sorted(op.name for op in self.ops), ["child_op_0", "root_op_0"])
+
+    def test_sampler_keepFailures_failureKept(self):
+        sampler = Sampler(rate=0.0)
+        Operation.config(sampler=sampler)
+
+        with Operation(name="test_op", suppress=True):
+            raise SamplerTestException("test exception")
+
+        self.assertEqual(self.get_op("test_op").result, "Failure")
+        self.assertEqual(sampler.sampled_out_count, 0)
+
+    def test_sampler_keepFailuresDisabled_failureSampledOut(self):
+        Operation.config(sampler=Sampler(rate=0.0, keep_failures=False))
+
+        with Operation(name="test_op", suppress=True):
+            raise SamplerTestException("test exception")
+
+        self.assertEqual(len(self.ops), 0)
+
+    def test_sampler_keepSlowerThan_slowOpKept(self):
+        Operation.config(sampler=Sampler(rate=0.0, keep_slower_than_ms=5))
+
+        with Operation(name="fast_op"):
+            pass
+        with Operation(name="slow_op"):
+            time.sleep(0.01)
+
+        self.assertEqual([op.name for op in self.ops], ["slow_op"])
+
+    def test_sampler_onStartSampledOut_notLoggedOnStart(self):
+        Operation.config(sampler=Sampler(rate=0.0))
+
+        with Operation(name="test_op", on_start=True):
+            self.assertEqual(len(self.ops), 0)
+
+    def test_sampler_invalidRate_raises(self):
+        with self.assertRaises(ValueError):
+            Sampler(rate=1.5)
+        with self.assertRaises(ValueError):
+            Sampler(rates={"test_op": -0.1})
@@ -0,0 +1,53 @@
+import unittest
+
+from oplog.shared_memory_ring import SharedMemoryRing
+
+
+class TestSharedMemoryRing(unittest.TestCase):
+    def setUp(self):
+        self.ring = SharedMemoryRing.create(capacity=64)
+        self.consumer = SharedMemoryRing.attach(self.ring.name)
+
+    def tearDown(self):
+        self.consumer.close()
+        self.ring.close()
+
+    def test_getBatch_recordsInOrder(self):
+        self.assertTrue(self.ring.put(b"first"))
+        self.assertTrue(self.ring.put(b"second"))
+
+        self.assertEqual(self.consumer.get_batch(), [b"first", b"second"])
+        self.assertEqual(self.consumer.get_batch(), [])
+        self.assertEqual(self.ring.used, 0)
+
+    def test_getBatch_maxRecords_restLeftInRing(self):
+        for i in range(3):
+            self.ring.put(bytes([i]))
+
+        self.assertEqual(self.consumer.get_batch(max_records=2), [b"\x00", b"\x01"])
+        self.assertEqual(self.consumer.get_batch(), [b"\x02"])
+
+    def test_put_full_returnsFalse(self):
+        self.assertTrue(self.ring.put(b"x" * 40))
+
+        self.assertFalse(self.ring.put(b"x" * 40))
+        self.consumer.get_batch()
+        self.assertTrue(self.ring.put(b"x" * 40))
+
+    def test_put_wrapsAround_recordsIntact(self):
+        records = [bytes([i]) * (10 + i) for i in range(20)]
+
+        read = []
+        for record in records:
+            self.assertTrue(self.ring.put(record))
+            read.extend(self.consumer.get_batch())
+
+        self.assertEqual(read, records)
+
+    def test_put_recordLargerThanCapacity_raises(self):
+        with self.assertRaises(ValueError):
+            self.ring.put(b"x" * 64)
+
+    def test_create_capacityTooSmall_raises(self):
+        with self.assertRaises(ValueError):
+            SharedMemoryRing.create(capacity=4)
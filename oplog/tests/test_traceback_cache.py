@@ -0,0 +1,69 @@
+import sys
+import traceback
+import unittest
+
+from oplog.traceback_cache import TracebackCache
+
+
+def fail(exc_type=ValueError):
+    raise exc_type("failure")
+
+
+def capture(exc_type=ValueError):
+    try:
+        fail(exc_type)
+    except Exception:
+        return sys.exc_info()
+
+
+class TestTracebackCache(unittest.TestCase):
+    def test_get_formattedLikeExtractTb(self):
+        cache = TracebackCache()
+        exc_type, _, exc_tb = capture()
+
+        entry = cache.get(cache.key(exc_type, exc_tb))
+
+        expected = traceback.extract_tb(exc_tb, limit=10)
+        self.assertEqual(len(entry.lines), len(expected))
+        for line, frame in zip(entry.lines, expected):
+            self.assertIn(f'File "{frame.filename}", line {frame.lineno}, in {frame.name}', line)
+            self.assertIn(frame.line, line)
+
+    def test_get_sameSite_sameEntryAndFingerprint(self):
+        cache = TracebackCache()
+        first = cache.get(cache.key(*capture()[::2]))
+        second = cache.get(cache.key(*capture()[::2]))
+
+        self.assertIs(first, second)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_get_otherExceptionType_otherFingerprint(self):
+        cache = TracebackCache()
+        value_error = cache.get(cache.key(*capture(ValueError)[::2]))
+        key_error = cache.get(cache.key(*capture(KeyError)[::2]))
+
+        self.assertNotEqual(value_error.fingerprint, key_error.fingerprint)
+        self.assertEqual(len(cache), 2)
+
+    def test_key_limit_outermostFramesKept(self):
+        cache = TracebackCache(limit=1)
+        exc_type, _, exc_tb = capture()
+
+        _, locations = cache.key(exc_type, exc_tb)
+
+        self.assertEqual(len(locations), 1)
+        self.assertIs(locations[0][0], capture.__code__)
+
+    def test_get_full_oldestEvicted(self):
+        cache = TracebackCache(max_size=1)
+        value_error_key = cache.key(*capture(ValueError)[::2])
+        cache.get(value_error_key)
+        cache.get(cache.key(*capture(KeyError)[::2]))
+
+        self.assertEqual(len(cache), 1)
+        cache.get(value_error_key)
+        self.assertEqual(cache.misses, 3)
+
+    def test_init_maxSizeNotPositive_raises(self):
+        with self.assertRaises(ValueError):
+            TracebackCache(max_size=0)
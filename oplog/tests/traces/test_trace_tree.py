@@ -0,0 +1,72 @@
+import unittest
+
+from oplog.readers import OperationRecord
+from oplog.traces import TraceTree
+
+
+def record(name, start, duration, parent=None, correlation_id="correlation_0"):
+    return OperationRecord(name=name, start_time_ns=start, duration_ns=duration, id=name,
+                           parent_id=parent, correlation_id=correlation_id)
+
+
+# root:   [0 ............................ 100]
+# seq_1:     [10 ... 40]
+# par_1:             [30 ........ 70]
+# par_2:             [30 ... 50]
+# leaf:                 [35 . 45]
+RECORDS = [
+    record("seq_1", 10, 30, parent="root"),
+    record("leaf", 35, 10, parent="par_1"),
+    record("par_1", 30, 40, parent="root"),
+    record("par_2", 30, 20, parent="root"),
+    record("root", 0, 100),
+]
+
+
+class TestTraceTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = TraceTree("correlation_0", RECORDS)
+        self.nodes = {node.name: node for node in self.tree.nodes}
+
+    def test_init_linkedByParentId(self):
+        self.assertIs(self.tree.root, self.nodes["root"])
+        self.assertEqual(self.tree.roots, [self.nodes["root"]])
+        # by start time
+        self.assertEqual([child.name for child in self.nodes["root"].children], ["seq_1", "par_1", "par_2"])
+        self.assertEqual(self.tree.size, 5)
+        self.assertEqual(self.tree.depth, 2)
+        self.assertEqual(self.tree.max_fan_out, 3)
+
+    def test_selfTime_concurrentChildrenCountedOnce(self):
+        # children cover [10, 70]
+        self.assertEqual(self.nodes["root"].self_time_ns, 40)
+        self.assertEqual(self.nodes["par_1"].self_time_ns, 30)
+        self.assertEqual(self.nodes["leaf"].self_time_ns, 10)
+
+    def test_criticalPath_lastFinishingChildren(self):
+        path = [(node.name, ns) for node, ns in self.tree.critical_path()]
+
+        # root waits 70-100 on itself, par_1 (which finished last) over 30-70,
+        # seq_1 over 10-30 (before par_1 started), and itself over 0-10
+        self.assertEqual(path, [("root", 40), ("seq_1", 20), ("par_1", 30), ("leaf", 10)])
+        self.assertEqual(sum(ns for _, ns in path), self.nodes["root"].duration_ns)
+
+    def test_criticalPath_deepTree_notRecursive(self):
+        records = [record(f"op_{i}", i, 10_000 - 2 * i, parent=f"op_{i - 1}" if i else None)
+                   for i in range(5_000)]
+
+        tree = TraceTree("correlation_0", records)
+
+        self.assertEqual(tree.depth, 4_999)
+        self.assertEqual(sum(ns for _, ns in tree.critical_path()), 10_000)
+
+    def test_init_missingRoot_orphansAreRoots(self):
+        tree = TraceTree("correlation_0", RECORDS[:2], complete=False)
+
+        self.assertIsNone(tree.root)
+        self.assertEqual([node.name for node in tree.roots], ["seq_1", "leaf"])
+        self.assertEqual(tree.critical_path(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from oplog import Operation
+from oplog.readers import BinaryOperationReader, OperationRecord
+from oplog.sinks import BinaryFileOperationSink
+from oplog.traces import TraceTreeBuilder
+
+
+def record(name, correlation_id, parent=None):
+    return OperationRecord(name=name, id=f"{correlation_id}.{name}", correlation_id=correlation_id,
+                           parent_id=f"{correlation_id}.{parent}" if parent else None,
+                           start_time_ns=0, duration_ns=1)
+
+
+def log_detached_op():
+    # a new thread does not inherit the active operation
+    with Operation(name="detached_op"):
+        pass
+
+
+class TestTraceTreeBuilder(unittest.TestCase):
+    def tearDown(self):
+        Operation.factory_reset()
+
+    def test_add_root_treeCompletedAndReleased(self):
+        builder = TraceTreeBuilder()
+
+        self.assertEqual(builder.add(record("child", "a", parent="root")), [])
+        self.assertEqual(builder.add(record("child", "b", parent="root")), [])
+        trees = builder.add(record("root", "a"))
+
+        self.assertEqual(len(trees), 1)
+        self.assertTrue(trees[0].complete)
+        self.assertEqual(trees[0].correlation_id, "a")
+        self.assertEqual(trees[0].size, 2)
+        self.assertEqual((builder.pending_trees, builder.pending_records), (1, 1))
+        self.assertEqual(builder.completed_trees, 1)
+
+    def test_add_maxPendingTrees_leastRecentlyUpdatedEvicted(self):
+        builder = TraceTreeBuilder(max_pending_trees=2)
+        builder.add(record("child", "a", parent="root"))
+        builder.add(record("child", "b", parent="root"))
+        builder.add(record("other_child", "a", parent="root"))
+
+        trees = builder.add(record("child", "c", parent="root"))
+
+        self.assertEqual([(tree.correlation_id, tree.complete) for tree in trees], [("b", False)])
+        self.assertEqual(builder.evicted_trees, 1)
+        self.assertEqual(builder.pending_trees, 2)
+
+    def test_add_maxPendingRecords_evicted(self):
+        builder = TraceTreeBuilder(max_pending_records=3)
+        for i in range(3):
+            builder.add(record(f"child_{i}", "a", parent="root"))
+
+        trees = builder.add(record("child", "b", parent="root"))
+
+        self.assertEqual([tree.size for tree in trees], [3])
+        self.assertEqual(builder.pending_records, 1)
+
+    def test_build_pendingFlushedAtEnd(self):
+        records = [record("child", "a", parent="root"), record("root", "b"), record("child", "c", parent="root")]
+
+        trees = list(TraceTreeBuilder().build(records))
+
+        self.assertEqual([(tree.correlation_id, tree.complete) for tree in trees],
+                         [("b", True), ("a", False), ("c", False)])
+
+    def test_build_fromLoggedOperations(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "oplogs.opb")
+            sink = BinaryFileOperationSink(filename)
+            Operation.config(sinks=[sink])
+            for _ in range(3):
+                with Operation(name="request"):
+                    with Operation(name="db"):
+                        pass
+                    thread = threading.Thread(target=log_detached_op)
+                    thread.start()
+                    thread.join()
+                    with Operation(name="render"):
+                        with Operation(name="template"):
+                            pass
+            sink.close()
+
+            trees = list(TraceTreeBuilder().build(BinaryOperationReader(filename)))
+
+        complete_trees = [tree for tree in trees if tree.complete and tree.size > 1]
+        self.assertEqual(len(complete_trees), 3)
+        for tree in complete_trees:
+            self.assertEqual(tree.root.name, "request")
+            self.assertEqual([child.name for child in tree.root.children], ["db", "render"])
+            self.assertEqual(tree.root.record.depth, 0)
+            self.assertEqual(tree.root.children[1].children[0].record.depth, 2)
+
+    def test_init_invalidArguments_raises(self):
+        with self.assertRaises(ValueError):
+            TraceTreeBuilder(max_pending_trees=0)
+        with self.assertRaises(ValueError):
+            TraceTreeBuilder(max_pending_records=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from oplog.readers import OperationRecord
+from oplog.traces import TraceTree, TraceTreeStats, aggregate
+
+
+def tree(correlation_id, root_name, child_durations, complete=True):
+    # sequential children, starting when the previous one ends
+    records = []
+    start = 0
+    for i, duration in enumerate(child_durations):
+        records.append(OperationRecord(name=f"child_{i}", start_time_ns=start, duration_ns=duration,
+                                       id=f"{correlation_id}.{i}", parent_id=f"{correlation_id}.root",
+                                       correlation_id=correlation_id))
+        start += duration
+    records.append(OperationRecord(name=root_name, start_time_ns=0, duration_ns=start + 10,
+                                   id=f"{correlation_id}.root", correlation_id=correlation_id))
+    return TraceTree(correlation_id, records, complete=complete)
+
+
+class TestTraceTreeStats(unittest.TestCase):
+    def test_aggregate_perRootName(self):
+        stats = aggregate([
+            tree("a", "checkout", [20, 60]),
+            tree("b", "checkout", [40, 40]),
+            tree("c", "search", [10]),
+            tree("d", "search", [10], complete=False),
+        ])
+
+        self.assertEqual(sorted(stats), ["checkout", "search"])
+        checkout = stats["checkout"]
+        self.assertEqual(checkout.tree_count, 2)
+        self.assertEqual(checkout.node_count, 6)
+        self.assertEqual(checkout.max_fan_out, 2)
+        self.assertEqual(checkout.mean_fan_out, 2)
+        self.assertEqual(checkout.self_time_ns, {"child_0": 60, "child_1": 100, "checkout": 20})
+        self.assertEqual(checkout.critical_time_ns, {"child_0": 60, "child_1": 100, "checkout": 20})
+        self.assertEqual(checkout.critical_path_shares(top=1), [("child_1", 100 / 180)])
+        self.assertEqual(stats["search"].tree_count, 1)
+
+    def test_merge_sameAsAddingAll(self):
+        trees = [tree(str(i), "checkout", [i, 2 * i]) for i in range(1, 5)]
+        expected, first, second = TraceTreeStats("checkout"), TraceTreeStats("checkout"), TraceTreeStats("checkout")
+        for i, trace_tree in enumerate(trees):
+            expected.add(trace_tree)
+            (first if i % 2 else second).add(trace_tree)
+
+        first.merge(second)
+
+        self.assertEqual(first.to_dict(), expected.to_dict())
+
+    def test_add_noRoot_raises(self):
+        orphans = TraceTree("a", [OperationRecord(name="child", id="1", parent_id="0")], complete=False)
+
+        with self.assertRaises(ValueError):
+            TraceTreeStats("checkout").add(orphans)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import hashlib
+import threading
+import traceback
+from types import TracebackType
+from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+
+# (exception type, ((code, line number), ...)), from the outermost frame
+TracebackKey = Tuple[Type[BaseException], Tuple[Tuple[object, int], ...]]
+
+
+class TracebackEntry(NamedTuple):
+    # formatted like `traceback.StackSummary.format()`
+    lines: List[str]
+    # a short, stable id of the exception type and its code locations
+    fingerprint: str
+
+
+class TracebackCache:
+    def __init__(self, max_size: int = 1024, limit: int = 10):
+        """A cache of formatted tracebacks, keyed on the exception type and
+        the code locations of the traceback (a fingerprint).
+
+        Failures at the same site (e.g., during an outage) share the same
+        fingerprint. Their traceback is formatted once and reused, and
+        building the key only walks the traceback, so repeated failures are cheap.
+
+        Args:
+            max_size (int, optional): Maximum number of cached tracebacks.
+                When full, the oldest one is evicted.
+            limit (int, optional): Maximum number of (outermost) frames, like
+                `traceback.extract_tb`.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, but got {max_size}")
+        self.max_size = max_size
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[TracebackKey, TracebackEntry] = {}
+        self._lock = threading.Lock()
+
+    def key(self,
+            exc_type: Type[BaseException],
+            exc_tb: Optional[TracebackType]) -> TracebackKey:
+        locations = []
+        tb = exc_tb
+        while tb is not None and len(locations) < self.limit:
+            locations.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        return exc_type, tuple(locations)
+
+    def get(self, key: TracebackKey) -> TracebackEntry:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        entry = self._create_entry(key)
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries and len(self._entries) >= self.max_size:
+                # dicts are ordered, the first key is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _create_entry(key: TracebackKey) -> TracebackEntry:
+        exc_type, locations = key
+        # source lines are read through `linecache`, as `traceback` does
+        stack = traceback.StackSummary.from_list([
+            (code.co_filename, lineno, code.co_name, None)  # type: ignore[attr-defined]
+            for code, lineno in locations
+        ])
+        fingerprint_source = "\n".join(
+            [f"{exc_type.__module__}.{exc_type.__qualname__}"]
+            + [f"{frame.filename}:{frame.name}:{frame.lineno}" for frame in stack]
+        )
+        fingerprint = hashlib.blake2b(
+            fingerprint_source.encode(), digest_size=8
+        ).hexdigest()
+        return TracebackEntry(lines=stack.format(), fingerprint=fingerprint)
+
+
+traceback_cache = TracebackCache()
@@ -0,0 +1,3 @@
+from .trace_tree import TraceNode, TraceTree  # noqa: F401
+from .trace_tree_builder import TraceTreeBuilder  # noqa: F401
+from .trace_tree_stats import TraceTreeStats, aggregate  # noqa: F401
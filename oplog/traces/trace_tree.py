@@ -0,0 +1,163 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from oplog.readers.operation_record import OperationRecord
+
+
+class TraceNode:
+    """An operation in a trace tree, with its children (by start time)."""
+
+    __slots__ = ("record", "children")
+
+    def __init__(self, record: OperationRecord) -> None:
+        self.record = record
+        self.children: List[TraceNode] = []
+
+    @property
+    def name(self) -> str:
+        return self.record.name
+
+    @property
+    def start_ns(self) -> int:
+        return self.record.start_time_ns or 0
+
+    @property
+    def duration_ns(self) -> int:
+        return self.record.duration_ns or 0
+
+    @property
+    def end_ns(self) -> int:
+        return self.start_ns + self.duration_ns
+
+    @property
+    def fan_out(self) -> int:
+        return len(self.children)
+
+    @property
+    def self_time_ns(self) -> int:
+        """The time of the operation that none of its children ran in.
+        Children may run concurrently (e.g., in executors), so the time of
+        their union is subtracted, not their sum."""
+        start_ns, end_ns = self.start_ns, self.end_ns
+        covered_ns = 0
+        cursor = start_ns
+        # children are sorted by start time
+        for child in self.children:
+            child_start = max(child.start_ns, cursor)
+            child_end = min(child.end_ns, end_ns)
+            if child_end > child_start:
+                covered_ns += child_end - child_start
+                cursor = child_end
+        return self.duration_ns - covered_ns
+
+    def __repr__(self):  # pragma: no cover
+        return f"<TraceNode name={self.name} children={len(self.children)}>"
+
+
+class TraceTree:
+    def __init__(self,
+                 correlation_id: Optional[str],
+                 records: Sequence[OperationRecord],
+                 complete: bool = True) -> None:
+        """The operations of a correlation id, linked by `parent_id`
+        (see `oplog.traces.TraceTreeBuilder`).
+
+        :param correlation_id: The correlation id of the operations.
+        :param records: The operations, in any order.
+        :param complete: Optional. False if the tree was built before its root
+        operation finished (e.g., evicted), in which case it may have many roots.
+        """
+        self.correlation_id = correlation_id
+        self.complete = complete
+        self.nodes = [TraceNode(record) for record in records]
+        nodes_by_id: Dict[str, TraceNode] = {
+            node.record.id: node for node in self.nodes if node.record.id is not None
+        }
+        # operations whose parent is not in the tree
+        self.roots: List[TraceNode] = []
+        for node in self.nodes:
+            parent = nodes_by_id.get(node.record.parent_id) if node.record.parent_id is not None else None
+            if parent is not None and parent is not node:
+                parent.children.append(node)
+            else:
+                self.roots.append(node)
+        for node in self.nodes:
+            if len(node.children) > 1:
+                node.children.sort(key=_start_ns)
+        self.roots.sort(key=_start_ns)
+
+    @property
+    def root(self) -> Optional[TraceNode]:
+        """The root operation (without a parent), None if it is missing."""
+        for node in self.roots:
+            if node.record.parent_id is None:
+                return node
+        return None
+
+    @property
+    def size(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def max_fan_out(self) -> int:
+        return max((node.fan_out for node in self.nodes), default=0)
+
+    @property
+    def depth(self) -> int:
+        """The number of levels below the roots."""
+        depth = 0
+        level = self.roots
+        while True:
+            level = [child for node in level for child in node.children]
+            if not level:
+                return depth
+            depth += 1
+
+    def critical_path(self, node: Optional[TraceNode] = None) -> List[Tuple[TraceNode, int]]:
+        """The operations the root (or `node`) waited on, with the time (ns)
+        each of them was on the critical path, by start time. The times add
+        up to the duration of the root.
+
+        Starting at the end of an operation, the child that finished last is
+        what it waited on. Before that child started, the child that finished
+        last before then, and so on; the gaps between them are the
+        operation's own time on the path. Each child is walked the same way.
+        """
+        node = node if node is not None else self.root
+        if node is None:
+            return []
+        critical_ns: Dict[int, int] = {}
+        on_path: Dict[int, TraceNode] = {}
+        # (node, window start, window end), iterative, as trees may be deep
+        stack = [(node, node.start_ns, node.end_ns)]
+        while stack:
+            current, window_start, window_end = stack.pop()
+            cursor = window_end
+            own_ns = 0
+            for child in sorted(current.children, key=_end_ns, reverse=True):
+                if cursor <= window_start:
+                    break
+                child_end = min(child.end_ns, cursor)
+                child_start = max(child.start_ns, window_start)
+                if child_end <= child_start:
+                    continue
+                own_ns += cursor - child_end
+                stack.append((child, child_start, child_end))
+                cursor = child_start
+            own_ns += max(cursor - window_start, 0)
+            key = id(current)
+            on_path[key] = current
+            critical_ns[key] = critical_ns.get(key, 0) + own_ns
+        path = [(on_path[key], ns) for key, ns in critical_ns.items()]
+        path.sort(key=lambda item: item[0].start_ns)
+        return path
+
+    def __repr__(self):  # pragma: no cover
+        return f"<TraceTree correlation_id={self.correlation_id} size={self.size}>"
+
+
+def _start_ns(node: TraceNode) -> int:
+    return node.start_ns
+
+
+def _end_ns(node: TraceNode) -> int:
+    return node.end_ns
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional
+
+from oplog.readers.operation_record import OperationRecord
+from oplog.traces.trace_tree import TraceTree
+
+
+class TraceTreeBuilder:
+    def __init__(self,
+                 max_pending_trees: int = 10_000,
+                 max_pending_records: int = 1_000_000) -> None:
+        """Rebuilds trace trees out of a stream of operation records (e.g., an
+        `oplog.readers` reader), grouped by correlation id, in bounded memory.
+
+        Operations are logged when they finish, so a root operation is logged
+        after its descendants: a tree is complete, and released, once its
+        root (an operation without a `parent_id`) is added. Operations that
+        finish after their root (e.g., of detached threads) start a new tree,
+        that remains incomplete.
+
+        :param max_pending_trees: Optional. Maximum number of trees waiting
+        for their root. Beyond it, the least recently updated tree is evicted,
+        as an incomplete tree.
+        :param max_pending_records: Optional. Maximum number of records held,
+        in all the pending trees. Beyond it, trees are evicted as well.
+        """
+        if max_pending_trees < 1:
+            raise ValueError(f"max_pending_trees must be positive, but got {max_pending_trees}")
+        if max_pending_records < 1:
+            raise ValueError(f"max_pending_records must be positive, but got {max_pending_records}")
+        self.max_pending_trees = max_pending_trees
+        self.max_pending_records = max_pending_records
+        # counters
+        self.completed_trees = 0
+        self.evicted_trees = 0
+        self.pending_records = 0
+        # correlation id -> records, least recently updated first
+        self._pending: "OrderedDict[Optional[str], List[OperationRecord]]" = OrderedDict()
+
+    @property
+    def pending_trees(self) -> int:
+        return len(self._pending)
+
+    def add(self, record: OperationRecord) -> List[TraceTree]:
+        """Adds a record. Returns the trees it completed or evicted."""
+        trees = []
+        correlation_id = record.correlation_id
+        pending = self._pending
+        records = pending.get(correlation_id)
+        if record.parent_id is None:
+            if records is not None:
+                del pending[correlation_id]
+                self.pending_records -= len(records)
+                records.append(record)
+            else:
+                records = [record]
+            self.completed_trees += 1
+            trees.append(TraceTree(correlation_id, records))
+            return trees
+
+        if records is None:
+            records = pending[correlation_id] = []
+        else:
+            pending.move_to_end(correlation_id)
+        records.append(record)
+        self.pending_records += 1
+        while len(pending) > self.max_pending_trees or self.pending_records > self.max_pending_records:
+            trees.append(self._evict())
+        return trees
+
+    def _evict(self) -> TraceTree:
+        correlation_id, records = self._pending.popitem(last=False)
+        self.pending_records -= len(records)
+        self.evicted_trees += 1
+        return TraceTree(correlation_id, records, complete=False)
+
+    def flush(self) -> List[TraceTree]:
+        """Releases all the pending trees, as incomplete trees."""
+        return [self._evict() for _ in range(len(self._pending))]
+
+    def build(self, records: Iterable[OperationRecord]) -> Iterator[TraceTree]:
+        """Adds all the records, and yields the trees, completed or not."""
+        add = self.add
+        for record in records:
+            trees = add(record)
+            if trees:
+                yield from trees
+        yield from self.flush()
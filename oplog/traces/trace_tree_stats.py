@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from oplog.latency_histogram import LatencyHistogram
+from oplog.traces.trace_tree import TraceTree
+
+
+class TraceTreeStats:
+    """Rollup of the (complete) trace trees of a root operation name: the
+    root durations, fan-out, and the self time and critical path time of
+    every operation name in them. Mergeable, as `oplog.operation_stats.OperationStats`."""
+
+    __slots__ = ("name", "tree_count", "node_count", "max_fan_out", "fan_out_total",
+                 "parent_count", "histogram", "self_time_ns", "critical_time_ns")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.tree_count = 0
+        self.node_count = 0
+        self.max_fan_out = 0
+        # children of operations that have any, to average the fan-out
+        self.fan_out_total = 0
+        self.parent_count = 0
+        # root durations
+        self.histogram = LatencyHistogram()
+        # operation name -> total ns
+        self.self_time_ns: Dict[str, int] = {}
+        self.critical_time_ns: Dict[str, int] = {}
+
+    def add(self, tree: TraceTree) -> None:
+        root = tree.root
+        if root is None:
+            raise ValueError("trees without a root are not aggregated")
+        self.tree_count += 1
+        self.node_count += tree.size
+        self.histogram.record(root.duration_ns)
+        self_time_ns = self.self_time_ns
+        for node in tree.nodes:
+            fan_out = node.fan_out
+            if fan_out:
+                self.parent_count += 1
+                self.fan_out_total += fan_out
+                if fan_out > self.max_fan_out:
+                    self.max_fan_out = fan_out
+            self_time_ns[node.name] = self_time_ns.get(node.name, 0) + node.self_time_ns
+        critical_time_ns = self.critical_time_ns
+        for node, ns in tree.critical_path(root):
+            critical_time_ns[node.name] = critical_time_ns.get(node.name, 0) + ns
+
+    def merge(self, other: "TraceTreeStats") -> None:
+        self.tree_count += other.tree_count
+        self.node_count += other.node_count
+        self.max_fan_out = max(self.max_fan_out, other.max_fan_out)
+        self.fan_out_total += other.fan_out_total
+        self.parent_count += other.parent_count
+        self.histogram.merge(other.histogram)
+        for mine, theirs in ((self.self_time_ns, other.self_time_ns),
+                             (self.critical_time_ns, other.critical_time_ns)):
+            for name, ns in theirs.items():
+                mine[name] = mine.get(name, 0) + ns
+
+    @property
+    def mean_fan_out(self) -> float:
+        """The mean number of children, of operations that have children."""
+        return self.fan_out_total / self.parent_count if self.parent_count else 0.0
+
+    def critical_path_shares(self, top: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Operation names by their share (0-1) of the root durations spent
+        on them on the critical path, largest first."""
+        total_ns = self.histogram.total
+        shares = sorted(
+            ((name, ns / total_ns if total_ns else 0.0) for name, ns in self.critical_time_ns.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return shares[:top] if top is not None else shares
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "tree_count": self.tree_count,
+            "node_count": self.node_count,
+            "max_fan_out": self.max_fan_out,
+            "mean_fan_out": self.mean_fan_out,
+            "p50_ns": self.histogram.percentile(50),
+            "p99_ns": self.histogram.percentile(99),
+            "self_time_ns": dict(self.self_time_ns),
+            "critical_time_ns": dict(self.critical_time_ns),
+        }
+
+    def __repr__(self):  # pragma: no cover
+        return f"<TraceTreeStats name={self.name} tree_count={self.tree_count}>"
+
+
+def aggregate(trees: Iterable[TraceTree]) -> Dict[str, TraceTreeStats]:
+    """Rolls up complete trees per root operation name. Incomplete trees are skipped."""
+    stats: Dict[str, TraceTreeStats] = {}
+    for tree in trees:
+        root = tree.root
+        if not tree.complete or root is None:
+            continue
+        root_stats = stats.get(root.name)
+        if root_stats is None:
+            root_stats = stats[root.name] = TraceTreeStats(root.name)
+        root_stats.add(tree)
+    return stats